@@ -22,6 +22,7 @@ async def guide_search_patterns() -> List[Message]:
 ## Available Search Tools
 
 - **search_query**: General search with Elasticsearch syntax
+- **search_query_with_cursor**: Walk large result sets page by page with a cursor
 - **search_by_id**: Find specific records by ID
 - **search_by_kind**: Find all records of specific type
 
@@ -99,6 +100,14 @@ search_query(
 )
 ```
 
+### Return Only the Fields You Need
+```python
+search_by_kind(
+    kind="*:osdu:wellbore:*",
+    returned_fields=["data.FacilityName", "data.SpatialLocation"]
+)
+```
+
 ### Find Recent Records
 ```python
 search_query(
@@ -1,7 +1,27 @@
 """MCP server instance for OSDU platform integration."""
 
+import asyncio
+import signal
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
 from mcp.server.fastmcp import FastMCP
 
+from .shared.auth_handler import get_auth_handler, reset_auth_handler
+from .shared.config_manager import (
+    ConfigManager,
+    get_config,
+    reload_config,
+    reset_config,
+)
+from .shared.exceptions import OSMCPAuthError, OSMCPConfigError
+from .shared.logging_manager import get_logger
+from .shared.record_cache import reset_record_cache
+from .shared.schema_cache import reset_schema_cache
+from .shared.schema_index import refresh_schema_index_periodically
+from .shared.service_guard import reset_service_guards
+from .shared.session_registry import get_session_registry
+
 from .tools.entitlements import (
     entitlements_mine,
 )
@@ -32,15 +52,20 @@ from .tools.schema import (
 )
 from .tools.search import (
     search_query,
+    search_query_with_cursor,
     search_by_id,
     search_by_kind,
 )
 from .tools.storage import (
     storage_create_update_records,
     storage_delete_record,
+    storage_export_ndjson,
+    storage_export_parquet,
     storage_fetch_records,
     storage_get_record,
+    storage_get_record_history,
     storage_get_record_version,
+    storage_ingest_ndjson,
     storage_list_record_versions,
     storage_purge_record,
     storage_query_records_by_kind,
@@ -48,8 +73,117 @@ from .tools.storage import (
 from .prompts import list_mcp_assets, guide_search_patterns, guide_record_lifecycle
 from .resources import get_workflow_resources
 
+logger = get_logger(__name__)
+
+DEFAULT_CONFIG_WATCH_INTERVAL = 30
+
+
+async def _watch_config_file(config: ConfigManager, interval: float) -> None:
+    """Reload configuration whenever the YAML file's modification time changes.
+
+    Args:
+        config: Shared configuration manager
+        interval: Seconds between modification time checks
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if config.reload_if_changed():
+                reset_service_guards()
+        except OSMCPConfigError as e:
+            logger.error(f"Configuration reload failed, keeping previous values: {e}")
+
+
+def _reload_config() -> None:
+    """Reload the shared configuration and rebuild the service guards.
+
+    Guards copy their circuit breaker and concurrency settings when they are
+    created, so they are rebuilt to pick up the new values. The shared
+    authentication handler is kept: credential changes need a restart.
+    """
+    if reload_config():
+        reset_service_guards()
+
+
+def _install_reload_signal(loop: asyncio.AbstractEventLoop) -> bool:
+    """Reload configuration on SIGHUP where the platform supports it.
+
+    Args:
+        loop: Running event loop
+
+    Returns:
+        True if the signal handler was installed
+    """
+    if not hasattr(signal, "SIGHUP"):
+        return False
+    try:
+        loop.add_signal_handler(signal.SIGHUP, _reload_config)
+    except (NotImplementedError, RuntimeError, ValueError):
+        # Not the main thread, or an event loop without signal support
+        return False
+    return True
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Manage process-wide resources for the lifetime of the server.
+
+    Args:
+        server: FastMCP server instance
+    """
+    config = get_config()
+    registry = get_session_registry()
+    registry.start(config)
+
+    loop = asyncio.get_running_loop()
+    reload_signal = _install_reload_signal(loop)
+    watch_interval = float(
+        config.get("server", "config_watch_interval", DEFAULT_CONFIG_WATCH_INTERVAL)
+        or 0
+    )
+    watch_task = (
+        asyncio.create_task(_watch_config_file(config, watch_interval))
+        if watch_interval > 0
+        else None
+    )
+    index_interval = float(config.get("schema", "index_refresh_interval", 0) or 0)
+    index_task = (
+        asyncio.create_task(refresh_schema_index_periodically(index_interval))
+        if index_interval > 0
+        else None
+    )
+
+    auth_handler = None
+    if config.get("auth", "background_refresh", True):
+        try:
+            auth_handler = get_auth_handler(config)
+            auth_handler.start_background_refresh()
+        except OSMCPAuthError as e:
+            # Surface credential problems on first tool call, not at startup
+            logger.warning(f"Background token renewal not started: {e}")
+
+    try:
+        yield
+    finally:
+        for task in (watch_task, index_task):
+            if task:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        if reload_signal:
+            loop.remove_signal_handler(signal.SIGHUP)
+        if auth_handler:
+            await auth_handler.stop_background_refresh()
+        await registry.close()
+        reset_schema_cache()
+        reset_record_cache()
+        reset_service_guards()
+        reset_auth_handler()
+        reset_config()
+
+
 # Create FastMCP server instance
-mcp = FastMCP("OSDU MCP Server")
+mcp = FastMCP("OSDU MCP Server", lifespan=server_lifespan)
 
 # Register MCP resources
 for resource in get_workflow_resources():
@@ -92,6 +226,7 @@ mcp.tool()(schema_update)  # type: ignore[arg-type]
 
 # Register search tools
 mcp.tool()(search_query)  # type: ignore[arg-type]
+mcp.tool()(search_query_with_cursor)  # type: ignore[arg-type]
 mcp.tool()(search_by_id)  # type: ignore[arg-type]
 mcp.tool()(search_by_kind)  # type: ignore[arg-type]
 
@@ -100,8 +235,12 @@ mcp.tool()(storage_create_update_records)  # type: ignore[arg-type]
 mcp.tool()(storage_get_record)  # type: ignore[arg-type]
 mcp.tool()(storage_get_record_version)  # type: ignore[arg-type]
 mcp.tool()(storage_list_record_versions)  # type: ignore[arg-type]
+mcp.tool()(storage_get_record_history)  # type: ignore[arg-type]
 mcp.tool()(storage_query_records_by_kind)  # type: ignore[arg-type]
 mcp.tool()(storage_fetch_records)  # type: ignore[arg-type]
+mcp.tool()(storage_ingest_ndjson)  # type: ignore[arg-type]
+mcp.tool()(storage_export_ndjson)  # type: ignore[arg-type]
+mcp.tool()(storage_export_parquet)  # type: ignore[arg-type]
 mcp.tool()(storage_delete_record)  # type: ignore[arg-type]
 mcp.tool()(storage_purge_record)  # type: ignore[arg-type]
 
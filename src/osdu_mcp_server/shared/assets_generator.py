@@ -88,17 +88,22 @@ OSDU platform integration and data management functions:
 • **schema_update** (id, schema, status) - Update an existing schema (write-protected)
 
 ### Search Service
-• **search_query** (query, kind, limit, offset) - Execute search queries using Elasticsearch syntax
-• **search_by_id** (id, limit) - Find specific records by ID
-• **search_by_kind** (kind, limit, offset) - Find all records of specific type
+• **search_query** (query, kind, limit, offset, returned_fields) - Execute search queries using Elasticsearch syntax
+• **search_query_with_cursor** (query, kind, limit, cursor, returned_fields) - Page through large result sets with a continuation cursor
+• **search_by_id** (id, limit, returned_fields) - Find specific records by ID
+• **search_by_kind** (kind, limit, offset, returned_fields) - Find all records of specific type
 
 ### Storage Service
-• **storage_create_update_records** (records, skip_dupes) - Create or update records (write-protected)
+• **storage_create_update_records** (records, skip_dupes, bulk) - Create or update records, in concurrent batches for bulk loads (write-protected)
 • **storage_get_record** (id, attributes) - Get latest version of a record by ID
 • **storage_get_record_version** (id, version, attributes) - Get specific version of a record
 • **storage_list_record_versions** (id) - List all versions of a record
-• **storage_query_records_by_kind** (kind, limit, cursor) - Get record IDs of a specific kind
+• **storage_get_record_history** (id, as_patches) - Get every version of a record in one call, optionally as JSON Patch diffs
+• **storage_query_records_by_kind** (kind, limit, cursor, enumerate_all, max_count, time_budget_seconds) - Get record IDs of a specific kind, optionally enumerating every page
 • **storage_fetch_records** (records, attributes) - Retrieve multiple records at once
+• **storage_ingest_ndjson** (file_path, skip_dupes) - Bulk load records from a local NDJSON file (write-protected)
+• **storage_export_ndjson** (kind, file_path, query, max_count, overwrite) - Export a kind or search result set to a local NDJSON file
+• **storage_export_parquet** (kind, file_path, query, max_count, overwrite) - Export a kind or search result set to a local Parquet/Arrow file with flattened data columns
 • **storage_delete_record** (id) - Logically delete a record (delete-protected)
 • **storage_purge_record** (id, confirm) - Permanently delete a record (delete-protected)"""
 
@@ -7,13 +7,22 @@ Supports:
 - Azure: DefaultAzureCredential (native SDK)
 - AWS: boto3 SDK credentials
 - GCP: Application Default Credentials
-- Generic: Manual OAuth Bearer token via OSDU_MCP_USER_TOKEN
+- Generic: Manual OAuth Bearer token via OSDU_MCP_USER_TOKEN or a token
+  file named by OSDU_MCP_USER_TOKEN_FILE (re-read when the file changes)
+
+A single process-wide handler is shared by all tools (see get_auth_handler),
+so the mode is detected once and tokens stay cached across tool calls.
 """
 
 import asyncio
+import contextlib
 import os
-from datetime import datetime, timedelta
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 import jwt
@@ -21,9 +30,10 @@ from azure.core.credentials import AccessToken
 from azure.core.exceptions import ClientAuthenticationError
 from azure.identity import DefaultAzureCredential
 
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, get_config
 from .exceptions import OSMCPAuthError
 from .logging_manager import get_logger
+from .token_exchange import CognitoClientCredentialsExchange, TokenExchange
 
 logger = get_logger(__name__)
 
@@ -36,6 +46,75 @@ DEFAULT_GCP_SCOPES = [
     "https://www.googleapis.com/auth/userinfo.email",
 ]
 
+# Tokens are refreshed this many seconds before they expire
+DEFAULT_REFRESH_MARGIN = 300
+
+# Lifetime requested for STS session tokens
+DEFAULT_AWS_SESSION_DURATION = 3600
+
+# Background renewal runs this many seconds before expiry, ahead of the
+# request-path margin so tool calls never wait on token acquisition
+DEFAULT_PROACTIVE_REFRESH_MARGIN = 600
+
+# Lower bound between background renewals, and retry interval when the
+# token expiry is unknown
+BACKGROUND_MIN_INTERVAL = 30
+BACKGROUND_RETRY_INTERVAL = 60
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    """Access token with its absolute expiry as a POSIX timestamp."""
+
+    token: str
+    expires_on: float
+
+    def expires_within(self, seconds: float) -> bool:
+        """Check whether the token expires within the given number of seconds.
+
+        Args:
+            seconds: Refresh margin in seconds
+
+        Returns:
+            True if the token is expired or about to expire
+        """
+        return time.time() >= self.expires_on - seconds
+
+
+@dataclass
+class RefreshMetrics:
+    """Counters for token refreshes performed by one provider."""
+
+    count: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    last_seconds: float = 0.0
+
+    def record(self, duration: float, success: bool) -> None:
+        """Record a completed refresh attempt.
+
+        Args:
+            duration: Refresh duration in seconds
+            success: Whether the refresh succeeded
+        """
+        self.count += 1
+        if not success:
+            self.failures += 1
+        self.total_seconds += duration
+        self.last_seconds = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return metrics as a JSON-serializable dictionary."""
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "total_seconds": round(self.total_seconds, 3),
+            "last_seconds": round(self.last_seconds, 3),
+            "average_seconds": (
+                round(self.total_seconds / self.count, 3) if self.count else 0.0
+            ),
+        }
+
 
 class AuthenticationMode(Enum):
     """Supported authentication modes."""
@@ -61,8 +140,18 @@ class AuthHandler:
         _azure_credential: Azure credential instance
         _azure_cached_token: Cached Azure token
         _aws_session: AWS boto3 session
+        _aws_cached_token: Cached AWS session token
+        _aws_sts_client: Reused boto3 STS client
+        _aws_token_exchange: Optional token exchange used instead of STS
         _gcp_credentials: GCP credentials instance
         _gcp_project: GCP project ID
+        _user_token: Last validated user token
+        _user_token_claims: Decoded claims of the last validated user token
+        _refresh_margin: Seconds before expiry at which tokens are refreshed
+        _proactive_refresh_margin: Seconds before expiry for background renewal
+        _inflight_refreshes: In-flight refresh per scope, shared by all waiters
+        _refresh_metrics: Refresh counters per provider
+        _background_task: Background token renewal task
     """
 
     def __init__(self, config: ConfigManager):
@@ -72,6 +161,20 @@ class AuthHandler:
             config: Configuration manager instance
         """
         self.config = config
+        self._refresh_margin = float(
+            config.get("auth", "refresh_margin", DEFAULT_REFRESH_MARGIN) or 0
+        )
+        self._proactive_refresh_margin = float(
+            config.get(
+                "auth", "proactive_refresh_margin", DEFAULT_PROACTIVE_REFRESH_MARGIN
+            )
+            or 0
+        )
+
+        # Single-flight refresh state and metrics
+        self._inflight_refreshes: dict[str, asyncio.Future[str]] = {}
+        self._refresh_metrics: dict[str, RefreshMetrics] = {}
+        self._background_task: asyncio.Task[None] | None = None
 
         # Azure credentials
         self._azure_credential: DefaultAzureCredential | None = None
@@ -79,11 +182,25 @@ class AuthHandler:
 
         # AWS credentials
         self._aws_session: Any = None
+        self._aws_cached_token: CachedToken | None = None
+        self._aws_sts_client: Any = None
+        self._aws_token_exchange: TokenExchange | None = None
+        self._aws_session_duration = int(
+            config.get("auth", "aws_session_duration", DEFAULT_AWS_SESSION_DURATION)
+            or DEFAULT_AWS_SESSION_DURATION
+        )
 
         # GCP credentials
         self._gcp_credentials: Any = None
         self._gcp_project: str | None = None
 
+        # User token (claims are decoded once per distinct token)
+        self._user_token: str | None = None
+        self._user_token_claims: dict[str, Any] = {}
+        self._user_token_expiry_warned = False
+        self._user_token_file_mtime: int | None = None
+        self._user_token_file_value: str | None = None
+
         # Detect mode and initialize
         self.mode = self._detect_authentication_mode()
         self._initialize_credential()
@@ -92,7 +209,7 @@ class AuthHandler:
         """Auto-detect authentication mode with simple priority order.
 
         Priority Order (no overrides, just precedence):
-        1. OSDU_MCP_USER_TOKEN (manual token - always highest)
+        1. OSDU_MCP_USER_TOKEN or OSDU_MCP_USER_TOKEN_FILE (manual token - always highest)
         2. Azure credentials (AZURE_CLIENT_ID or AZURE_TENANT_ID)
         3. AWS explicit (AWS_ACCESS_KEY_ID or AWS_PROFILE)
         4. GCP explicit (GOOGLE_APPLICATION_CREDENTIALS)
@@ -107,7 +224,9 @@ class AuthHandler:
             OSMCPAuthError: If no authentication credentials found
         """
         # Priority 1: User token ALWAYS takes precedence
-        if os.environ.get("OSDU_MCP_USER_TOKEN"):
+        if os.environ.get("OSDU_MCP_USER_TOKEN") or os.environ.get(
+            "OSDU_MCP_USER_TOKEN_FILE"
+        ):
             logger.info("Authentication mode: USER_TOKEN (manual Bearer token)")
             return AuthenticationMode.USER_TOKEN
 
@@ -214,9 +333,21 @@ class AuthHandler:
         3. EC2/ECS instance metadata
         4. AWS SSO
 
+        If Cognito client credentials are configured (see token_exchange),
+        tokens are obtained from Cognito and no boto3 session is needed.
+
         Raises:
             OSMCPAuthError: If no AWS credentials found
         """
+        exchange = CognitoClientCredentialsExchange.from_environment()
+        if exchange:
+            self._aws_token_exchange = exchange
+            logger.info(
+                "Initialized AWS Cognito client-credentials token exchange",
+                extra={"token_url": exchange.token_url},
+            )
+            return
+
         try:
             import boto3
             from botocore.exceptions import NoCredentialsError, ProfileNotFound
@@ -229,9 +360,10 @@ class AuthHandler:
             if not credentials:
                 raise NoCredentialsError()
 
-            # Get AWS account/region info for logging
-            sts = self._aws_session.client("sts")
-            identity = sts.get_caller_identity()
+            # Get AWS account/region info for logging; the STS client is
+            # reused for every session token request
+            self._aws_sts_client = self._aws_session.client("sts")
+            identity = self._aws_sts_client.get_caller_identity()
 
             logger.info(
                 f"Initialized AWS credentials for account: {identity['Account']}, "
@@ -309,9 +441,12 @@ class AuthHandler:
                 "Install with: pip install google-auth"
             )
 
-    async def get_access_token(self) -> str:
+    async def get_access_token(self, force_refresh: bool = False) -> str:
         """Get token from detected provider.
 
+        Args:
+            force_refresh: Renew the token even if the cached one is still valid
+
         Returns:
             Raw access token string (without "Bearer " prefix).
             Caller adds "Bearer " when constructing Authorization header.
@@ -322,16 +457,164 @@ class AuthHandler:
         if self.mode == AuthenticationMode.USER_TOKEN:
             return self._get_user_token()
         elif self.mode == AuthenticationMode.AZURE:
-            return await self._get_azure_token()
+            return await self._get_azure_token(force_refresh)
         elif self.mode == AuthenticationMode.AWS:
-            return await self._get_aws_token()
+            return await self._get_aws_token(force_refresh)
         elif self.mode == AuthenticationMode.GCP:
-            return await self._get_gcp_token()
+            return await self._get_gcp_token(force_refresh)
 
         raise OSMCPAuthError(f"Unsupported authentication mode: {self.mode}")
 
+    async def _single_flight(
+        self, key: str, refresh: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Run a token refresh once for all concurrent callers of the same scope.
+
+        The first caller starts the refresh; later callers await the same
+        result (or exception). The refresh is shielded so that a cancelled
+        caller does not abort it for the others.
+
+        Args:
+            key: Refresh scope key
+            refresh: Coroutine function performing the refresh
+
+        Returns:
+            Refreshed token string
+        """
+        future = self._inflight_refreshes.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._timed_refresh(refresh))
+            self._inflight_refreshes[key] = future
+            future.add_done_callback(lambda _: self._inflight_refreshes.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _timed_refresh(self, refresh: Callable[[], Awaitable[str]]) -> str:
+        """Run a refresh and record its duration in the provider metrics.
+
+        Args:
+            refresh: Coroutine function performing the refresh
+
+        Returns:
+            Refreshed token string
+        """
+        metrics = self._refresh_metrics.setdefault(self.mode.value, RefreshMetrics())
+        start = time.perf_counter()
+        success = False
+        try:
+            token = await refresh()
+            success = True
+            return token
+        finally:
+            duration = time.perf_counter() - start
+            metrics.record(duration, success)
+            logger.info(
+                f"Token refresh for {self.mode.value} "
+                f"{'succeeded' if success else 'failed'} in {duration:.3f}s",
+                extra={
+                    "auth_mode": self.mode.value,
+                    "refresh_seconds": duration,
+                    "refresh_success": success,
+                    "refresh_count": metrics.count,
+                },
+            )
+
+    def get_refresh_metrics(self) -> dict[str, dict[str, Any]]:
+        """Get token refresh counts and durations per provider.
+
+        Returns:
+            Dictionary mapping provider name to refresh metrics
+        """
+        return {
+            mode: metrics.as_dict() for mode, metrics in self._refresh_metrics.items()
+        }
+
+    def start_background_refresh(self) -> None:
+        """Start renewing tokens in the background ahead of expiry.
+
+        Manual user tokens cannot be renewed, so nothing is started in
+        USER_TOKEN mode. Calling this while a task is running is a no-op.
+        """
+        if self.mode == AuthenticationMode.USER_TOKEN:
+            return
+        if self._background_task and not self._background_task.done():
+            return
+
+        self._background_task = asyncio.create_task(self._background_refresh_loop())
+        logger.info(
+            "Background token renewal started",
+            extra={
+                "auth_mode": self.mode.value,
+                "proactive_refresh_margin": self._proactive_refresh_margin,
+            },
+        )
+
+    async def stop_background_refresh(self) -> None:
+        """Stop the background token renewal task if it is running."""
+        task = self._background_task
+        self._background_task = None
+        if task and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _background_refresh_loop(self) -> None:
+        """Acquire a token, then keep renewing it before it expires.
+
+        MSAL and google-auth may return the same cached token when asked to
+        renew it early. While a renewal leaves the expiry unchanged, the wait
+        before the next attempt doubles, up to the point where the request
+        path would refresh the token itself.
+        """
+        force_refresh = False
+        previous_expires_on: float | None = None
+        backoff: float = BACKGROUND_MIN_INTERVAL
+        while True:
+            try:
+                await self.get_access_token(force_refresh=force_refresh)
+            except OSMCPAuthError as e:
+                logger.warning(f"Background token renewal failed: {e}")
+
+            expires_on = self._token_expires_on()
+            if expires_on is None:
+                delay: float = BACKGROUND_RETRY_INTERVAL
+                force_refresh = False
+            else:
+                if force_refresh and expires_on == previous_expires_on:
+                    backoff *= 2
+                else:
+                    backoff = BACKGROUND_MIN_INTERVAL
+                remaining = expires_on - time.time()
+                delay = max(
+                    remaining - self._proactive_refresh_margin,
+                    min(backoff, remaining - self._refresh_margin),
+                    BACKGROUND_MIN_INTERVAL,
+                )
+                force_refresh = True
+            previous_expires_on = expires_on
+
+            await asyncio.sleep(delay)
+
+    def _token_expires_on(self) -> float | None:
+        """Get the expiry of the current cached token as a POSIX timestamp.
+
+        Returns:
+            Expiry timestamp, or None if there is no token or it is unknown
+        """
+        if self.mode == AuthenticationMode.AZURE and self._azure_cached_token:
+            return float(self._azure_cached_token.expires_on)
+        if self.mode == AuthenticationMode.AWS and self._aws_cached_token:
+            return self._aws_cached_token.expires_on
+        if self.mode == AuthenticationMode.GCP and self._gcp_credentials:
+            expiry = getattr(self._gcp_credentials, "expiry", None)
+            if isinstance(expiry, datetime):
+                return expiry.replace(tzinfo=UTC).timestamp()
+        return None
+
     def _get_user_token(self) -> str:
-        """Get and validate user token from environment.
+        """Get and validate user token from environment or token file.
+
+        The JWT is decoded only when the token changes; subsequent calls check
+        expiry against the cached ``exp`` claim.
 
         Returns:
             OAuth Bearer token string (without "Bearer " prefix)
@@ -339,16 +622,57 @@ class AuthHandler:
         Raises:
             OSMCPAuthError: If token not set or invalid
         """
-        token = os.environ.get("OSDU_MCP_USER_TOKEN")
+        token = self._read_user_token()
         if not token:
-            raise OSMCPAuthError("USER_TOKEN mode but OSDU_MCP_USER_TOKEN not set")
+            raise OSMCPAuthError(
+                "USER_TOKEN mode but OSDU_MCP_USER_TOKEN not set "
+                "(or OSDU_MCP_USER_TOKEN_FILE is empty)"
+            )
 
-        # Validate JWT format
-        self._validate_jwt_token(token)
+        if token != self._user_token:
+            # Validate JWT format once per distinct token
+            self._user_token_expiry_warned = False
+            claims = self._validate_jwt_token(token)
+            self._user_token = token
+            self._user_token_claims = claims
+            logger.info("User token validation passed")
+        else:
+            self._check_user_token_expiry(self._user_token_claims)
 
         return token  # Return raw token, "Bearer " added by client
 
-    def _validate_jwt_token(self, token: str) -> None:
+    def _read_user_token(self) -> str | None:
+        """Read the user token, preferring OSDU_MCP_USER_TOKEN over the file.
+
+        The token file is re-read only when its modification time changes, so
+        rotated tokens are picked up without restarting the server.
+
+        Returns:
+            Token string, or None if neither source is set
+
+        Raises:
+            OSMCPAuthError: If the token file cannot be read
+        """
+        token = os.environ.get("OSDU_MCP_USER_TOKEN")
+        if token:
+            return token
+
+        token_file = os.environ.get("OSDU_MCP_USER_TOKEN_FILE")
+        if not token_file:
+            return None
+
+        try:
+            mtime = os.stat(token_file).st_mtime_ns
+            if mtime != self._user_token_file_mtime:
+                self._user_token_file_value = Path(token_file).read_text().strip()
+                self._user_token_file_mtime = mtime
+                logger.info("User token loaded from OSDU_MCP_USER_TOKEN_FILE")
+        except OSError as e:
+            raise OSMCPAuthError(f"Failed to read OSDU_MCP_USER_TOKEN_FILE: {e}")
+
+        return self._user_token_file_value
+
+    def _validate_jwt_token(self, token: str) -> dict[str, Any]:
         """Validate JWT token format and expiration.
 
         Security checks:
@@ -364,6 +688,9 @@ class AuthHandler:
         Args:
             token: JWT token to validate
 
+        Returns:
+            Decoded token claims
+
         Raises:
             OSMCPAuthError: If token invalid or expired
         """
@@ -377,30 +704,40 @@ class AuthHandler:
                     "verify_aud": False,  # OSDU platform validates
                 },
             )
+        except jwt.DecodeError as e:
+            raise OSMCPAuthError(f"Invalid JWT token format: {e}")
 
-            # Check expiration if present
-            if "exp" in payload:
-                import time as time_module
+        self._check_user_token_expiry(payload)
+        return payload
 
-                exp_timestamp = payload["exp"]
-                now_timestamp = time_module.time()
+    def _check_user_token_expiry(self, claims: dict[str, Any]) -> None:
+        """Check the ``exp`` claim of a user token.
 
-                if now_timestamp > exp_timestamp:
-                    raise OSMCPAuthError("Token has expired")
+        Args:
+            claims: Decoded token claims
 
-                # Warn if expiring soon (< 5 minutes)
-                time_remaining = exp_timestamp - now_timestamp
-                if time_remaining < 300:
-                    logger.warning(f"Token expires in {time_remaining:.0f} seconds")
+        Raises:
+            OSMCPAuthError: If the token has expired
+        """
+        # Check expiration if present
+        if "exp" not in claims:
+            return
 
-            logger.info("User token validation passed")
+        time_remaining = claims["exp"] - time.time()
+        if time_remaining < 0:
+            raise OSMCPAuthError("Token has expired")
 
-        except jwt.DecodeError as e:
-            raise OSMCPAuthError(f"Invalid JWT token format: {e}")
+        # Warn once per token if expiring soon (< 5 minutes)
+        if time_remaining < 300 and not self._user_token_expiry_warned:
+            self._user_token_expiry_warned = True
+            logger.warning(f"Token expires in {time_remaining:.0f} seconds")
 
-    async def _get_azure_token(self) -> str:
+    async def _get_azure_token(self, force_refresh: bool = False) -> str:
         """Get Azure access token with automatic refresh.
 
+        Args:
+            force_refresh: Renew the token even if the cached one is still valid
+
         Returns:
             Valid Azure access token
 
@@ -409,7 +746,7 @@ class AuthHandler:
         """
         try:
             # Check if we have a cached token that's still valid
-            if self._is_azure_token_valid():
+            if not force_refresh and self._is_azure_token_valid():
                 return self._azure_cached_token.token
 
             # Get client ID from standard Azure environment variable
@@ -426,10 +763,10 @@ class AuthHandler:
             else:
                 scope = f"{client_id}/.default"
 
-            # Get new token
-            self._azure_cached_token = self._azure_credential.get_token(scope)
-            logger.info("Azure token obtained successfully")
-            return self._azure_cached_token.token
+            # Get new token, shared by all concurrent callers for this scope
+            return await self._single_flight(
+                f"azure:{scope}", lambda: self._refresh_azure_token(scope)
+            )
 
         except ClientAuthenticationError as e:
             # Handle specific authentication errors with user-friendly messages
@@ -481,7 +818,24 @@ class AuthHandler:
                     "Authentication configuration error. Please check your environment setup"
                 )
 
-    async def _get_aws_token(self) -> str:
+    async def _refresh_azure_token(self, scope: str) -> str:
+        """Acquire a new Azure token without blocking the event loop.
+
+        Args:
+            scope: OAuth scope to request
+
+        Returns:
+            New Azure access token
+        """
+        # DefaultAzureCredential.get_token is synchronous (may shell out to az)
+        loop = asyncio.get_running_loop()
+        self._azure_cached_token = await loop.run_in_executor(
+            None, self._azure_credential.get_token, scope
+        )
+        logger.info("Azure token obtained successfully")
+        return self._azure_cached_token.token
+
+    async def _get_aws_token(self, force_refresh: bool = False) -> str:
         """Get AWS token for OSDU authentication.
 
         Note: AWS doesn't use Bearer tokens directly. This method depends
@@ -490,7 +844,15 @@ class AuthHandler:
         - Option 2: STS tokens (for API Gateway with IAM auth)
         - Option 3: Signed requests (AWS Signature V4)
 
-        For now, we use STS session tokens which can be formatted as pseudo-Bearer tokens.
+        Option 1 is used when a token exchange is configured (Cognito client
+        credentials or set_token_exchange); otherwise we use STS session
+        tokens which can be formatted as pseudo-Bearer tokens.
+
+        Either token is cached until it is within the refresh margin of its
+        expiry.
+
+        Args:
+            force_refresh: Renew the token even if the cached one is still valid
 
         Returns:
             Token string appropriate for OSDU on AWS
@@ -498,28 +860,62 @@ class AuthHandler:
         Raises:
             OSMCPAuthError: If token retrieval fails
         """
+        if (
+            not force_refresh
+            and self._aws_cached_token
+            and not self._aws_cached_token.expires_within(self._refresh_margin)
+        ):
+            return self._aws_cached_token.token
+
         try:
-            # Option 2: Get STS session token (for IAM-based auth)
-            sts = self._aws_session.client("sts")
+            return await self._single_flight("aws", self._refresh_aws_token)
+        except Exception as e:
+            raise OSMCPAuthError(f"AWS token retrieval failed: {e}")
 
-            # Run synchronous boto3 call in executor to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, self._get_aws_session_token, sts
-            )
+    def set_token_exchange(self, exchange: TokenExchange | None) -> None:
+        """Use a custom token exchange for AWS instead of STS session tokens.
 
-            # Return session token (OSDU would need to accept this)
-            credentials = response["Credentials"]
+        Args:
+            exchange: Token exchange hook, or None to fall back to STS
+        """
+        self._aws_token_exchange = exchange
+        self._aws_cached_token = None
 
-            # Format as a pseudo-Bearer token for OSDU
-            # Real implementation depends on OSDU AWS requirements
-            token = credentials["SessionToken"]
+    async def _refresh_aws_token(self) -> str:
+        """Request a new token from the token exchange or STS.
 
-            logger.info("AWS session token obtained successfully")
+        Returns:
+            New AWS token
+        """
+        # Option 1: Deployment-specific exchange (e.g. Cognito)
+        if self._aws_token_exchange:
+            token, expires_on = await self._aws_token_exchange.exchange()
+            self._aws_cached_token = CachedToken(token, expires_on)
             return token
 
-        except Exception as e:
-            raise OSMCPAuthError(f"AWS token retrieval failed: {e}")
+        # Option 2: Get STS session token (for IAM-based auth)
+        if self._aws_sts_client is None:
+            self._aws_sts_client = self._aws_session.client("sts")
+
+        # Run synchronous boto3 call in executor to avoid blocking event loop
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            None, self._get_aws_session_token, self._aws_sts_client
+        )
+
+        # Return session token (OSDU would need to accept this)
+        credentials = response["Credentials"]
+
+        # Format as a pseudo-Bearer token for OSDU
+        # Real implementation depends on OSDU AWS requirements
+        token = credentials["SessionToken"]
+
+        expiration = credentials.get("Expiration")
+        if isinstance(expiration, datetime):
+            self._aws_cached_token = CachedToken(token, expiration.timestamp())
+
+        logger.info("AWS session token obtained successfully")
+        return token
 
     def _get_aws_session_token(self, sts_client) -> dict:
         """Get AWS STS session token (synchronous helper for executor).
@@ -530,11 +926,14 @@ class AuthHandler:
         Returns:
             STS GetSessionToken response
         """
-        return sts_client.get_session_token(DurationSeconds=3600)
+        return sts_client.get_session_token(DurationSeconds=self._aws_session_duration)
 
-    async def _get_gcp_token(self) -> str:
+    async def _get_gcp_token(self, force_refresh: bool = False) -> str:
         """Get GCP access token with automatic refresh.
 
+        Args:
+            force_refresh: Renew the token even if the current one is still valid
+
         Returns:
             Valid GCP access token string
 
@@ -543,21 +942,11 @@ class AuthHandler:
         """
         try:
             from google.auth.exceptions import RefreshError
-            from google.auth.transport.requests import Request
 
             # Check if token needs refresh
-            # GCP credentials have .valid property
-            if not self._gcp_credentials.valid:
+            if force_refresh or not self._is_gcp_token_valid():
                 logger.debug("GCP token invalid/expired, refreshing...")
-
-                # Refresh token (synchronous operation)
-                # Run in executor to avoid blocking async event loop
-                loop = asyncio.get_event_loop()
-                request = Request()
-
-                await loop.run_in_executor(None, self._gcp_credentials.refresh, request)
-
-                logger.info("GCP token refreshed successfully")
+                await self._single_flight("gcp", self._refresh_gcp_token)
 
             # Return the access token string
             token = self._gcp_credentials.token
@@ -590,6 +979,24 @@ class AuthHandler:
         except Exception as e:
             raise OSMCPAuthError(f"Unexpected GCP authentication error: {e}")
 
+    async def _refresh_gcp_token(self) -> str:
+        """Refresh GCP credentials without blocking the event loop.
+
+        Returns:
+            Refreshed GCP access token
+        """
+        from google.auth.transport.requests import Request
+
+        # Refresh token (synchronous operation)
+        # Run in executor to avoid blocking async event loop
+        loop = asyncio.get_running_loop()
+        request = Request()
+
+        await loop.run_in_executor(None, self._gcp_credentials.refresh, request)
+
+        logger.info("GCP token refreshed successfully")
+        return self._gcp_credentials.token
+
     async def validate_token(self) -> bool:
         """Validate current token.
 
@@ -615,13 +1022,35 @@ class AuthHandler:
         if not self._azure_cached_token:
             return False
 
-        # Add a buffer of 5 minutes before expiration
-        expiry_buffer = timedelta(minutes=5)
+        # Refresh ahead of expiration by the configured margin
+        expiry_buffer = timedelta(seconds=self._refresh_margin)
         token_expiry = datetime.fromtimestamp(self._azure_cached_token.expires_on)
         return datetime.now() < (token_expiry - expiry_buffer)
 
+    def _is_gcp_token_valid(self) -> bool:
+        """Check if the current GCP token is valid outside the refresh margin.
+
+        Returns:
+            True if credentials hold a token that won't expire within the margin
+        """
+        if not self._gcp_credentials.valid:
+            return False
+
+        # google-auth reports expiry as a naive UTC datetime (None if unknown)
+        expiry = getattr(self._gcp_credentials, "expiry", None)
+        if not isinstance(expiry, datetime):
+            return True
+
+        remaining = expiry.replace(tzinfo=UTC) - datetime.now(UTC)
+        return remaining.total_seconds() > self._refresh_margin
+
     def close(self) -> None:
         """Clean up all authentication resources."""
+        # Stop background renewal (use stop_background_refresh to await it)
+        if self._background_task and not self._background_task.done():
+            self._background_task.cancel()
+        self._background_task = None
+
         # Clear Azure resources
         self._azure_cached_token = None
         if self._azure_credential and hasattr(self._azure_credential, "close"):
@@ -629,8 +1058,40 @@ class AuthHandler:
 
         # AWS session doesn't need explicit cleanup
         self._aws_session = None
+        self._aws_cached_token = None
+        self._aws_sts_client = None
 
         # GCP credentials don't need explicit cleanup
         self._gcp_credentials = None
 
         logger.debug("Authentication resources cleaned up")
+
+
+# Process-wide handler shared by all tools
+_shared_handler: AuthHandler | None = None
+
+
+def get_auth_handler(config: ConfigManager | None = None) -> AuthHandler:
+    """Get the process-wide authentication handler.
+
+    The handler is created on first use, so authentication mode detection and
+    credential discovery run once per process instead of once per tool call.
+
+    Args:
+        config: Configuration manager used when the handler is first created
+
+    Returns:
+        Shared authentication handler instance
+    """
+    global _shared_handler
+    if _shared_handler is None:
+        _shared_handler = AuthHandler(config or get_config())
+    return _shared_handler
+
+
+def reset_auth_handler() -> None:
+    """Close and discard the process-wide authentication handler."""
+    global _shared_handler
+    if _shared_handler is not None:
+        _shared_handler.close()
+        _shared_handler = None
@@ -13,6 +13,7 @@ class EntitlementsClient(OsduClient):
         """Initialize EntitlementsClient with service-specific configuration."""
         super().__init__(*args, **kwargs)
         self._base_path = get_service_base_url(OSMCPService.ENTITLEMENTS)
+        self._service = OSMCPService.ENTITLEMENTS
 
     async def get(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Override get to include service base path."""
@@ -16,6 +16,7 @@ class LegalClient(OsduClient):
         """Initialize LegalClient with service-specific configuration."""
         super().__init__(*args, **kwargs)
         self._base_path = get_service_base_url(OSMCPService.LEGAL)
+        self._service = OSMCPService.LEGAL
 
     async def get(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Override get to include service base path."""
@@ -144,7 +145,7 @@ class LegalClient(OsduClient):
         if limit:
             body["limit"] = limit
 
-        return await self.post("/legaltags:query", json=body)
+        return await self.post("/legaltags:query", json=body, idempotent=True)
 
     async def batch_retrieve_legal_tags(self, names: list[str]) -> dict[str, Any]:
         """Retrieve multiple legal tags by name.
@@ -164,7 +165,9 @@ class LegalClient(OsduClient):
         # Ensure all names have partition prefix
         full_names = [self.ensure_full_tag_name(name) for name in names]
 
-        return await self.post("/legaltags:batchRetrieve", json={"names": full_names})
+        return await self.post(
+            "/legaltags:batchRetrieve", json={"names": full_names}, idempotent=True
+        )
 
     async def create_legal_tag(
         self, name: str, description: str, properties: dict[str, Any]
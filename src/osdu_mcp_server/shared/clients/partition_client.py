@@ -24,6 +24,7 @@ class PartitionClient(OsduClient):
         """
         super().__init__(config, auth_handler)
         self._base_path = get_service_base_url(OSMCPService.PARTITION)
+        self._service = OSMCPService.PARTITION
 
     async def list_partitions(self) -> list[str]:
         """List all accessible partitions.
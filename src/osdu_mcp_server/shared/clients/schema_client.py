@@ -1,12 +1,20 @@
 """OSDU Schema service client."""
 
+import asyncio
 import os
+from collections.abc import AsyncIterator
 from typing import Any
 
 from ..exceptions import OSMCPAPIError
 from ..osdu_client import OsduClient
+from ..schema_cache import get_schema_cache
 from ..service_urls import OSMCPService, get_service_base_url
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_LIST_CONCURRENCY = 4
+DEFAULT_MAX_RESULTS = 10000
+
 
 class SchemaClient(OsduClient):
     """Client for OSDU Schema service operations."""
@@ -15,6 +23,7 @@ class SchemaClient(OsduClient):
         """Initialize SchemaClient with service-specific configuration."""
         super().__init__(*args, **kwargs)
         self._base_path = get_service_base_url(OSMCPService.SCHEMA)
+        self._service = OSMCPService.SCHEMA
 
     async def get(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Override get to include service base path."""
@@ -68,6 +77,9 @@ class SchemaClient(OsduClient):
     ) -> dict[str, Any]:
         """List schemas with optional filtering.
 
+        Limits larger than one page are served transparently by fetching the
+        required offset pages concurrently and merging them in order.
+
         Args:
             authority: Filter by authority
             source: Filter by source
@@ -75,7 +87,7 @@ class SchemaClient(OsduClient):
             status: Schema status (DEVELOPMENT, PUBLISHED, OBSOLETE)
             scope: Schema scope (INTERNAL, SHARED)
             latest_version: Only return latest versions
-            limit: Maximum number of results (max 1000)
+            limit: Maximum number of results
             offset: Pagination offset
 
         Returns:
@@ -87,18 +99,186 @@ class SchemaClient(OsduClient):
                 "offset": 0
             }
         """
-        # Initialize parameters list
-        params = []
+        filters = self._filter_params(
+            authority, source, entity, status, scope, latest_version
+        )
+        if limit <= self._page_size():
+            return await self._list_page(filters, limit, offset)
+
+        pages = [
+            item
+            async for item in self._iter_pages(filters, offset, limit, ordered=True)
+        ]
+        schemas = [
+            schema
+            for _, page in pages
+            for schema in page.get("schemaInfos") or page.get("schemas", [])
+        ]
+        first = pages[0][1] if pages else {}
+
+        return {
+            "schemaInfos": schemas,
+            "totalCount": first.get("totalCount", len(schemas)),
+            "count": len(schemas),
+            "offset": offset,
+        }
+
+    async def iter_schema_pages(
+        self,
+        authority: str | None = None,
+        source: str | None = None,
+        entity: str | None = None,
+        status: str | None = "PUBLISHED",
+        scope: str | None = None,
+        latest_version: bool = False,
+        max_results: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Walk every page of a schema listing, fetching pages concurrently.
+
+        The first page is fetched alone to learn totalCount; the remaining
+        offsets are then requested concurrently and yielded as they arrive,
+        so callers can filter while later pages are still in flight.
 
-        # Add pagination parameters
-        params.append(
-            f"limit={min(limit, 1000)}"
-        )  # API limit is 100, but we'll enforce 1000
+        Reads configuration from:
+        - OSDU_MCP_SCHEMA_LIST_PAGE_SIZE: Schemas per request (default: 100)
+        - OSDU_MCP_SCHEMA_LIST_CONCURRENCY: Pages in flight (default: 4)
+        - OSDU_MCP_SCHEMA_LIST_MAX_RESULTS: Default result budget (default: 10000)
+
+        Args:
+            authority: Filter by authority
+            source: Filter by source
+            entity: Filter by entity type
+            status: Schema status
+            scope: Schema scope
+            latest_version: Only return latest versions
+            max_results: Maximum number of schemas to walk
 
+        Yields:
+            Listing responses ("schemaInfos", "totalCount", ...) in completion
+            order
+        """
+        if max_results is None:
+            max_results = int(
+                self.config.get("schema", "list_max_results", DEFAULT_MAX_RESULTS)
+                or DEFAULT_MAX_RESULTS
+            )
+        filters = self._filter_params(
+            authority, source, entity, status, scope, latest_version
+        )
+        async for _, page in self._iter_pages(filters, 0, max_results):
+            yield page
+
+    async def _iter_pages(
+        self,
+        filters: list[str],
+        offset: int,
+        max_results: int,
+        ordered: bool = False,
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """Fetch listing pages from an offset up to totalCount or a budget.
+
+        Args:
+            filters: Query parameters from _filter_params
+            offset: Offset of the first schema to list
+            max_results: Maximum number of schemas to list
+            ordered: Yield pages in offset order instead of completion order
+
+        Yields:
+            Tuples of (page offset, listing response)
+        """
+        page_size = self._page_size()
+        first = await self._list_page(filters, min(page_size, max_results), offset)
+        yield offset, first
+
+        first_count = len(first.get("schemaInfos") or first.get("schemas", []))
+        total = first.get("totalCount")
+        if total is None:
+            # Without totalCount the pages can only be walked one by one
+            next_offset = offset + first_count
+            walked = first_count
+            page_count = first_count
+            while page_count == page_size and walked < max_results:
+                page = await self._list_page(
+                    filters, min(page_size, max_results - walked), next_offset
+                )
+                yield next_offset, page
+                page_count = len(page.get("schemaInfos") or page.get("schemas", []))
+                next_offset += page_count
+                walked += page_count
+            return
+
+        end = min(int(total), offset + max_results)
+        offsets = list(range(offset + page_size, end, page_size))
+        if not offsets:
+            return
+
+        concurrency = int(
+            self.config.get("schema", "list_concurrency", DEFAULT_LIST_CONCURRENCY)
+            or DEFAULT_LIST_CONCURRENCY
+        )
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(page_offset: int) -> tuple[int, dict[str, Any]]:
+            async with semaphore:
+                size = min(page_size, end - page_offset)
+                return page_offset, await self._list_page(filters, size, page_offset)
+
+        tasks = [asyncio.ensure_future(fetch(o)) for o in offsets]
+        try:
+            if ordered:
+                for task in tasks:
+                    yield await task
+            else:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _list_page(
+        self, filters: list[str], limit: int, offset: int
+    ) -> dict[str, Any]:
+        """Request a single page of the schema listing.
+
+        Args:
+            filters: Query parameters from _filter_params
+            limit: Page size (capped at MAX_PAGE_SIZE)
+            offset: Pagination offset
+
+        Returns:
+            Listing response for the page
+        """
+        params = [f"limit={min(limit, MAX_PAGE_SIZE)}"]
         if offset > 0:
             params.append(f"offset={offset}")
+        params.extend(filters)
+
+        # Build query string
+        query_string = "&".join(params)
 
-        # Add filter parameters
+        # Make API request
+        return await self.get(f"/schema?{query_string}")
+
+    def _page_size(self) -> int:
+        """Get the configured page size for schema listings."""
+        page_size = int(
+            self.config.get("schema", "list_page_size", DEFAULT_PAGE_SIZE)
+            or DEFAULT_PAGE_SIZE
+        )
+        return max(1, min(page_size, MAX_PAGE_SIZE))
+
+    @staticmethod
+    def _filter_params(
+        authority: str | None,
+        source: str | None,
+        entity: str | None,
+        status: str | None,
+        scope: str | None,
+        latest_version: bool,
+    ) -> list[str]:
+        """Build schema listing filter query parameters."""
+        params = []
         if authority:
             params.append(f"authority={authority}")
         if source:
@@ -111,23 +291,42 @@ class SchemaClient(OsduClient):
             params.append(f"scope={scope}")
         if latest_version:
             params.append("latestVersion=true")
+        return params
 
-        # Build query string
-        query_string = "&".join(params)
-
-        # Make API request
-        return await self.get(f"/schema?{query_string}")
-
-    async def get_schema(self, schema_id: str) -> dict[str, Any]:
+    async def get_schema(
+        self, schema_id: str, status: str | None = None, use_cache: bool = True
+    ) -> dict[str, Any]:
         """Get schema by ID.
 
+        PUBLISHED schemas are immutable and are served from the local schema
+        cache once fetched; other schemas are reused for a short TTL.
+
         Args:
             schema_id: Schema ID (format: authority:source:entity:major.minor.patch)
+            status: Known schema status, e.g. from a schema listing. Used when
+                the response itself does not carry schemaInfo
+            use_cache: Whether to read from the local schema cache
 
         Returns:
             Schema details
         """
-        return await self.get(f"/schema/{schema_id}")
+        cache = get_schema_cache()
+        if cache and use_cache:
+            cached = await cache.aget(self._base_url, self._data_partition, schema_id)
+            if cached is not None:
+                return cached
+
+        response = await self.get(f"/schema/{schema_id}")
+
+        if cache:
+            schema_info = response.get("schemaInfo")
+            if isinstance(schema_info, dict) and schema_info.get("status"):
+                status = schema_info["status"]
+            await cache.aput(
+                self._base_url, self._data_partition, schema_id, response, status
+            )
+
+        return response
 
     async def search_schemas(
         self,
@@ -153,46 +352,68 @@ class SchemaClient(OsduClient):
         Returns:
             Search results matching the criteria containing schemaInfos
         """
-        # Extract basic filters from the filter criteria if available
-        authority = None
-        source = None
-        entity = None
-        status = None
-        scope = None
-
-        if filter_criteria:
-            # Extract simple filters for server-side filtering
-            if "authority" in filter_criteria and isinstance(
-                filter_criteria["authority"], str
-            ):
-                authority = filter_criteria["authority"]
-            if "source" in filter_criteria and isinstance(
-                filter_criteria["source"], str
-            ):
-                source = filter_criteria["source"]
-            if "entity" in filter_criteria and isinstance(
-                filter_criteria["entity"], str
-            ):
-                entity = filter_criteria["entity"]
-            if "status" in filter_criteria and isinstance(
-                filter_criteria["status"], str
-            ):
-                status = filter_criteria["status"]
-            if "scope" in filter_criteria and isinstance(filter_criteria["scope"], str):
-                scope = filter_criteria["scope"]
-
         # Use the list_schemas endpoint which is available in the API
         return await self.list_schemas(
-            authority=authority,
-            source=source,
-            entity=entity,
-            status=status,
-            scope=scope,
+            **self._simple_filters(filter_criteria),
             latest_version=latest_version,
             limit=limit,
             offset=offset,
         )
 
+    async def search_schema_pages(
+        self,
+        filter_criteria: dict[str, list[str]] | None = None,
+        latest_version: bool = False,
+        max_results: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Walk every listing page matching the server-side filter criteria.
+
+        Args:
+            filter_criteria: Structured filter criteria
+            latest_version: Only return latest versions
+            max_results: Maximum number of schemas to walk
+
+        Yields:
+            Listing responses as they arrive
+        """
+        async for page in self.iter_schema_pages(
+            **self._simple_filters(filter_criteria),
+            latest_version=latest_version,
+            max_results=max_results,
+        ):
+            yield page
+
+    @staticmethod
+    def _simple_filters(
+        filter_criteria: dict[str, Any] | None,
+    ) -> dict[str, str | None]:
+        """Extract single-valued filters that the listing API can apply.
+
+        Args:
+            filter_criteria: Structured filter criteria (str or one-item list
+                values are supported server-side)
+
+        Returns:
+            Keyword arguments for list_schemas
+        """
+        filters: dict[str, str | None] = {
+            "authority": None,
+            "source": None,
+            "entity": None,
+            "status": None,
+            "scope": None,
+        }
+        for key, value in (filter_criteria or {}).items():
+            if key == "entityType":
+                key = "entity"
+            if key not in filters:
+                continue
+            if isinstance(value, list) and len(value) == 1:
+                value = value[0]
+            if isinstance(value, str):
+                filters[key] = value
+        return filters
+
     async def create_schema(
         self,
         authority: str,
@@ -260,7 +481,9 @@ class SchemaClient(OsduClient):
         if description and "description" not in schema:
             schema["description"] = description
 
-        return await self.post("/schema", json=body)
+        response = await self.post("/schema", json=body)
+        self._invalidate_cached_schema(schema_id)
+        return response
 
     async def update_schema(
         self, id: str, schema: dict[str, Any], status: str | None = None
@@ -286,7 +509,7 @@ class SchemaClient(OsduClient):
             )
 
         # Get existing schema to extract identity details
-        existing_schema = await self.get_schema(id)
+        existing_schema = await self.get_schema(id, use_cache=False)
 
         # Extract schema info from existing schema
         schema_info = existing_schema.get("schemaInfo", {})
@@ -299,4 +522,16 @@ class SchemaClient(OsduClient):
         if status:
             body["schemaInfo"]["status"] = status
 
-        return await self.put("/schema", json=body)
+        response = await self.put("/schema", json=body)
+        self._invalidate_cached_schema(id)
+        return response
+
+    def _invalidate_cached_schema(self, schema_id: str) -> None:
+        """Drop a schema from the local cache after it was written.
+
+        Args:
+            schema_id: Schema ID that was created or updated
+        """
+        cache = get_schema_cache()
+        if cache:
+            cache.invalidate(self._base_url, self._data_partition, schema_id)
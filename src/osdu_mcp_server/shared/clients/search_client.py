@@ -1,12 +1,41 @@
 """OSDU Search service client."""
 
-from typing import Dict, Any
+from collections.abc import AsyncGenerator
+from typing import Dict, Any, List, Optional, Tuple
+
 from ..osdu_client import OsduClient
 from ..service_urls import OSMCPService, get_service_base_url
 from ..logging_manager import get_logger
 
 logger = get_logger(__name__)
 
+CURSOR_PAGE_SIZE = 1000
+
+# Record attributes that live outside "data"; anything else is a data field
+RECORD_ATTRIBUTES = frozenset(
+    {
+        "id",
+        "kind",
+        "version",
+        "createTime",
+        "createUser",
+        "modifyTime",
+        "modifyUser",
+        "acl",
+        "legal",
+        "ancestry",
+        "tags",
+        "authority",
+        "source",
+        "type",
+        "namespace",
+        "index",
+    }
+)
+
+# Always requested so standardized results keep their shape
+BASE_RETURNED_FIELDS = ("id", "kind", "createTime", "version")
+
 
 class SearchClient(OsduClient):
     """Client for OSDU Search service operations."""
@@ -15,6 +44,7 @@ class SearchClient(OsduClient):
         """Initialize SearchClient with service-specific configuration."""
         super().__init__(*args, **kwargs)
         self._base_path = get_service_base_url(OSMCPService.SEARCH)
+        self._service = OSMCPService.SEARCH
 
     async def post(self, path: str, data: Any = None, **kwargs: Any) -> Dict[str, Any]:
         """Override post to include service base path."""
@@ -24,10 +54,23 @@ class SearchClient(OsduClient):
         return await super().post(full_path, data, **kwargs)
 
     async def search_query(
-        self, query: str, kind: str = "*:*:*:*", limit: int = 50, offset: int = 0
+        self,
+        query: str,
+        kind: str = "*:*:*:*",
+        limit: int = 50,
+        offset: int = 0,
+        returned_fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Execute general search query."""
-        payload = {"kind": kind, "query": query, "limit": limit, "offset": offset}
+        payload: Dict[str, Any] = {
+            "kind": kind,
+            "query": query,
+            "limit": limit,
+            "offset": offset,
+        }
+        fields = self._returned_fields(returned_fields)
+        if fields:
+            payload["returnedFields"] = fields
 
         logger.info(
             f"Executing search query: {query}",
@@ -39,53 +82,265 @@ class SearchClient(OsduClient):
             },
         )
 
-        response = await self.post("/query", json=payload)
-        return self._standardize_response(response, query)
+        response = await self.post("/query", json=payload, idempotent=True)
+        return self._standardize_response(response, query, fields)
+
+    async def search_query_with_cursor(
+        self,
+        query: str,
+        kind: str = "*:*:*:*",
+        limit: int = CURSOR_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        returned_fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Execute one page of a cursor-based search.
+
+        Unlike offset paging, the Search service keeps the position server-side,
+        so later pages cost the same as the first and are not bounded by the
+        index result window.
+
+        Args:
+            query: Elasticsearch query syntax
+            kind: Kind pattern to search
+            limit: Maximum results in this page
+            cursor: Cursor returned by the previous page (None for the first)
+            returned_fields: Optional fields to return instead of the full record
+
+        Returns:
+            Standardized search response with a "cursor" for the next page
+            (None once the result set is exhausted)
+        """
+        payload, fields = self._cursor_payload(
+            query, kind, limit, cursor, returned_fields
+        )
+        response = await self.post("/query_with_cursor", json=payload, idempotent=True)
+        result = self._standardize_response(response, query, fields)
+        result["cursor"] = response.get("cursor") if result["results"] else None
+        return result
+
+    async def iter_query_with_cursor(
+        self,
+        query: str,
+        kind: str = "*:*:*:*",
+        page_size: int = CURSOR_PAGE_SIZE,
+        returned_fields: Optional[List[str]] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Walk the full result set of a query using search cursors.
+
+        Each page is streamed, so hits are standardized and yielded as they
+        are decoded rather than after the whole page has been received.
+
+        Args:
+            query: Elasticsearch query syntax
+            kind: Kind pattern to search
+            page_size: Results requested per page
+            returned_fields: Optional fields to return instead of the full record
+
+        Yields:
+            Standardized search hits in result order
+        """
+        cursor: Optional[str] = None
+        while True:
+            payload, fields = self._cursor_payload(
+                query, kind, page_size, cursor, returned_fields
+            )
+            meta: Dict[str, Any] = {}
+            count = 0
+            async for hit in self.stream_items(
+                "POST",
+                f"{self._base_path}/query_with_cursor",
+                "results",
+                meta,
+                json=payload,
+                idempotent=True,
+            ):
+                count += 1
+                yield self._standardize_hit(hit, fields)
+
+            cursor = meta.get("cursor")
+            if not cursor or not count:
+                return
+
+    def _cursor_payload(
+        self,
+        query: str,
+        kind: str,
+        limit: int,
+        cursor: Optional[str],
+        returned_fields: Optional[List[str]],
+    ) -> Tuple[Dict[str, Any], Optional[List[str]]]:
+        """Build the request body for one page of a cursor search.
+
+        Returns:
+            Request payload and the normalized returnedFields list
+        """
+        payload: Dict[str, Any] = {"kind": kind, "query": query, "limit": limit}
+        if cursor:
+            payload["cursor"] = cursor
+        fields = self._returned_fields(returned_fields)
+        if fields:
+            payload["returnedFields"] = fields
+
+        logger.info(
+            f"Executing cursor search query: {query}",
+            extra={
+                "query": query,
+                "kind": kind,
+                "limit": limit,
+                "has_cursor": bool(cursor),
+                "operation": "search_query_with_cursor",
+            },
+        )
+        return payload, fields
 
-    async def search_by_id(self, record_id: str, limit: int = 10) -> Dict[str, Any]:
+    async def search_by_id(
+        self,
+        record_id: str,
+        limit: int = 10,
+        returned_fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         """Execute ID-specific search."""
         query = f'id:("{record_id}")'
-        payload = {"kind": "*:*:*:*", "query": query, "limit": limit}
+        payload: Dict[str, Any] = {"kind": "*:*:*:*", "query": query, "limit": limit}
+        fields = self._returned_fields(returned_fields)
+        if fields:
+            payload["returnedFields"] = fields
 
         logger.info(
             f"Executing ID search: {record_id}",
             extra={"record_id": record_id, "operation": "search_by_id"},
         )
 
-        response = await self.post("/query", json=payload)
-        return self._standardize_response(response, query)
+        response = await self.post("/query", json=payload, idempotent=True)
+        return self._standardize_response(response, query, fields)
 
     async def search_by_kind(
-        self, kind: str, limit: int = 100, offset: int = 0
+        self,
+        kind: str,
+        limit: int = 100,
+        offset: int = 0,
+        returned_fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Execute kind-specific search."""
-        payload = {"kind": kind, "query": "", "limit": limit, "offset": offset}
+        payload: Dict[str, Any] = {
+            "kind": kind,
+            "query": "",
+            "limit": limit,
+            "offset": offset,
+        }
+        fields = self._returned_fields(returned_fields)
+        if fields:
+            payload["returnedFields"] = fields
 
         logger.info(
             f"Executing kind search: {kind}",
             extra={"kind": kind, "limit": limit, "operation": "search_by_kind"},
         )
 
-        response = await self.post("/query", json=payload)
-        return self._standardize_response(response, f"kind:{kind}")
+        response = await self.post("/query", json=payload, idempotent=True)
+        return self._standardize_response(response, f"kind:{kind}", fields)
+
+    @staticmethod
+    def _returned_fields(fields: Optional[List[str]]) -> Optional[List[str]]:
+        """Normalize requested fields into an OSDU returnedFields list.
+
+        Bare names such as "FacilityName" are treated as data fields, and the
+        attributes needed for the standardized response are always included.
+
+        Args:
+            fields: Requested fields, or None for full records
+
+        Returns:
+            Fields to push down to the Search service, or None
+        """
+        if not fields:
+            return None
+
+        normalized = [
+            (
+                field
+                if field in RECORD_ATTRIBUTES
+                or field == "data"
+                or field.startswith("data.")
+                else f"data.{field}"
+            )
+            for field in fields
+            if field
+        ]
+        return list(dict.fromkeys([*BASE_RETURNED_FIELDS, *normalized]))
+
+    @staticmethod
+    def _project_data(
+        data: Dict[str, Any], fields: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Trim a record's data block down to the requested data fields.
+
+        Args:
+            data: Full or partially returned data block
+            fields: Normalized returnedFields list, or None for no trimming
+
+        Returns:
+            Data block containing only the requested paths
+        """
+        if fields is None or "data" in fields:
+            return data
+
+        projected: Dict[str, Any] = {}
+        for field in fields:
+            if not field.startswith("data."):
+                continue
+            path = field.removeprefix("data.").split(".")
+
+            # Accept both nested objects and flattened "a.b" keys
+            flat_key = ".".join(path)
+            if flat_key in data:
+                projected[flat_key] = data[flat_key]
+                continue
+
+            source: Any = data
+            for part in path:
+                if not isinstance(source, dict) or part not in source:
+                    break
+                source = source[part]
+            else:
+                target = projected
+                for part in path[:-1]:
+                    target = target.setdefault(part, {})
+                target[path[-1]] = source
+
+        return projected
+
+    def _standardize_hit(
+        self, result: Dict[str, Any], returned_fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Reduce one search hit to the fields returned to MCP clients."""
+        simplified_result = {
+            "id": result.get("id"),
+            "kind": result.get("kind"),
+            "data": self._project_data(result.get("data", {}), returned_fields),
+            "createTime": result.get("createTime"),
+        }
+        # Optionally include version for debugging
+        if "version" in result:
+            simplified_result["version"] = result["version"]
+        # Requested record attributes beyond the standard ones
+        for field in returned_fields or ():
+            if field in RECORD_ATTRIBUTES and field in result:
+                simplified_result.setdefault(field, result[field])
+        return simplified_result
 
     def _standardize_response(
-        self, osdu_response: Dict[str, Any], query: str
+        self,
+        osdu_response: Dict[str, Any],
+        query: str,
+        returned_fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Convert OSDU Search API response to MCP format."""
         # Filter OSDU response to include only essential fields for AI consumption
-        simplified_results = []
-        for result in osdu_response.get("results", []):
-            simplified_result = {
-                "id": result.get("id"),
-                "kind": result.get("kind"),
-                "data": result.get("data", {}),
-                "createTime": result.get("createTime"),
-            }
-            # Optionally include version for debugging
-            if "version" in result:
-                simplified_result["version"] = result["version"]
-            simplified_results.append(simplified_result)
+        simplified_results = [
+            self._standardize_hit(result, returned_fields)
+            for result in osdu_response.get("results", [])
+        ]
 
         return {
             "success": True,
@@ -1,15 +1,28 @@
 """OSDU Storage service client."""
 
+import asyncio
+import contextlib
 import os
+from collections.abc import AsyncGenerator, AsyncIterator
 from typing import Any
 
-from ..exceptions import OSMCPAPIError, OSMCPValidationError
+from ..exceptions import OSMCPAPIError, OSMCPConnectionError, OSMCPValidationError
+from ..json_codec import get_json_codec
 from ..logging_manager import get_logger
 from ..osdu_client import OsduClient
+from ..record_cache import get_record_cache
 from ..service_urls import OSMCPService, get_service_base_url
 
 logger = get_logger(__name__)
 
+FETCH_BATCH_SIZE = 100
+DEFAULT_FETCH_CONCURRENCY = 8
+DEFAULT_FETCH_RETRY_ATTEMPTS = 2
+KIND_QUERY_PAGE_SIZE = 1000
+INGEST_BATCH_SIZE = 500
+DEFAULT_INGEST_BATCH_BYTES = 4 * 1024 * 1024
+DEFAULT_INGEST_CONCURRENCY = 4
+
 
 class StorageClient(OsduClient):
     """Client for OSDU Storage service operations."""
@@ -18,6 +31,7 @@ class StorageClient(OsduClient):
         """Initialize StorageClient with service-specific configuration."""
         super().__init__(*args, **kwargs)
         self._base_path = get_service_base_url(OSMCPService.STORAGE)
+        self._service = OSMCPService.STORAGE
 
     async def get(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Override get to include service base path."""
@@ -95,6 +109,55 @@ class StorageClient(OsduClient):
                     "Legal legaltags and otherRelevantDataCountries must be arrays. Legal information must contain arrays of strings"
                 )
 
+    async def validate_records_against_schemas(
+        self, records: list[dict[str, Any]]
+    ) -> None:
+        """Validate each record's data against the schema of its kind.
+
+        Args:
+            records: Records to validate
+
+        Raises:
+            OSMCPValidationError: If any record's data violates its schema
+        """
+        failures = await self.schema_failures(records)
+        if failures:
+            details = "; ".join(
+                f"Record {i + 1} ({records[i].get('kind')}): {', '.join(errors)}"
+                for i, errors in sorted(failures.items())
+            )
+            raise OSMCPValidationError(
+                f"{len(failures)} of {len(records)} records failed schema validation. {details}"
+            )
+
+    async def schema_failures(
+        self, records: list[dict[str, Any]]
+    ) -> dict[int, list[str]]:
+        """Check each record's data against the schema of its kind.
+
+        Schemas are resolved through the schema cache and compiled once per
+        kind, so a batch is checked locally before any write is attempted.
+
+        Args:
+            records: Records to validate
+
+        Returns:
+            Mapping of record index to error messages, for invalid records only
+        """
+        # Imported here: the validator depends on the schema client package
+        from ..record_validator import DEFAULT_MAX_ERRORS, validate_records
+        from .schema_client import SchemaClient
+
+        max_errors = int(
+            self.config.get("storage", "validation_max_errors", DEFAULT_MAX_ERRORS)
+            or DEFAULT_MAX_ERRORS
+        )
+        schema_client = SchemaClient(self.config, self.auth_handler)
+        try:
+            return await validate_records(schema_client, records, max_errors)
+        finally:
+            await schema_client.close()
+
     def check_write_permission(self) -> None:
         """Check if write operations are enabled.
 
@@ -131,15 +194,7 @@ class StorageClient(OsduClient):
         Returns:
             Dictionary containing operation results
         """
-        # Validate records
-        for i, record in enumerate(records):
-            try:
-                self.validate_record(record)
-            except OSMCPValidationError as e:
-                raise OSMCPValidationError(f"Record {i + 1} validation failed: {e}")
-
-        # Check write permission for create/update operations
-        self.check_write_permission()
+        await self._prepare_write(records)
 
         params = {}
         if skip_dupes:
@@ -155,13 +210,298 @@ class StorageClient(OsduClient):
             },
         )
 
-        return await self.put("/records", json=records, params=params)
+        try:
+            # Writing again creates another version, so only refusals are retried
+            return await self.put(
+                "/records", json=records, params=params, idempotent=False
+            )
+        finally:
+            self._forget_latest(records)
+
+    async def ingest_records(
+        self,
+        records: list[dict[str, Any]],
+        skip_dupes: bool = False,
+        batch_size: int | None = None,
+        max_batch_bytes: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, Any]:
+        """Create or update any number of records in concurrent batches.
+
+        Every record is validated first, and invalid records are reported
+        instead of failing the call. The valid ones are split into batches
+        bounded by record count and serialized size and submitted
+        concurrently. A batch refused with 429 or 503 is retried by the
+        client's retry policy; one that failed after it may have been applied
+        (a timeout, 500, 502 or 504) is reported instead of being written
+        twice. A failed batch does not stop the others.
+
+        Reads configuration from:
+        - OSDU_MCP_STORAGE_INGEST_BATCH_SIZE: Records per request (default: 500)
+        - OSDU_MCP_STORAGE_INGEST_BATCH_BYTES: Serialized bytes per request (default: 4 MiB)
+        - OSDU_MCP_STORAGE_INGEST_CONCURRENCY: Batches in flight (default: 4)
+
+        Args:
+            records: List of records to create or update
+            skip_dupes: Skip duplicates when updating (default: False)
+            batch_size: Override for the number of records per request
+            max_batch_bytes: Override for the serialized size of a request
+            max_concurrency: Override for the number of batches in flight
+
+        Returns:
+            Merged report where every entry carries the input position of its
+            record::
+
+                {
+                    "recordCount": int,
+                    "records": [{"index": int, "id": str, "kind": str, "version": int}],
+                    "skippedRecords": [{"index": int, "id": str}],
+                    "failedRecords": [{"index": int, "id": str, "kind": str, "error": str}],
+                    "batchCount": int,
+                    "failedBatchCount": int
+                }
+
+        Raises:
+            OSMCPAPIError: If write operations are disabled
+        """
+        self.check_write_permission()
+        invalid = await self._validation_failures(records)
+        valid = [i for i in range(len(records)) if i not in invalid]
+
+        batch_size = self._storage_setting(
+            "ingest_batch_size", batch_size, INGEST_BATCH_SIZE
+        )
+        max_batch_bytes = self._storage_setting(
+            "ingest_batch_bytes", max_batch_bytes, DEFAULT_INGEST_BATCH_BYTES
+        )
+        max_concurrency = self._storage_setting(
+            "ingest_concurrency", max_concurrency, DEFAULT_INGEST_CONCURRENCY
+        )
+        params = {}
+        if skip_dupes:
+            params["skipdupes"] = "true"
+
+        # Batches hold positions in the original list
+        batches = [
+            [valid[n] for n in batch]
+            for batch in self.split_batches(
+                [records[i] for i in valid],
+                min(batch_size, INGEST_BATCH_SIZE),
+                max_batch_bytes,
+            )
+        ]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def submit(
+            indexes: list[int],
+        ) -> tuple[list[int], dict[str, Any] | None, Exception | None]:
+            batch = [records[i] for i in indexes]
+            async with semaphore:
+                try:
+                    response = await self.put(
+                        "/records", json=batch, params=params, idempotent=False
+                    )
+                    return indexes, response, None
+                except (OSMCPAPIError, OSMCPConnectionError) as e:
+                    return indexes, None, e
+                finally:
+                    # A failed request may still have been applied
+                    self._forget_latest(batch)
+
+        logger.info(
+            f"Ingesting {len(records)} records in {len(batches)} batches",
+            extra={
+                "record_count": len(records),
+                "batch_count": len(batches),
+                "invalid_count": len(invalid),
+                "max_concurrency": max_concurrency,
+                "operation": "ingest_records",
+                "skip_dupes": skip_dupes,
+            },
+        )
+
+        created: list[dict[str, Any]] = []
+        skipped: list[dict[str, Any]] = []
+        failed: list[dict[str, Any]] = [
+            {
+                "index": i,
+                "id": self._field(records[i], "id"),
+                "kind": self._field(records[i], "kind"),
+                "error": error,
+            }
+            for i, error in invalid.items()
+        ]
+        failed_batches = 0
+
+        for indexes, response, error in await asyncio.gather(
+            *(submit(b) for b in batches)
+        ):
+            if error is not None:
+                failed_batches += 1
+                failed.extend(
+                    {
+                        "index": i,
+                        "id": records[i].get("id"),
+                        "kind": records[i].get("kind"),
+                        "error": str(error),
+                    }
+                    for i in indexes
+                )
+                continue
+
+            skipped_ids = set(response.get("skippedRecordIds", []))
+            versions = response.get("recordIdVersions", [])
+            # recordIds lists the written records in request order
+            written = (
+                (written_id, versions[n] if n < len(versions) else None)
+                for n, written_id in enumerate(response.get("recordIds", []))
+            )
+            for i in indexes:
+                record_id = records[i].get("id")
+                if record_id and record_id in skipped_ids:
+                    skipped.append({"index": i, "id": record_id})
+                    continue
+                written_id, version = next(written, (record_id, None))
+                entry = {"index": i, "id": written_id, "kind": records[i].get("kind")}
+                if version is not None:
+                    entry["version"] = version
+                created.append(entry)
+
+        logger.info(
+            f"Ingested {len(created)} of {len(records)} records",
+            extra={
+                "created_count": len(created),
+                "skipped_count": len(skipped),
+                "failed_count": len(failed),
+                "failed_batch_count": failed_batches,
+                "operation": "ingest_records",
+            },
+        )
+
+        return {
+            "recordCount": len(created),
+            "records": sorted(created, key=lambda r: r["index"]),
+            "skippedRecords": sorted(skipped, key=lambda r: r["index"]),
+            "failedRecords": sorted(failed, key=lambda r: r["index"]),
+            "batchCount": len(batches),
+            "failedBatchCount": failed_batches,
+        }
+
+    @staticmethod
+    def split_batches(
+        records: list[dict[str, Any]], max_count: int, max_bytes: int
+    ) -> list[list[int]]:
+        """Split records into batches bounded by count and serialized size.
+
+        A record larger than max_bytes on its own is sent in a batch by itself
+        and left to the service to accept or reject.
+
+        Args:
+            records: Records to split
+            max_count: Maximum number of records per batch
+            max_bytes: Maximum serialized JSON size of a batch
+
+        Returns:
+            Batches as lists of input positions
+        """
+        batches: list[list[int]] = []
+        current: list[int] = []
+        # Account for the enclosing brackets of the JSON array
+        current_bytes = 2
+        dumps = get_json_codec().dumps
+        for i, record in enumerate(records):
+            # One byte for the separating comma
+            size = len(dumps(record)) + 1
+            if current and (
+                len(current) >= max_count or current_bytes + size > max_bytes
+            ):
+                batches.append(current)
+                current, current_bytes = [], 2
+            current.append(i)
+            current_bytes += size
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _field(record: Any, name: str) -> Any:
+        """Read a top-level field of a record that may not be an object."""
+        return record.get(name) if isinstance(record, dict) else None
+
+    async def _validation_failures(
+        self, records: list[dict[str, Any]]
+    ) -> dict[int, str]:
+        """Validate every record without stopping at the first invalid one.
+
+        Args:
+            records: Records about to be written
+
+        Returns:
+            Error message keyed by the input position of each invalid record
+        """
+        failures: dict[int, str] = {}
+        for i, record in enumerate(records):
+            if not isinstance(record, dict):
+                failures[i] = "Record must be an object"
+                continue
+            try:
+                self.validate_record(record)
+            except OSMCPValidationError as e:
+                failures[i] = str(e)
+
+        if self.config.get("storage", "validate_schemas", True):
+            checked = [i for i in range(len(records)) if i not in failures]
+            schema = await self.schema_failures([records[i] for i in checked])
+            for n, errors in schema.items():
+                failures[checked[n]] = f"Schema validation failed: {', '.join(errors)}"
+        return dict(sorted(failures.items()))
+
+    def _storage_setting(self, key: str, override: int | None, default: int) -> int:
+        """Resolve a positive integer storage setting."""
+        if override is None:
+            override = int(self.config.get("storage", key, default) or default)
+        return max(1, override)
+
+    def _forget_latest(self, records: list[dict[str, Any]]) -> None:
+        """Drop cached latest versions of records this server wrote."""
+        cache = get_record_cache()
+        if cache is not None:
+            for record in records:
+                if isinstance(record.get("id"), str):
+                    cache.invalidate_latest(
+                        self._base_url, self._data_partition, record["id"]
+                    )
+
+    async def _prepare_write(self, records: list[dict[str, Any]]) -> None:
+        """Validate records and check that writes are allowed.
+
+        Args:
+            records: Records about to be written
+
+        Raises:
+            OSMCPValidationError: If any record is invalid
+            OSMCPAPIError: If write operations are disabled
+        """
+        # Validate records
+        for i, record in enumerate(records):
+            try:
+                self.validate_record(record)
+            except OSMCPValidationError as e:
+                raise OSMCPValidationError(f"Record {i + 1} validation failed: {e}")
+
+        # Check write permission for create/update operations
+        self.check_write_permission()
+
+        if self.config.get("storage", "validate_schemas", True):
+            await self.validate_records_against_schemas(records)
 
     async def get_record(
         self, id: str, attributes: list[str] | None = None
     ) -> dict[str, Any]:
         """Get the latest version of a record by ID.
 
+        Full records are reused from the record cache for a short TTL.
+
         Args:
             id: Record ID
             attributes: Optional data fields to return
@@ -169,6 +509,13 @@ class StorageClient(OsduClient):
         Returns:
             Dictionary containing record information
         """
+        cache = None if attributes else get_record_cache()
+        if cache is not None:
+            cached = await cache.get(self._base_url, self._data_partition, id, None)
+            if cached is not None:
+                return cached
+            generation = cache.generation
+
         params = {}
         if attributes:
             params["attribute"] = attributes
@@ -182,13 +529,25 @@ class StorageClient(OsduClient):
             },
         )
 
-        return await self.get(f"/records/{id}", params=params)
+        record = await self.get(f"/records/{id}", params=params)
+        if cache is not None:
+            await cache.put(
+                self._base_url,
+                self._data_partition,
+                record,
+                latest=True,
+                generation=generation,
+            )
+        return record
 
     async def get_record_version(
         self, id: str, version: int, attributes: list[str] | None = None
     ) -> dict[str, Any]:
         """Get a specific version of a record by ID.
 
+        Record versions are immutable, so full records are served from the
+        record cache once fetched.
+
         Args:
             id: Record ID
             version: Record version
@@ -197,6 +556,14 @@ class StorageClient(OsduClient):
         Returns:
             Dictionary containing record information
         """
+        cache = None if attributes else get_record_cache()
+        if cache is not None:
+            cached = await cache.get(
+                self._base_url, self._data_partition, id, int(version)
+            )
+            if cached is not None:
+                return cached
+
         params = {}
         if attributes:
             params["attribute"] = attributes
@@ -211,7 +578,10 @@ class StorageClient(OsduClient):
             },
         )
 
-        return await self.get(f"/records/{id}/{version}", params=params)
+        record = await self.get(f"/records/{id}/{version}", params=params)
+        if cache is not None:
+            await cache.put(self._base_url, self._data_partition, record)
+        return record
 
     async def list_record_versions(self, id: str) -> dict[str, Any]:
         """List all versions of a record.
@@ -229,6 +599,67 @@ class StorageClient(OsduClient):
 
         return await self.get(f"/records/versions/{id}")
 
+    async def get_record_history(
+        self, id: str, max_concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """List the versions of a record and fetch them all concurrently.
+
+        Versions are immutable, so any already in the record cache are not
+        fetched again.
+
+        Reads configuration from:
+        - OSDU_MCP_STORAGE_HISTORY_CONCURRENCY: Versions in flight (default: 8)
+
+        Args:
+            id: Record ID
+            max_concurrency: Override for the number of versions in flight
+
+        Returns:
+            Dictionary with the recordId, all versions in ascending order,
+            the fetched records in the same order and any failedVersions
+        """
+        response = await self.list_record_versions(id)
+        versions = sorted(int(v) for v in response.get("versions", []))
+        max_concurrency = self._storage_setting(
+            "history_concurrency", max_concurrency, DEFAULT_FETCH_CONCURRENCY
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_version(version: int) -> dict[str, Any] | Exception:
+            async with semaphore:
+                try:
+                    return await self.get_record_version(id, version)
+                except (OSMCPAPIError, OSMCPConnectionError) as e:
+                    return e
+
+        results = await asyncio.gather(*(fetch_version(v) for v in versions))
+
+        records = []
+        failed = []
+        for version, result in zip(versions, results, strict=True):
+            if isinstance(result, Exception):
+                failed.append({"version": version, "error": str(result)})
+            else:
+                records.append(result)
+
+        logger.info(
+            f"Fetched {len(records)} of {len(versions)} versions of record {id}",
+            extra={
+                "record_id": id,
+                "version_count": len(versions),
+                "failed_count": len(failed),
+                "max_concurrency": max_concurrency,
+                "operation": "get_record_history",
+            },
+        )
+
+        return {
+            "recordId": response.get("recordId", id),
+            "versions": versions,
+            "records": records,
+            "failedVersions": failed,
+        }
+
     async def query_records_by_kind(
         self, kind: str, limit: int = 10, cursor: str | None = None
     ) -> dict[str, Any]:
@@ -258,6 +689,80 @@ class StorageClient(OsduClient):
 
         return await self.get("/query/records", params=params)
 
+    async def iter_record_pages_by_kind(
+        self,
+        kind: str,
+        page_size: int = KIND_QUERY_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Follow query cursors for a kind until they are exhausted.
+
+        The request for the next page is issued before the current page is
+        yielded, so network latency overlaps with processing by the caller.
+
+        Args:
+            kind: Kind to query for
+            page_size: Number of IDs requested per page
+            cursor: Cursor to resume from (None starts at the beginning)
+
+        Yields:
+            Page dictionaries with "results", the "cursor" for the next page
+            and the "request_cursor" that produced the page
+        """
+
+        def request(page_cursor: str | None) -> asyncio.Future:
+            return asyncio.ensure_future(
+                self.query_records_by_kind(kind, page_size, page_cursor)
+            )
+
+        next_page: asyncio.Future | None = request(cursor)
+        try:
+            while next_page is not None:
+                response = await next_page
+                next_page = None
+
+                results = response.get("results", [])
+                next_cursor = response.get("cursor") or None
+                if next_cursor and results:
+                    next_page = request(next_cursor)
+
+                yield {
+                    "results": results,
+                    "cursor": next_cursor,
+                    "request_cursor": cursor,
+                }
+                cursor = next_cursor
+        finally:
+            # The caller stopped early; drop the prefetched page
+            if next_page is not None:
+                next_page.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await next_page
+
+    async def iter_record_ids_by_kind(
+        self,
+        kind: str,
+        page_size: int = KIND_QUERY_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Yield every record ID of a kind as pages arrive.
+
+        Args:
+            kind: Kind to query for
+            page_size: Number of IDs requested per page
+            cursor: Cursor to resume from (None starts at the beginning)
+
+        Yields:
+            Record IDs in the order the Storage service returns them
+        """
+        pages = self.iter_record_pages_by_kind(kind, page_size, cursor)
+        try:
+            async for page in pages:
+                for record_id in page["results"]:
+                    yield record_id
+        finally:
+            await pages.aclose()
+
     async def fetch_records(
         self, record_ids: list[str], attributes: list[str] | None = None
     ) -> dict[str, Any]:
@@ -288,7 +793,206 @@ class StorageClient(OsduClient):
             },
         )
 
-        return await self.post("/query/records", json=body)
+        return await self.post("/query/records", json=body, idempotent=True)
+
+    async def fetch_records_bulk(
+        self,
+        record_ids: list[str],
+        attributes: list[str] | None = None,
+        max_concurrency: int | None = None,
+        retry_attempts: int | None = None,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Retrieve any number of records using concurrent 100-ID batches.
+
+        Full records still fresh in the record cache are not fetched again.
+
+        Reads configuration from:
+        - OSDU_MCP_STORAGE_FETCH_CONCURRENCY: Batches in flight (default: 8)
+        - OSDU_MCP_STORAGE_FETCH_RETRY_ATTEMPTS: Re-fetches of retryRecords (default: 2)
+
+        Args:
+            record_ids: List of record IDs (duplicates are fetched once)
+            attributes: Optional data fields to return
+            max_concurrency: Override for the number of batches in flight
+            retry_attempts: Override for how often retryRecords are re-fetched
+            use_cache: Read and fill the record cache (bulk exports pass False
+                so they do not evict frequently used records)
+
+        Returns:
+            Dictionary with records, invalidRecords and retryRecords merged in
+            the order the IDs were requested; IDs of batches whose request
+            failed are reported as retryRecords
+
+        Raises:
+            OSMCPError: Error of the first batch if every batch of the first
+                pass failed
+        """
+        unique_ids = list(dict.fromkeys(record_ids))
+        if max_concurrency is None:
+            max_concurrency = int(
+                self.config.get(
+                    "storage", "fetch_concurrency", DEFAULT_FETCH_CONCURRENCY
+                )
+                or DEFAULT_FETCH_CONCURRENCY
+            )
+        if retry_attempts is None:
+            retry_attempts = int(
+                self.config.get(
+                    "storage", "fetch_retry_attempts", DEFAULT_FETCH_RETRY_ATTEMPTS
+                )
+                or 0
+            )
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch_batch(batch: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.fetch_records(batch, attributes)
+
+        records: dict[str, dict[str, Any]] = {}
+        cache = get_record_cache() if use_cache and not attributes else None
+        if cache is not None:
+            for record_id in unique_ids:
+                cached = await cache.get(
+                    self._base_url, self._data_partition, record_id, None
+                )
+                if cached is not None:
+                    records[record_id] = cached
+            generation = cache.generation
+        cached_ids = set(records)
+
+        invalid: set[str] = set()
+        pending = [record_id for record_id in unique_ids if record_id not in records]
+        attempt = 0
+
+        while pending:
+            batches = []
+            for start in range(0, len(pending), FETCH_BATCH_SIZE):
+                end = start + FETCH_BATCH_SIZE
+                batches.append(pending[start:end])
+            responses = await asyncio.gather(
+                *(fetch_batch(b) for b in batches), return_exceptions=True
+            )
+
+            retry: set[str] = set()
+            errors: list[BaseException] = []
+            for batch, response in zip(batches, responses, strict=True):
+                if isinstance(response, BaseException):
+                    # Keep the other batches; the failed IDs are retried below
+                    # and reported as retryRecords if they keep failing
+                    if not isinstance(response, Exception):
+                        raise response
+                    errors.append(response)
+                    retry.update(batch)
+                    continue
+                for record in response.get("records", []):
+                    records[record.get("id")] = record
+                invalid.update(response.get("invalidRecords", []))
+                retry.update(response.get("retryRecords", []))
+
+            if errors and len(errors) == len(batches) and attempt == 0:
+                # Nothing came back at all (e.g. auth or permission errors)
+                raise errors[0]
+            for error in errors:
+                logger.warning(
+                    f"Record batch fetch failed: {error}",
+                    extra={"attempt": attempt, "operation": "fetch_records_bulk"},
+                )
+
+            pending = [record_id for record_id in unique_ids if record_id in retry]
+            if not pending or attempt >= retry_attempts:
+                break
+
+            attempt += 1
+            logger.info(
+                f"Retrying {len(pending)} records reported as retryRecords",
+                extra={
+                    "retry_count": len(pending),
+                    "attempt": attempt,
+                    "operation": "fetch_records_bulk",
+                },
+            )
+            await asyncio.sleep(self._retry_policy.backoff(attempt - 1))
+
+        logger.info(
+            f"Bulk fetched {len(records)} of {len(unique_ids)} records",
+            extra={
+                "requested_count": len(unique_ids),
+                "fetched_count": len(records),
+                "cached_count": len(cached_ids),
+                "batch_count": -(-len(unique_ids) // FETCH_BATCH_SIZE),
+                "max_concurrency": max_concurrency,
+                "operation": "fetch_records_bulk",
+            },
+        )
+
+        if cache is not None:
+            for record_id, record in records.items():
+                if record_id not in cached_ids:
+                    await cache.put(
+                        self._base_url,
+                        self._data_partition,
+                        record,
+                        latest=True,
+                        generation=generation,
+                    )
+
+        invalid_ids = [i for i in unique_ids if i in invalid and i not in records]
+        retry_ids = [i for i in pending if i not in records]
+
+        # Records come back keyed by their own ID; anything that does not
+        # match a requested ID verbatim (e.g. versioned IDs) goes last
+        ordered = [records.pop(i) for i in unique_ids if i in records]
+        ordered.extend(records.values())
+
+        return {
+            "records": ordered,
+            "invalidRecords": invalid_ids,
+            "retryRecords": retry_ids,
+        }
+
+    async def iter_records(
+        self,
+        record_ids: list[str],
+        attributes: list[str] | None = None,
+        stats: dict[str, Any] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield records as they are decoded, one 100-ID batch at a time.
+
+        Unlike fetch_records_bulk, records are handed out while a batch is
+        still being received and are not collected or cached, so memory is
+        bounded by a single record rather than by the number requested.
+
+        Args:
+            record_ids: List of record IDs (duplicates are fetched once)
+            attributes: Optional data fields to return
+            stats: Updated with the "invalidRecords" and "retryRecords" IDs
+                reported by each batch
+
+        Yields:
+            Records in the order the Storage service returns them
+        """
+        unique_ids = list(dict.fromkeys(record_ids))
+        for start in range(0, len(unique_ids), FETCH_BATCH_SIZE):
+            end = start + FETCH_BATCH_SIZE
+            body: dict[str, Any] = {"records": unique_ids[start:end]}
+            if attributes:
+                body["attributes"] = attributes
+
+            meta: dict[str, Any] = {}
+            async for record in self.stream_items(
+                "POST",
+                f"{self._base_path}/query/records",
+                "records",
+                meta,
+                json=body,
+                idempotent=True,
+            ):
+                yield record
+
+            if stats is not None:
+                for key in ("invalidRecords", "retryRecords"):
+                    stats.setdefault(key, []).extend(meta.get(key) or [])
 
     async def delete_record(self, id: str) -> dict[str, Any]:
         """Logically delete a record.
@@ -307,7 +1011,10 @@ class StorageClient(OsduClient):
             extra={"record_id": id, "operation": "delete_record", "destructive": True},
         )
 
-        return await self.post(f"/records/{id}:delete")
+        try:
+            return await self.post(f"/records/{id}:delete")
+        finally:
+            self._forget_latest([{"id": id}])
 
     async def purge_record(self, id: str, confirm: bool = False) -> dict[str, Any]:
         """Physically delete a record permanently.
@@ -340,4 +1047,9 @@ class StorageClient(OsduClient):
             },
         )
 
-        return await self.delete(f"/records/{id}")
+        try:
+            return await self.delete(f"/records/{id}")
+        finally:
+            cache = get_record_cache()
+            if cache is not None:
+                await cache.invalidate_all(self._base_url, self._data_partition, id)
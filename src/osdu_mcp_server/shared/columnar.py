@@ -0,0 +1,344 @@
+"""Columnar (Parquet / Arrow IPC) files from OSDU records.
+
+Records are flattened into one column per ``data`` path (``data.FacilityName``,
+``data.VerticalMeasurement.Value``, ...) next to the record attributes.
+Column types come from the kind's JSON schema when it is available and are
+otherwise inferred from the first page of records. Most OSDU ``data`` blocks
+are assembled with ``allOf`` from abstract schemas referenced by ID (e.g.
+``osdu:wks:AbstractCommonResources:1.0.0``); those are resolved from the
+referenced schema bodies, and columns behind references that could not be
+fetched are inferred from the first page instead. Arrays and free-form
+objects are stored as JSON text.
+
+Each written page becomes one row group (Parquet) or record batch (Arrow),
+so files are produced incrementally with constant memory. Requires the
+optional ``pyarrow`` package.
+"""
+
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from .exceptions import OSMCPConfigError, OSMCPValidationError
+
+# Record attributes exported ahead of the data columns
+BASE_COLUMNS = {
+    "id": "string",
+    "kind": "string",
+    "version": "integer",
+    "createTime": "string",
+    "modifyTime": "string",
+}
+ARROW_SUFFIXES = {".arrow", ".feather", ".ipc"}
+MAX_SCHEMA_DEPTH = 8
+MAX_REPORTED_DROPPED = 20
+
+
+def _resolve_ref(
+    node: Any, root: dict[str, Any], references: Mapping[str, dict[str, Any]]
+) -> tuple[Any, dict[str, Any]]:
+    """Follow $refs to their target schema node.
+
+    Local ``#/...`` references are looked up in ``root``; references to
+    another schema ID (optionally with a fragment) in that schema's body.
+    Unresolvable references are left as is.
+
+    Returns:
+        Target node and the schema body its own local references point into
+    """
+    seen = 0
+    while isinstance(node, dict) and isinstance(node.get("$ref"), str):
+        if seen > MAX_SCHEMA_DEPTH:
+            break
+        uri, _, fragment = node["$ref"].partition("#")
+        target_root = references.get(uri) if uri else root
+        if not isinstance(target_root, dict):
+            break
+        target: Any = target_root
+        for part in filter(None, fragment.split("/")):
+            part = part.replace("~1", "/").replace("~0", "~")
+            if not isinstance(target, dict) or part not in target:
+                return node, root
+            target = target[part]
+        node, root = target, target_root
+        seen += 1
+    return node, root
+
+
+def _schema_type(node: dict[str, Any]) -> str:
+    """Map a JSON schema node to a column type."""
+    types = node.get("type")
+    if isinstance(types, list):
+        types = next((t for t in types if t != "null"), None)
+    if types in ("string", "integer", "number", "boolean"):
+        return types
+    if types == "object" or any(k in node for k in ("properties", "allOf")):
+        return "object"
+    return "json"
+
+
+def schema_columns(
+    body: dict[str, Any], references: Mapping[str, dict[str, Any]] | None = None
+) -> dict[str, str]:
+    """Derive data columns from a kind's JSON schema.
+
+    Args:
+        body: JSON schema of the kind (with ``properties.data``)
+        references: Bodies of the schemas it references by ID
+
+    Returns:
+        Mapping of flattened ``data.*`` column name to column type
+        (string, integer, number, boolean or json)
+    """
+    columns: dict[str, str] = {}
+    references = references or {}
+
+    def walk(node: Any, prefix: str, depth: int, root: dict[str, Any]) -> None:
+        node, root = _resolve_ref(node, root, references)
+        if not isinstance(node, dict) or depth > MAX_SCHEMA_DEPTH:
+            return
+        for key in ("allOf", "anyOf", "oneOf"):
+            for sub in node.get(key, []):
+                walk(sub, prefix, depth + 1, root)
+        for name, sub in (node.get("properties") or {}).items():
+            sub, sub_root = _resolve_ref(sub, root, references)
+            if not isinstance(sub, dict):
+                continue
+            column = f"{prefix}.{name}"
+            column_type = _schema_type(sub)
+            if column_type == "object" and (
+                sub.get("properties") or sub.get("allOf") or sub.get("$ref")
+            ):
+                walk(sub, column, depth + 1, sub_root)
+            else:
+                columns.setdefault(
+                    column, "json" if column_type == "object" else column_type
+                )
+
+    walk(body.get("properties", {}).get("data"), "data", 0, body)
+    return columns
+
+
+def flatten_record(
+    record: dict[str, Any], columns: dict[str, str] | None = None
+) -> dict[str, Any]:
+    """Flatten a record's data block into dotted column names.
+
+    Args:
+        record: Storage record or search hit
+        columns: Known columns; objects at a known column path are kept
+            whole instead of being expanded
+
+    Returns:
+        Mapping of column name to value (nested objects are expanded, lists
+        are kept as values)
+    """
+    row = {key: record.get(key) for key in BASE_COLUMNS if key in record}
+    known = columns or {}
+
+    def walk(value: Any, prefix: str) -> None:
+        if isinstance(value, dict) and value and prefix not in known:
+            for key, item in value.items():
+                walk(item, f"{prefix}.{key}")
+        else:
+            row[prefix] = value
+
+    data = record.get("data")
+    if isinstance(data, dict):
+        for key, value in data.items():
+            # Search hits may already carry flattened "a.b" keys
+            walk(value, f"data.{key}")
+    return row
+
+
+def _infer_columns(
+    rows: list[dict[str, Any]], known: Mapping[str, str]
+) -> dict[str, str]:
+    """Infer the types of the columns in rows that are not known yet."""
+    seen: dict[str, list[Any]] = {}
+    for row in rows:
+        for key, value in row.items():
+            if key not in known:
+                seen.setdefault(key, []).append(value)
+    return {key: _infer_type(values) for key, values in seen.items()}
+
+
+def _infer_type(values: list[Any]) -> str:
+    """Infer a column type from sample values."""
+    kinds = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            kinds.add("boolean")
+        elif isinstance(value, int):
+            kinds.add("integer")
+        elif isinstance(value, float):
+            kinds.add("number")
+        elif isinstance(value, str):
+            kinds.add("string")
+        else:
+            kinds.add("json")
+    if kinds <= {"integer", "number"} and kinds:
+        return "number" if "number" in kinds else "integer"
+    if len(kinds) == 1:
+        return kinds.pop()
+    return "json" if "json" in kinds else "string"
+
+
+def _convert(value: Any, column_type: str) -> Any:
+    """Convert a value to a column type, None if it does not fit."""
+    if value is None:
+        return None
+    if column_type == "string":
+        return value if isinstance(value, str) else json.dumps(value)
+    if column_type == "json":
+        return json.dumps(value, separators=(",", ":"))
+    if column_type == "boolean":
+        return value if isinstance(value, bool) else None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if column_type == "integer":
+        return int(value) if float(value).is_integer() else None
+    return float(value)
+
+
+class ColumnarWriter:
+    """Write records to a Parquet or Arrow IPC file, one page per row group.
+
+    The output format follows the file suffix: ``.arrow``, ``.feather`` or
+    ``.ipc`` produce an Arrow IPC file, anything else Parquet. Output goes to
+    a ``.partial`` file that :meth:`commit` moves into place.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        columns: dict[str, str] | None = None,
+        overwrite: bool = False,
+        infer_missing: bool = False,
+    ):
+        """Prepare the output file.
+
+        Args:
+            path: Target file
+            columns: Data column types (e.g. from :func:`schema_columns`);
+                inferred from the first page when omitted
+            overwrite: Replace an existing file
+            infer_missing: Add columns inferred from the first page to the
+                given ones (when the schema could not be fully resolved)
+
+        Raises:
+            OSMCPConfigError: If pyarrow is not installed
+            OSMCPValidationError: If the file exists
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise OSMCPConfigError(
+                "pyarrow library not installed. Install with: pip install pyarrow"
+            )
+        if path.exists() and not overwrite:
+            raise OSMCPValidationError(
+                f"{path} already exists. Pass overwrite=true to replace it"
+            )
+
+        self.path = path
+        self.count = 0
+        self.format = "arrow" if path.suffix in ARROW_SUFFIXES else "parquet"
+        self.columns = {**BASE_COLUMNS, **columns} if columns else None
+        self.dropped: set[str] = set()
+        self._infer_missing = infer_missing and columns is not None
+        self._partial = path.with_name(path.name + ".partial")
+        self._schema: Any = None
+        self._writer: Any = None
+        self._sink: Any = None
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Append records as one row group.
+
+        Args:
+            records: Records to write
+        """
+        if not records:
+            return
+
+        import pyarrow as pa
+
+        rows = [flatten_record(r, self.columns) for r in records]
+        if self.columns is None:
+            inferred = _infer_columns(rows, {})
+            self.columns = {
+                **{k: t for k, t in BASE_COLUMNS.items() if k in inferred},
+                **{k: t for k, t in sorted(inferred.items()) if k not in BASE_COLUMNS},
+            }
+        elif self._infer_missing and self._writer is None:
+            inferred = _infer_columns(rows, self.columns)
+            self.columns = {**self.columns, **dict(sorted(inferred.items()))}
+
+        if self._writer is None:
+            self._open(pa)
+
+        for row in rows:
+            self.dropped.update(key for key in row if key not in self.columns)
+
+        arrays = {
+            name: [_convert(row.get(name), column_type) for row in rows]
+            for name, column_type in self.columns.items()
+        }
+        table = pa.Table.from_pydict(arrays, schema=self._schema)
+        if self.format == "arrow":
+            self._writer.write_table(table)
+        else:
+            self._writer.write_table(table, row_group_size=len(rows))
+        self.count += len(records)
+
+    def _open(self, pa: Any) -> None:
+        """Open the underlying writer once the columns are known."""
+        arrow_types = {
+            "string": pa.string(),
+            "json": pa.string(),
+            "integer": pa.int64(),
+            "number": pa.float64(),
+            "boolean": pa.bool_(),
+        }
+        self._schema = pa.schema(
+            [(name, arrow_types[t]) for name, t in self.columns.items()]
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == "arrow":
+            self._sink = pa.OSFile(str(self._partial), "wb")
+            self._writer = pa.ipc.new_file(self._sink, self._schema)
+        else:
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(str(self._partial), self._schema)
+
+    def commit(self) -> None:
+        """Finish the file and move it into place."""
+        if self._writer is None:
+            # Nothing was written: still produce a valid, empty file
+            import pyarrow as pa
+
+            if self.columns is None:
+                self.columns = dict(BASE_COLUMNS)
+            self._open(pa)
+        self._close()
+        self._partial.replace(self.path)
+
+    def abort(self) -> None:
+        """Discard the partially written file."""
+        if self._writer is not None:
+            self._close()
+        self._partial.unlink(missing_ok=True)
+
+    def _close(self) -> None:
+        """Close the writer and its file."""
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+    def dropped_columns(self) -> list[str]:
+        """Data paths that were seen in records but are not columns."""
+        return sorted(self.dropped)[:MAX_REPORTED_DROPPED]
@@ -2,16 +2,183 @@
 
 This module implements environment-first configuration with YAML fallback
 as defined in ADR-003.
+
+Configuration is resolved once into an immutable snapshot: the YAML file is
+read and every OSDU_MCP_* environment variable is parsed when the manager is
+created (or reloaded), so lookups on the request path never touch the
+filesystem or re-parse strings. Settings read on every tool call (server
+URL, data partition and timeouts) are also parsed into typed snapshot fields.
+
+A reload swaps the snapshot seen by ``get()``. Objects that copied settings
+when they were built only see the change if they are rebuilt: the server
+rebuilds the service guards after a reload, while the shared authentication
+handler keeps its credentials and auth settings until the server restarts.
 """
 
+import logging
 import os
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
 from .exceptions import OSMCPConfigError
 
+ENV_PREFIX = "OSDU_MCP_"
+
+# Marks a key that is absent from both the environment and the YAML file
+_MISSING = object()
+
+
+def _logger() -> logging.Logger:
+    """Get this module's logger.
+
+    Imported on use: the logging manager reads its own settings from here.
+    """
+    from .logging_manager import get_logger
+
+    return get_logger(__name__)
+
+
+def _resolve(
+    file_config: Mapping[str, Any],
+    environment: Mapping[str, Any],
+    section: str,
+    key: str,
+) -> Any:
+    """Resolve a value from the sources using environment-first priority.
+
+    Args:
+        file_config: YAML configuration keyed by section
+        environment: Parsed OSDU_MCP_* environment variables keyed by name
+        section: Configuration section
+        key: Configuration key within the section
+
+    Returns:
+        Resolved value, or the module-level missing sentinel
+    """
+    env_var = f"{ENV_PREFIX}{section.upper()}_{key.upper()}"
+    if env_var in environment:
+        return environment[env_var]
+
+    section_config = file_config.get(section)
+    if isinstance(section_config, Mapping) and key in section_config:
+        return section_config[key]
+
+    return _MISSING
+
+
+def _parse_timeouts(
+    file_config: Mapping[str, Any], environment: Mapping[str, Any]
+) -> dict[str, float]:
+    """Parse every setting of the timeouts section into seconds.
+
+    Args:
+        file_config: YAML configuration keyed by section
+        environment: Parsed OSDU_MCP_* environment variables keyed by name
+
+    Returns:
+        Seconds keyed by timeout name; unset and invalid values are left out
+    """
+    section = file_config.get("timeouts")
+    names = set(section) if isinstance(section, Mapping) else set()
+    env_prefix = f"{ENV_PREFIX}TIMEOUTS_"
+    names.update(
+        name.removeprefix(env_prefix).lower()
+        for name in environment
+        if name.startswith(env_prefix)
+    )
+
+    timeouts = {}
+    for name in names:
+        value = _resolve(file_config, environment, "timeouts", name)
+        if value is None or value == "":
+            continue
+        try:
+            timeouts[name] = float(value)
+        except (TypeError, ValueError):
+            _logger().warning(f"Ignoring invalid timeouts.{name} setting: {value!r}")
+    return timeouts
+
+
+def _optional_str(value: Any) -> str | None:
+    """Convert a resolved value to a string, keeping missing values as None."""
+    return None if value is _MISSING or value is None else str(value)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable, pre-parsed view of the configuration sources.
+
+    Attributes:
+        config_file: Path of the YAML file the snapshot was loaded from
+        file_config: Read-only YAML configuration keyed by section
+        environment: Parsed OSDU_MCP_* environment variables keyed by name
+        file_mtime_ns: Modification time of the YAML file (None if absent)
+        server_url: OSDU server URL (server.url)
+        data_partition: Data partition (server.data_partition)
+        timeouts: Seconds keyed by name from the timeouts section (e.g.
+            "tool", "connect", or a tool function name)
+    """
+
+    config_file: Path
+    file_config: Mapping[str, Mapping[str, Any]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    environment: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    file_mtime_ns: int | None = None
+    server_url: str | None = None
+    data_partition: str | None = None
+    timeouts: Mapping[str, float] = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def build(
+        cls,
+        config_file: Path,
+        file_config: Mapping[str, Mapping[str, Any]],
+        environment: Mapping[str, Any],
+        file_mtime_ns: int | None,
+    ) -> "ConfigSnapshot":
+        """Create a snapshot and parse its typed settings.
+
+        Args:
+            config_file: Path of the YAML file the sources were loaded from
+            file_config: Read-only YAML configuration keyed by section
+            environment: Parsed OSDU_MCP_* environment variables keyed by name
+            file_mtime_ns: Modification time of the YAML file (None if absent)
+
+        Returns:
+            Snapshot with every typed field resolved
+        """
+        return cls(
+            config_file=config_file,
+            file_config=file_config,
+            environment=environment,
+            file_mtime_ns=file_mtime_ns,
+            server_url=_optional_str(
+                _resolve(file_config, environment, "server", "url")
+            ),
+            data_partition=_optional_str(
+                _resolve(file_config, environment, "server", "data_partition")
+            ),
+            timeouts=MappingProxyType(_parse_timeouts(file_config, environment)),
+        )
+
+    def lookup(self, section: str, key: str) -> Any:
+        """Resolve a value using environment-first priority.
+
+        Args:
+            section: Configuration section
+            key: Configuration key within the section
+
+        Returns:
+            Resolved value, or the module-level missing sentinel
+        """
+        return _resolve(self.file_config, self.environment, section, key)
+
 
 class ConfigManager:
     """Environment-first configuration with YAML fallback."""
@@ -24,7 +191,12 @@ class ConfigManager:
         """
         self.config_file = config_file or Path("config.yaml")
         self._file_config: dict[str, Any] | None = None
-        self._load_file_config()
+        self._snapshot = self._build_snapshot()
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The immutable configuration snapshot currently in effect."""
+        return self._snapshot
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get configuration value with environment variable priority.
@@ -34,6 +206,9 @@ class ConfigManager:
         2. YAML configuration file
         3. Default value
 
+        Values are looked up in the current snapshot, whose sources were
+        read and parsed when it was built.
+
         Args:
             section: Configuration section (e.g., "server", "auth")
             key: Configuration key within the section
@@ -42,22 +217,8 @@ class ConfigManager:
         Returns:
             Configuration value from highest priority source
         """
-        # Build environment variable name
-        env_var = f"OSDU_MCP_{section.upper()}_{key.upper()}"
-
-        # Check environment variable first (highest priority)
-        env_value = os.environ.get(env_var)
-        if env_value is not None:
-            return self._parse_env_value(env_value)
-
-        # Check YAML configuration (second priority)
-        if self._file_config:
-            section_config = self._file_config.get(section, {})
-            if key in section_config:
-                return section_config[key]
-
-        # Return default value (lowest priority)
-        return default
+        value = self._snapshot.lookup(section, key)
+        return default if value is _MISSING else value
 
     def get_required(self, section: str, key: str) -> Any:
         """Get required configuration value.
@@ -74,13 +235,93 @@ class ConfigManager:
         """
         value = self.get(section, key)
         if value is None:
-            env_var = f"OSDU_MCP_{section.upper()}_{key.upper()}"
+            env_var = f"{ENV_PREFIX}{section.upper()}_{key.upper()}"
             raise OSMCPConfigError(
                 f"Required configuration '{section}.{key}' not found. "
                 f"Set environment variable {env_var} or add to config.yaml"
             )
         return value
 
+    def reload(self) -> bool:
+        """Re-read the YAML file and environment into a new snapshot.
+
+        The snapshot is swapped atomically; callers holding the previous
+        snapshot keep a consistent view.
+
+        Returns:
+            True if the resolved configuration changed
+
+        Raises:
+            OSMCPConfigError: If the configuration file cannot be parsed
+        """
+        previous = self._snapshot
+        snapshot = self._build_snapshot()
+        self._snapshot = snapshot
+
+        changed = (
+            snapshot.file_config != previous.file_config
+            or snapshot.environment != previous.environment
+        )
+        _logger().info(
+            "Configuration reloaded",
+            extra={"config_file": str(self.config_file), "changed": changed},
+        )
+        return changed
+
+    def reload_if_changed(self) -> bool:
+        """Reload the snapshot if the YAML file's modification time changed.
+
+        Returns:
+            True if a reload happened
+        """
+        if self._file_mtime_ns() == self._snapshot.file_mtime_ns:
+            return False
+
+        self.reload()
+        return True
+
+    def _build_snapshot(self) -> ConfigSnapshot:
+        """Load every configuration source into an immutable snapshot.
+
+        Returns:
+            Freshly resolved configuration snapshot
+        """
+        mtime_ns = self._file_mtime_ns()
+        file_config = self._load_file_config() or {}
+
+        environment = {
+            name: self._parse_env_value(value)
+            for name, value in os.environ.items()
+            if name.startswith(ENV_PREFIX)
+        }
+
+        return ConfigSnapshot.build(
+            config_file=self.config_file,
+            file_config=MappingProxyType(
+                {
+                    section: (
+                        MappingProxyType(dict(values))
+                        if isinstance(values, dict)
+                        else values
+                    )
+                    for section, values in file_config.items()
+                }
+            ),
+            environment=MappingProxyType(environment),
+            file_mtime_ns=mtime_ns,
+        )
+
+    def _file_mtime_ns(self) -> int | None:
+        """Get the YAML file's modification time.
+
+        Returns:
+            Modification time in nanoseconds, or None if the file is absent
+        """
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _load_file_config(self) -> dict | None:
         """Load configuration from YAML file if it exists.
 
@@ -94,6 +335,7 @@ class ConfigManager:
                     return self._file_config
             except Exception as e:
                 raise OSMCPConfigError(f"Failed to load config file: {e}")
+        self._file_config = None
         return None
 
     def _parse_env_value(self, value: str) -> Any:
@@ -128,18 +370,92 @@ class ConfigManager:
         Returns:
             Dictionary of all configuration values
         """
+        snapshot = self._snapshot
+
         # Start with file config as base
-        all_config = self._file_config.copy() if self._file_config else {}
+        all_config: dict[str, Any] = {
+            section: dict(values) if isinstance(values, Mapping) else values
+            for section, values in snapshot.file_config.items()
+        }
 
         # Override with any environment variables
-        for key, value in os.environ.items():
-            if key.startswith("OSDU_MCP_"):
-                parts = key.split("_", 3)
-                if len(parts) >= 4:
-                    section = parts[2].lower()
-                    config_key = parts[3].lower()
-                    if section not in all_config:
-                        all_config[section] = {}
-                    all_config[section][config_key] = self._parse_env_value(value)
+        for key, value in snapshot.environment.items():
+            parts = key.split("_", 3)
+            if len(parts) >= 4:
+                section = parts[2].lower()
+                config_key = parts[3].lower()
+                if section not in all_config:
+                    all_config[section] = {}
+                all_config[section][config_key] = value
 
         return all_config
+
+
+def parse_setting(
+    config: ConfigManager,
+    section: str,
+    key: str,
+    parse: Callable[[Any], Any],
+    default: Any,
+) -> Any:
+    """Read and parse a setting, keeping the default if it is unset or invalid.
+
+    Args:
+        config: Configuration manager instance
+        section: Configuration section
+        key: Configuration key
+        parse: Conversion applied to the configured value (e.g. int)
+        default: Value used when the setting is missing or cannot be parsed
+
+    Returns:
+        Parsed setting value
+    """
+    value = config.get(section, key, default)
+    if value is None or value == "":
+        return default
+    try:
+        return parse(value)
+    except (TypeError, ValueError):
+        _logger().warning(f"Ignoring invalid {section}.{key} setting: {value!r}")
+        return default
+
+
+# Shared configuration for the process lifetime
+_shared_config: ConfigManager | None = None
+
+
+def get_config() -> ConfigManager:
+    """Get the process-wide configuration manager.
+
+    The configuration is resolved on first use and shared by every tool and
+    client afterwards. Use ``reload_config()`` to pick up changes.
+
+    Returns:
+        Shared configuration manager
+    """
+    global _shared_config
+    if _shared_config is None:
+        _shared_config = ConfigManager()
+    return _shared_config
+
+
+def reload_config() -> bool:
+    """Reload the shared configuration (e.g., on SIGHUP).
+
+    Errors are logged rather than raised so that a bad edit to config.yaml
+    leaves the previous snapshot in effect.
+
+    Returns:
+        True if the resolved configuration changed
+    """
+    try:
+        return get_config().reload()
+    except OSMCPConfigError as e:
+        _logger().error(f"Configuration reload failed, keeping previous values: {e}")
+        return False
+
+
+def reset_config() -> None:
+    """Discard the shared configuration so the next access re-resolves it."""
+    global _shared_config
+    _shared_config = None
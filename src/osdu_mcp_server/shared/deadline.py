@@ -0,0 +1,163 @@
+"""Per-tool deadlines and per-phase HTTP timeouts.
+
+A deadline starts when a tool is called and is carried in a context
+variable, so it reaches every request the tool makes, including retries,
+concurrent batches (asyncio.gather/create_task copy the context) and
+paginated loops. Each request is capped at the time remaining, and no
+request is started once the deadline has passed.
+
+Configuration (``timeouts`` section):
+- OSDU_MCP_TIMEOUTS_TOOL: Seconds a tool call may take (default: 300, 0 disables)
+- OSDU_MCP_TIMEOUTS_<TOOL_NAME>: Override for one tool, e.g.
+  OSDU_MCP_TIMEOUTS_STORAGE_EXPORT_NDJSON
+- OSDU_MCP_TIMEOUTS_CONNECT: Seconds to obtain a connection (default: 10)
+- OSDU_MCP_TIMEOUTS_SOCK_READ: Seconds between reads (default: server.timeout)
+- OSDU_MCP_TIMEOUTS_TOTAL: Seconds per request attempt (default: server.timeout)
+- OSDU_MCP_TIMEOUTS_<SERVICE>_<PHASE>: Override for one service, e.g.
+  OSDU_MCP_TIMEOUTS_SEARCH_TOTAL
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from aiohttp import ClientTimeout
+
+from .config_manager import ConfigManager, get_config, parse_setting
+from .exceptions import OSMCPTimeoutError
+from .service_urls import OSMCPService
+
+DEFAULT_TOOL_TIMEOUT = 300.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_REQUEST_TIMEOUT = 30.0
+
+# Monotonic time by which the current tool call must finish
+_deadline: ContextVar[float | None] = ContextVar("osdu_mcp_deadline", default=None)
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline.
+
+    Returns:
+        Remaining seconds (may be negative), or None if there is no deadline
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def check_deadline(operation: str) -> float | None:
+    """Fail if the current deadline has passed.
+
+    Args:
+        operation: What was about to start, for the error message
+
+    Returns:
+        Remaining seconds, or None if there is no deadline
+
+    Raises:
+        OSMCPTimeoutError: If the deadline has passed
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise OSMCPTimeoutError(f"Deadline exceeded before {operation}")
+    return left
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[None]:
+    """Run a block under a deadline.
+
+    A scope never extends an enclosing deadline, only shortens it.
+
+    Args:
+        seconds: Time budget for the block, or None for no additional limit
+    """
+    current = _deadline.get()
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    if current is not None:
+        deadline = min(current, deadline)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def tool_timeout(config: ConfigManager, tool_name: str) -> float | None:
+    """Resolve the time budget of a tool.
+
+    Args:
+        config: Configuration manager instance
+        tool_name: Tool function name
+
+    Returns:
+        Seconds the tool may take, or None if unlimited
+    """
+    timeouts = config.snapshot.timeouts
+    seconds = timeouts.get(tool_name, timeouts.get("tool", DEFAULT_TOOL_TIMEOUT))
+    return seconds if seconds and seconds > 0 else None
+
+
+@contextmanager
+def tool_deadline(tool_name: str) -> Iterator[None]:
+    """Start the deadline of a tool call.
+
+    Args:
+        tool_name: Tool function name
+    """
+    with deadline_scope(tool_timeout(get_config(), tool_name)):
+        yield
+
+
+def phase_timeouts(
+    config: ConfigManager, service: OSMCPService | None, request_timeout: float
+) -> ClientTimeout:
+    """Resolve connect, socket read and total timeouts for a service.
+
+    Args:
+        config: Configuration manager instance
+        service: Service the request is for, or None
+        request_timeout: Default for the read and total timeouts
+            (server.timeout)
+
+    Returns:
+        aiohttp timeout settings (0 disables a phase)
+    """
+
+    def phase(name: str, default: float) -> float | None:
+        value = parse_setting(config, "timeouts", name, float, default)
+        if service is not None:
+            value = parse_setting(
+                config, "timeouts", f"{service.value}_{name}", float, value
+            )
+        return value or None
+
+    return ClientTimeout(
+        total=phase("total", request_timeout),
+        connect=phase("connect", DEFAULT_CONNECT_TIMEOUT),
+        sock_read=phase("sock_read", request_timeout),
+    )
+
+
+def cap_timeout(timeout: ClientTimeout, left: float | None) -> ClientTimeout:
+    """Shorten a timeout so a request cannot outlive the deadline.
+
+    Args:
+        timeout: Timeout settings for the request
+        left: Seconds left before the deadline, or None
+
+    Returns:
+        Timeout settings with the total capped at the time left
+    """
+    if left is None or (timeout.total is not None and timeout.total <= left):
+        return timeout
+    return ClientTimeout(
+        total=left,
+        connect=timeout.connect,
+        sock_read=timeout.sock_read,
+        sock_connect=timeout.sock_connect,
+    )
@@ -44,6 +44,12 @@ class OSMCPConnectionError(OSMCPError):
     pass
 
 
+class OSMCPTimeoutError(OSMCPConnectionError):
+    """Deadline or timeout exceeded."""
+
+    pass
+
+
 class OSMCPValidationError(OSMCPError):
     """Input validation errors."""
 
@@ -76,8 +82,12 @@ def handle_osdu_exceptions(
     ) -> Callable[..., Coroutine[Any, Any, Any]]:
         @wraps(wrapped_func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Imported here: the deadline module depends on configuration
+            from .deadline import tool_deadline
+
             try:
-                return await wrapped_func(*args, **kwargs)
+                with tool_deadline(wrapped_func.__name__):
+                    return await wrapped_func(*args, **kwargs)
             except OSMCPAuthError as e:
                 raise McpError(
                     ErrorData(code=401, message=f"Authentication error: {str(e)}")
@@ -92,6 +102,8 @@ def handle_osdu_exceptions(
                 raise McpError(
                     ErrorData(code=400, message=f"Configuration error: {str(e)}")
                 )
+            except OSMCPTimeoutError as e:
+                raise McpError(ErrorData(code=504, message=f"Timeout: {str(e)}"))
             except OSMCPConnectionError as e:
                 raise McpError(
                     ErrorData(code=503, message=f"Connection error: {str(e)}")
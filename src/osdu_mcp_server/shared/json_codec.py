@@ -0,0 +1,94 @@
+"""JSON encoding and decoding for OSDU payloads.
+
+Large search and storage responses spend most of their time in JSON
+parsing, so orjson is used when it is installed
+(``pip install osdu-mcp-server[fast-json]``). The standard library is the
+fallback, and is also used for the rare values orjson cannot encode
+(integers beyond 64 bits).
+
+Configuration:
+- OSDU_MCP_SERVER_JSON_CODEC: "auto" to prefer orjson (default) or "json"
+  to always use the standard library
+"""
+
+import json
+import re
+from typing import Any
+
+from .config_manager import ConfigManager, get_config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Content types aiohttp's response.json() accepts (application/json and
+# application/<subtype>+json)
+_JSON_CONTENT_TYPE = re.compile(r"^application/(?:[\w.+-]+?\+)?json")
+
+
+class JsonCodec:
+    """Standard library JSON codec."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def dumps_str(self, obj: Any) -> str:
+        """Encode a value as compact JSON text (aiohttp's json_serialize)."""
+        return self.dumps(obj).decode()
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON from bytes or text."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson codec with a standard library fallback for encoding."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON from bytes or text."""
+        return orjson.loads(data)
+
+
+_STDLIB = JsonCodec()
+_ORJSON = OrjsonCodec() if orjson is not None else None
+
+
+def get_json_codec(config: ConfigManager | None = None) -> JsonCodec:
+    """Get the configured JSON codec.
+
+    Args:
+        config: Configuration manager instance (if None, the shared one is used)
+
+    Returns:
+        orjson codec when installed and not disabled, else the stdlib codec
+    """
+    if _ORJSON is None:
+        return _STDLIB
+    config = config or get_config()
+    choice = config.get("server", "json_codec", "auto")
+    return _STDLIB if str(choice).lower() == "json" else _ORJSON
+
+
+def is_json_content_type(content_type: str) -> bool:
+    """Check whether a response content type carries JSON.
+
+    Args:
+        content_type: Media type without parameters (e.g. response.content_type)
+
+    Returns:
+        True for application/json and application/*+json
+    """
+    return bool(_JSON_CONTENT_TYPE.match(content_type.lower()))
@@ -0,0 +1,51 @@
+"""Minimal RFC 6902 JSON Patch generation.
+
+Used to return record history as compact diffs between versions. Objects
+are compared key by key; arrays of equal length are compared element by
+element, anything else that differs is replaced whole.
+"""
+
+from typing import Any
+
+
+def _pointer(path: str, token: str | int) -> str:
+    """Append a reference token to a JSON Pointer (RFC 6901)."""
+    token = str(token).replace("~", "~0").replace("/", "~1")
+    return f"{path}/{token}"
+
+
+def diff_json(source: Any, target: Any, path: str = "") -> list[dict[str, Any]]:
+    """Build a JSON Patch that turns source into target.
+
+    Args:
+        source: Original JSON value
+        target: Updated JSON value
+        path: JSON Pointer of the values being compared
+
+    Returns:
+        List of add, remove and replace operations
+    """
+    if type(source) is not type(target):
+        return [{"op": "replace", "path": path, "value": target}]
+
+    if isinstance(source, dict):
+        ops: list[dict[str, Any]] = []
+        for key in source:
+            if key not in target:
+                ops.append({"op": "remove", "path": _pointer(path, key)})
+        for key, value in target.items():
+            if key not in source:
+                ops.append({"op": "add", "path": _pointer(path, key), "value": value})
+            else:
+                ops.extend(diff_json(source[key], value, _pointer(path, key)))
+        return ops
+
+    if isinstance(source, list) and len(source) == len(target):
+        ops = []
+        for i, (old, new) in enumerate(zip(source, target, strict=True)):
+            ops.extend(diff_json(old, new, _pointer(path, i)))
+        return ops
+
+    if source != target:
+        return [{"op": "replace", "path": path, "value": target}]
+    return []
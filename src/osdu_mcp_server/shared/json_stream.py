@@ -0,0 +1,109 @@
+"""Incremental parsing of large JSON responses.
+
+Search and Storage responses carry their payload in one top-level array
+("results" or "records"). Parsing the body while it arrives lets callers
+handle the first hits before the last ones have been received, and holds
+one item at a time instead of the whole response. ijson is used when it is
+installed (``pip install osdu-mcp-server[streaming]``); otherwise responses
+are buffered and decoded with the JSON codec.
+
+Configuration:
+- OSDU_MCP_SERVER_STREAM_RESPONSES: Parse array responses incrementally
+  (default: true)
+"""
+
+from collections.abc import AsyncIterator
+from typing import Any, Protocol
+
+from .config_manager import ConfigManager
+from .exceptions import OSMCPAPIError
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
+
+_CONTAINER_START = frozenset({"start_map", "start_array"})
+_CONTAINER_END = frozenset({"end_map", "end_array"})
+
+
+class AsyncByteStream(Protocol):
+    """Byte source accepted by :func:`iter_array_items`."""
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read up to n bytes (b"" at the end of the stream)."""
+        ...
+
+
+def streaming_enabled(config: ConfigManager) -> bool:
+    """Check whether array responses are parsed incrementally.
+
+    Args:
+        config: Configuration manager instance
+
+    Returns:
+        True if ijson is installed and streaming is not disabled
+    """
+    if ijson is None:
+        return False
+    value = config.get("server", "stream_responses", True)
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes", "on")
+    return value is not False
+
+
+async def iter_array_items(
+    stream: AsyncByteStream, key: str, meta: dict[str, Any] | None = None
+) -> AsyncIterator[Any]:
+    """Yield the items of a top-level array as they are decoded.
+
+    Args:
+        stream: JSON object body (e.g. an aiohttp response's content)
+        key: Name of the top-level array
+        meta: Filled with the document's other top-level values (e.g.
+            "cursor", "totalCount"); complete once the iterator is exhausted
+
+    Yields:
+        Array items in document order
+
+    Raises:
+        OSMCPAPIError: If the body is not valid JSON
+    """
+    item_prefix = f"{key}.item"
+    builder = None
+    name: str | None = None
+    depth = 0
+    try:
+        async for prefix, event, value in ijson.parse_async(stream, use_float=True):
+            if builder is None:
+                if prefix == item_prefix:
+                    name = None
+                elif meta is not None and prefix and prefix != key:
+                    if "." in prefix:
+                        # Dotted top-level keys are ambiguous in ijson prefixes
+                        continue
+                    name = prefix
+                else:
+                    continue
+
+                if event not in _CONTAINER_START:
+                    if name is None:
+                        yield value
+                    else:
+                        meta[name] = value
+                    continue
+                builder = ijson.ObjectBuilder()
+
+            builder.event(event, value)
+            if event in _CONTAINER_START:
+                depth += 1
+            elif event in _CONTAINER_END:
+                depth -= 1
+                if depth == 0:
+                    if name is None:
+                        yield builder.value
+                    else:
+                        meta[name] = builder.value
+                    builder = None
+    except ijson.JSONError as e:
+        raise OSMCPAPIError(f"Invalid JSON response: {e}") from e
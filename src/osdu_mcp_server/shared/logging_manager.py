@@ -22,9 +22,19 @@ class LoggingManager:
         Args:
             config: Configuration manager instance (if None, one will be created)
         """
-        self.config = config or ConfigManager()
+        self._config = config
         self._initialized = False
 
+    @property
+    def config(self) -> ConfigManager:
+        """Configuration the logging settings are read from.
+
+        Created on first use: loading it may itself log a warning.
+        """
+        if self._config is None:
+            self._config = ConfigManager()
+        return self._config
+
     def configure(self) -> None:
         """Configure logging system according to settings.
 
@@ -34,6 +44,9 @@ class LoggingManager:
         """
         if self._initialized:
             return
+        # Set first so that loggers requested while the configuration loads
+        # do not configure again
+        self._initialized = True
 
         # Check if we're running in a test environment
         is_test = "pytest" in sys.modules
@@ -67,9 +80,6 @@ class LoggingManager:
             # If logging is disabled, set logger to ERROR level
             logger.setLevel(logging.ERROR)
 
-        # Mark as initialized
-        self._initialized = True
-
     def get_logger(self, name: str) -> logging.Logger:
         """Get a configured logger instance.
 
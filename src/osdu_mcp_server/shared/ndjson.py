@@ -0,0 +1,211 @@
+"""Incremental NDJSON file reading and writing for record transfer.
+
+Records move between OSDU and local files one chunk at a time so that large
+migrations never hold a full data set in memory or inside an MCP message.
+Files ending in ``.gz`` are written gzip-compressed; gzip input is detected
+from the file contents regardless of its name.
+
+Exports only write inside the export directory, and replacing an existing
+file requires write mode.
+
+Configuration:
+- OSDU_MCP_STORAGE_EXPORT_DIR: Directory export files are written to
+  (default: ~/osdu-mcp-server/exports)
+"""
+
+import gzip
+import os
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, Any
+
+from .config_manager import ConfigManager
+from .exceptions import OSMCPAPIError, OSMCPValidationError
+from .json_codec import get_json_codec
+
+GZIP_MAGIC = b"\x1f\x8b"
+DEFAULT_EXPORT_DIR = Path.home() / "osdu-mcp-server" / "exports"
+
+
+def resolve_path(file_path: str) -> Path:
+    """Expand a user-supplied file path.
+
+    Args:
+        file_path: Path, optionally starting with ``~``
+
+    Returns:
+        Absolute path
+    """
+    return Path(file_path).expanduser().resolve()
+
+
+def resolve_export_path(
+    config: ConfigManager, file_path: str, overwrite: bool = False
+) -> Path:
+    """Resolve an export target inside the export directory.
+
+    Relative paths are taken relative to the export directory. Absolute
+    paths, ``..`` components and symlinks must still end up inside it.
+
+    Args:
+        config: Configuration manager instance
+        file_path: Requested output path
+        overwrite: Whether an existing file may be replaced
+
+    Returns:
+        Absolute path inside the export directory
+
+    Raises:
+        OSMCPValidationError: If the path is outside the export directory
+        OSMCPAPIError: If overwrite is requested while write mode is disabled
+    """
+    root = (
+        Path(config.get("storage", "export_dir", None) or DEFAULT_EXPORT_DIR)
+        .expanduser()
+        .resolve()
+    )
+    path = (root / Path(file_path).expanduser()).resolve()
+    if path == root or not path.is_relative_to(root):
+        raise OSMCPValidationError(
+            f"{file_path} is not a file inside the export directory {root}. "
+            "Set OSDU_MCP_STORAGE_EXPORT_DIR to export elsewhere"
+        )
+
+    if overwrite and (
+        os.environ.get("OSDU_MCP_ENABLE_WRITE_MODE", "false").lower() != "true"
+    ):
+        raise OSMCPAPIError(
+            "Replacing export files is disabled. Set OSDU_MCP_ENABLE_WRITE_MODE=true "
+            "to allow overwrite=true",
+            status_code=403,
+        )
+    return path
+
+
+class NdjsonReader:
+    """Read JSON objects from an NDJSON file in chunks."""
+
+    def __init__(self, path: Path):
+        """Open an NDJSON file for reading.
+
+        Args:
+            path: File to read (plain or gzip-compressed)
+
+        Raises:
+            OSMCPValidationError: If the file cannot be opened
+        """
+        self.path = path
+        self.line_number = 0
+        self._file: IO[bytes] | gzip.GzipFile
+        try:
+            with open(path, "rb") as probe:
+                compressed = probe.read(2) == GZIP_MAGIC
+            with ExitStack() as stack:
+                if compressed:
+                    self._file = stack.enter_context(gzip.open(path, "rb"))
+                else:
+                    self._file = stack.enter_context(open(path, "rb"))
+                # Keep the file open until close()
+                self._stack = stack.pop_all()
+        except OSError as e:
+            raise OSMCPValidationError(f"Cannot read {path}: {e}")
+        self._json = get_json_codec()
+
+    def read_chunk(
+        self, size: int
+    ) -> tuple[list[tuple[int, dict[str, Any]]], list[tuple[int, str]]]:
+        """Read up to ``size`` non-blank lines.
+
+        Args:
+            size: Maximum number of lines to read
+
+        Returns:
+            Tuple of (line number, record) pairs and (line number, error)
+            pairs for lines that are not JSON objects. Both are empty once the
+            file is exhausted.
+        """
+        records: list[tuple[int, dict[str, Any]]] = []
+        errors: list[tuple[int, str]] = []
+        while len(records) + len(errors) < size:
+            line = self._file.readline()
+            if not line:
+                break
+            self.line_number += 1
+            if not line.strip():
+                continue
+            try:
+                record = self._json.loads(line)
+            except ValueError as e:
+                errors.append((self.line_number, f"Invalid JSON: {e}"))
+                continue
+            if isinstance(record, dict):
+                records.append((self.line_number, record))
+            else:
+                errors.append((self.line_number, "Line is not a JSON object"))
+        return records, errors
+
+    def close(self) -> None:
+        """Close the file."""
+        self._stack.close()
+
+
+class NdjsonWriter:
+    """Write JSON objects to an NDJSON file, replacing it atomically.
+
+    Output goes to a ``.partial`` file next to the target and is moved into
+    place by :meth:`commit`, so an interrupted export never leaves a
+    truncated file under the requested name.
+    """
+
+    def __init__(self, path: Path, overwrite: bool = False):
+        """Create the output file.
+
+        Args:
+            path: Target file (gzip-compressed if it ends in ``.gz``)
+            overwrite: Replace an existing file
+
+        Raises:
+            OSMCPValidationError: If the file exists or cannot be created
+        """
+        if path.exists() and not overwrite:
+            raise OSMCPValidationError(
+                f"{path} already exists. Pass overwrite=true to replace it"
+            )
+
+        self.path = path
+        self.count = 0
+        self._partial = path.with_name(path.name + ".partial")
+        self._file: IO[bytes] | gzip.GzipFile
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with ExitStack() as stack:
+                if path.suffix == ".gz":
+                    self._file = stack.enter_context(gzip.open(self._partial, "wb"))
+                else:
+                    self._file = stack.enter_context(open(self._partial, "wb"))
+                # Keep the file open until commit() or abort()
+                self._stack = stack.pop_all()
+        except OSError as e:
+            raise OSMCPValidationError(f"Cannot write {path}: {e}")
+        self._json = get_json_codec()
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Append records, one JSON document per line.
+
+        Args:
+            records: Records to write
+        """
+        if records:
+            dumps = self._json.dumps
+            self._file.write(b"".join(dumps(r) + b"\n" for r in records))
+            self.count += len(records)
+
+    def commit(self) -> None:
+        """Finish the file and move it into place."""
+        self._stack.close()
+        os.replace(self._partial, self.path)
+
+    def abort(self) -> None:
+        """Discard the partially written file."""
+        self._stack.close()
+        self._partial.unlink(missing_ok=True)
@@ -1,10 +1,18 @@
 """HTTP client for OSDU API interactions.
 
 This module implements an async HTTP client with connection pooling
-and retry logic as defined in ADR-005.
+and retry logic as defined in ADR-005; retry decisions are made by the
+retry policy, and requests to a service pass through its circuit breaker
+and adaptive concurrency limit. Timeouts are set per phase and service, and
+no request outlives the deadline of the tool call that made it. Array
+responses can be streamed item by item. While the server lifespan is running,
+clients borrow a shared keep-alive session from the session registry.
 """
 
 import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 from urllib.parse import urljoin
 
@@ -12,8 +20,29 @@ import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 
 from .auth_handler import AuthHandler
-from .config_manager import ConfigManager
-from .exceptions import OSMCPAPIError, OSMCPConnectionError
+from .config_manager import ConfigManager, parse_setting
+from .deadline import (
+    DEFAULT_REQUEST_TIMEOUT,
+    cap_timeout,
+    check_deadline,
+    phase_timeouts,
+    remaining,
+)
+from .exceptions import (
+    OSMCPAPIError,
+    OSMCPConnectionError,
+    OSMCPError,
+    OSMCPTimeoutError,
+)
+from .json_codec import get_json_codec, is_json_content_type
+from .json_stream import iter_array_items, streaming_enabled
+from .logging_manager import get_logger
+from .retry_policy import RetryPolicy, parse_retry_after
+from .service_guard import ServiceGuard, get_service_guard
+from .service_urls import OSMCPService
+from .session_registry import get_session_registry
+
+logger = get_logger(__name__)
 
 
 class OsduClient:
@@ -29,19 +58,38 @@ class OsduClient:
         self.config = config
         self.auth_handler = auth_handler
         self._session: ClientSession | None = None
+        self._owns_session = True
         self._base_url = config.get_required("server", "url")
         self._data_partition = config.get_required("server", "data_partition")
-        self._timeout = config.get("server", "timeout", 30)
+        self._timeout = parse_setting(
+            config, "server", "timeout", float, DEFAULT_REQUEST_TIMEOUT
+        )
+        self._retry_policy = RetryPolicy.from_config(config)
+        self._json = get_json_codec(config)
+        self._stream = streaming_enabled(config)
+        # Set by service clients so requests share the service's guard
+        self._service: OSMCPService | None = None
 
     async def _ensure_session(self) -> ClientSession:
         """Ensure HTTP session is created.
 
+        Uses the shared pooled session for this base URL when the session
+        registry is active, otherwise creates a session owned by this client.
+
         Returns:
             Active aiohttp session
         """
         if self._session is None or self._session.closed:
-            timeout = ClientTimeout(total=self._timeout)
-            self._session = ClientSession(timeout=timeout)
+            registry = get_session_registry()
+            if registry.active:
+                self._session = await registry.get_session(self._base_url)
+                self._owns_session = False
+            else:
+                timeout = ClientTimeout(total=self._timeout)
+                self._session = ClientSession(
+                    timeout=timeout, json_serialize=self._json.dumps_str
+                )
+                self._owns_session = True
         return self._session
 
     async def _make_request(
@@ -50,21 +98,96 @@ class OsduClient:
         path: str,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """Make HTTP request with retry logic.
+        """Make HTTP request with retries according to the retry policy.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API path
-            **kwargs: Additional request parameters
+            **kwargs: Additional request parameters; ``idempotent=True``
+                marks a POST as safe to repeat (e.g. read-only queries)
 
         Returns:
             Response data as dictionary
 
+        Raises:
+            OSMCPAPIError: For API errors
+            OSMCPConnectionError: For connection errors
+        """
+        async with self._open_response(method, path, True, **kwargs) as response:
+            return await self._read_body(response)
+
+    async def stream_items(
+        self,
+        method: str,
+        path: str,
+        key: str = "results",
+        meta: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Make HTTP request and yield the items of a top-level array.
+
+        Items are decoded while the body arrives when streaming is enabled,
+        so only one of them is held in memory at a time. Failures before the
+        body starts are retried as in _make_request; a connection lost
+        mid-stream is not, because items have already been handed out.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            key: Name of the top-level array (e.g. "results", "records")
+            meta: Filled with the response's other top-level values (e.g.
+                "cursor"); complete once the iterator is exhausted
+            **kwargs: Additional request parameters, as for _make_request
+
+        Yields:
+            Array items in response order
+
+        Raises:
+            OSMCPAPIError: For API errors
+            OSMCPConnectionError: For connection errors
+        """
+        async with self._open_response(method, path, False, **kwargs) as response:
+            if self._stream and is_json_content_type(response.content_type):
+                async for item in iter_array_items(response.content, key, meta):
+                    yield item
+                return
+
+            body = await self._read_body(response)
+            if not isinstance(body, dict):
+                return
+            items = body.pop(key, None) or []
+            if meta is not None:
+                meta.update(body)
+            for item in items:
+                yield item
+
+    @asynccontextmanager
+    async def _open_response(
+        self,
+        method: str,
+        path: str,
+        buffer: bool,
+        **kwargs: Any,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a request, retrying until it gets a successful response.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            buffer: Read the body before returning, so errors while
+                receiving it are retried as well
+            **kwargs: Additional request parameters, as for _make_request
+
+        Yields:
+            Response with a success status; it is released and the service
+            guard slot freed when the block exits
+
         Raises:
             OSMCPAPIError: For API errors
             OSMCPConnectionError: For connection errors
         """
         url = urljoin(self._base_url, path)
+        idempotent = kwargs.pop("idempotent", None)
         session = await self._ensure_session()
 
         # Set up headers
@@ -76,41 +199,170 @@ class OsduClient:
         headers["Content-Type"] = "application/json"
         kwargs["headers"] = headers
 
-        # Retry logic with exponential backoff
-        max_retries = 3
-        base_delay = 1  # seconds
+        # Shared sessions are not bound to this client's timeout
+        timeout = kwargs.pop("timeout", None) or phase_timeouts(
+            self.config, self._service, self._timeout
+        )
 
-        for attempt in range(max_retries):
+        policy = self._retry_policy
+        deadline = time.monotonic() + policy.budget
+        # The tool's deadline also bounds retries
+        left = remaining()
+        if left is not None:
+            deadline = min(deadline, time.monotonic() + left)
+        attempt = 0
+
+        guard = self._service_guard()
+
+        while True:
+            probe = await self._acquire_guard(guard, method, path)
+            started = time.monotonic()
+            latency: float | None = None
+            status: int | None = None
+            failed = False
+            # Set once the response is handed to the caller; from then on
+            # errors belong to the caller's read and are not retried
+            handed_out = False
             try:
-                async with session.request(method, url, **kwargs) as response:
+                # Inside the try so the guard slot (and a half-open probe) is
+                # released if the deadline passed while waiting for it
+                left = check_deadline(f"{method} {path}")
+                async with session.request(
+                    method, url, timeout=cap_timeout(timeout, left), **kwargs
+                ) as response:
+                    status = response.status
                     if response.status >= 400:
                         error_text = await response.text()
-                        raise OSMCPAPIError(
+                        error = OSMCPAPIError(
                             f"Request failed: {error_text}", response.status
                         )
-
-                    # Return JSON response
-                    try:
-                        return await response.json()
-                    except Exception:
-                        # Handle non-JSON responses (e.g., plain text)
-                        text = await response.text()
-                        return {"response": text}
-
-            except aiohttp.ClientError as e:
-                if attempt == max_retries - 1:
-                    raise OSMCPConnectionError(f"Connection error: {e}")
-
-                # Exponential backoff
-                delay = base_delay * (2**attempt)
-                await asyncio.sleep(delay)
+                        if not policy.should_retry(
+                            method, attempt, response.status, idempotent
+                        ):
+                            raise error
+                        delay = policy.backoff(
+                            attempt,
+                            parse_retry_after(response.headers.get("Retry-After")),
+                        )
+                    else:
+                        if buffer:
+                            await response.read()
+                        # Time spent by the caller on a stream is not latency
+                        latency = time.monotonic() - started
+                        handed_out = True
+                        yield response
+                        return
+
+            except (aiohttp.ClientError, TimeoutError) as e:
+                failed = True
+                left = remaining()
+                if left is not None and left <= 0:
+                    raise OSMCPTimeoutError(
+                        f"Deadline exceeded during {method} {path}"
+                    ) from e
+                if isinstance(e, TimeoutError):
+                    error = OSMCPTimeoutError(
+                        f"Request timed out: {method} {path} {e}".rstrip()
+                    )
+                else:
+                    error = OSMCPConnectionError(f"Connection error: {e}")
+                # A connection that was never established sent nothing
+                not_sent = isinstance(e, aiohttp.ClientConnectorError)
+                if handed_out or not policy.should_retry(
+                    method, attempt, idempotent=True if not_sent else idempotent
+                ):
+                    raise error from e
+                delay = policy.backoff(attempt)
+
+            except OSMCPError:
+                raise
 
             except Exception as e:
-                if "OSMCPAPIError" in str(type(e)):
+                if handed_out:
                     raise
                 raise OSMCPAPIError(f"Unexpected error: {e}")
-        # If all retries failed but we didn't explicitly raise an exception
-        raise OSMCPConnectionError("Maximum retry attempts reached without success")
+
+            finally:
+                if guard:
+                    if latency is None:
+                        latency = time.monotonic() - started
+                    guard.release(probe, latency, status, failed, method)
+
+            if time.monotonic() + delay > deadline:
+                logger.warning(
+                    f"Retry budget exhausted for {method} {path}",
+                    extra={"attempt": attempt + 1, "budget": policy.budget},
+                )
+                raise error
+
+            attempt += 1
+            logger.info(
+                f"Retrying {method} {path} in {delay:.2f}s after: {error}",
+                extra={
+                    "attempt": attempt,
+                    "delay": delay,
+                    "status_code": getattr(error, "status_code", None),
+                },
+            )
+            await asyncio.sleep(delay)
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> Any:
+        """Read a successful response body once and decode it.
+
+        Args:
+            response: Response with a success status
+
+        Returns:
+            Decoded JSON, or {"response": text} for non-JSON bodies
+        """
+        body = await response.read()
+        if is_json_content_type(response.content_type):
+            if not body.strip():
+                return None
+            try:
+                return self._json.loads(body)
+            except ValueError:
+                pass
+        # Handle non-JSON responses (e.g., plain text)
+        return {"response": body.decode(response.charset or "utf-8", "replace")}
+
+    async def _acquire_guard(
+        self, guard: ServiceGuard | None, method: str, path: str
+    ) -> bool:
+        """Pass the service guard, waiting for a slot no longer than the deadline.
+
+        Args:
+            guard: Service guard, or None
+            method: HTTP method, for error messages
+            path: API path, for error messages
+
+        Returns:
+            True if the request is the circuit breaker's half-open probe
+
+        Raises:
+            OSMCPConnectionError: If the service's circuit is open
+            OSMCPTimeoutError: If the deadline passes while waiting
+        """
+        if guard is None:
+            return False
+        left = check_deadline(f"{method} {path}")
+        try:
+            async with asyncio.timeout(left):
+                return await guard.acquire()
+        except TimeoutError:
+            raise OSMCPTimeoutError(
+                f"Deadline exceeded waiting to send {method} {path}"
+            ) from None
+
+    def _service_guard(self) -> ServiceGuard | None:
+        """Get the circuit breaker and concurrency limiter for this service.
+
+        Returns:
+            Shared guard, or None for requests not bound to a service
+        """
+        if self._service is None:
+            return None
+        return get_service_guard(self.config, self._base_url, self._service)
 
     async def get(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """GET request with retry logic.
@@ -165,6 +417,11 @@ class OsduClient:
         return await self._make_request("DELETE", path, **kwargs)
 
     async def close(self) -> None:
-        """Clean up HTTP session."""
-        if self._session and not self._session.closed:
+        """Clean up HTTP session.
+
+        Shared sessions are left open for other clients; they are closed by
+        the session registry when the server shuts down.
+        """
+        if self._session and not self._session.closed and self._owns_session:
             await self._session.close()
+        self._session = None
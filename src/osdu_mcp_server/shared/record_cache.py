@@ -0,0 +1,425 @@
+"""Process-wide cache of Storage records.
+
+A record version never changes once written, so records fetched by ID and
+version are kept until evicted by the LRU bound. Latest-version lookups may
+go stale when another client writes, so they are only reused for a short TTL
+and are dropped immediately when this server writes, deletes or purges the
+record. A latest-version lookup that was already in flight when the record
+was invalidated is not stored, so it cannot bring the old version back.
+
+Versioned records evicted from memory can optionally spill to a
+size-bounded SQLite file, keyed like the schema cache by server URL, data
+partition, record ID and version.
+
+Configuration:
+- OSDU_MCP_STORAGE_RECORD_CACHE_ENABLED: Enable the cache (default: true)
+- OSDU_MCP_STORAGE_RECORD_CACHE_SIZE: Records kept in memory (default: 1000)
+- OSDU_MCP_STORAGE_RECORD_CACHE_TTL: Seconds to reuse latest-version lookups (default: 30)
+- OSDU_MCP_STORAGE_RECORD_CACHE_DISK_PATH: Spillover database (default: none)
+- OSDU_MCP_STORAGE_RECORD_CACHE_DISK_MAX_MB: Spillover size bound (default: 256)
+"""
+
+import asyncio
+import contextlib
+import copy
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .config_manager import get_config
+from .json_codec import get_json_codec
+from .logging_manager import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_SIZE = 1000
+DEFAULT_LATEST_TTL = 30
+DEFAULT_DISK_MAX_MB = 256
+
+# Versioned key: (server_url, partition, record_id, version); latest: version None
+CacheKey = tuple[str, str, str, int | None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    server_url TEXT NOT NULL,
+    partition TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (server_url, partition, record_id, version)
+)
+"""
+
+_INDEX = "CREATE INDEX IF NOT EXISTS records_stored_at ON records (stored_at)"
+
+
+class RecordSpillover:
+    """Size-bounded SQLite store for versioned records evicted from memory.
+
+    Storage errors never propagate: an unusable file behaves as a miss. The
+    total size is counted once when the file is opened and then kept up to
+    date, so inserts do not rescan the table.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        """Initialize the spillover store.
+
+        Args:
+            path: SQLite database file (created on first use)
+            max_bytes: Compressed bytes kept before the oldest entries go
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        # Compressed bytes stored; None until counted from the file
+        self._total: int | None = None
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open the database on first use."""
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(_SCHEMA)
+                conn.execute(_INDEX)
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    f"Record spillover disabled, cannot open {self.path}: {e}"
+                )
+                self._disabled = True
+        return self._conn
+
+    def get(self, key: CacheKey) -> dict | None:
+        """Look up a spilled record version."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT body FROM records WHERE server_url = ? AND partition = ? "
+                    "AND record_id = ? AND version = ?",
+                    key,
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Record spillover read failed: {e}")
+                return None
+        if row is None:
+            return None
+        try:
+            return get_json_codec().loads(zlib.decompress(row[0]))
+        except (zlib.error, ValueError):
+            return None
+
+    def put(self, key: CacheKey, record: dict[str, Any]) -> None:
+        """Store a record version, evicting the oldest entries over the bound."""
+        blob = zlib.compress(get_json_codec().dumps(record))
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                total = self._stored_bytes(conn)
+                replaced = conn.execute(
+                    "SELECT size FROM records WHERE server_url = ? AND partition = ? "
+                    "AND record_id = ? AND version = ?",
+                    key,
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO records "
+                    "(server_url, partition, record_id, version, stored_at, size, body) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (*key, time.time(), len(blob), blob),
+                )
+                total += len(blob) - (replaced[0] if replaced else 0)
+                while total > self.max_bytes:
+                    oldest = conn.execute(
+                        "SELECT rowid, size FROM records ORDER BY stored_at LIMIT 1"
+                    ).fetchone()
+                    if oldest is None:
+                        break
+                    conn.execute("DELETE FROM records WHERE rowid = ?", (oldest[0],))
+                    total -= oldest[1]
+                conn.commit()
+                self._total = total
+            except sqlite3.Error as e:
+                logger.warning(f"Record spillover write failed: {e}")
+                self._rollback(conn)
+
+    def discard(self, server_url: str, partition: str, record_id: str) -> None:
+        """Remove every spilled version of a record."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                total = self._stored_bytes(conn)
+                removed = conn.execute(
+                    "SELECT SUM(size) FROM records "
+                    "WHERE server_url = ? AND partition = ? AND record_id = ?",
+                    (server_url, partition, record_id),
+                ).fetchone()[0]
+                conn.execute(
+                    "DELETE FROM records "
+                    "WHERE server_url = ? AND partition = ? AND record_id = ?",
+                    (server_url, partition, record_id),
+                )
+                conn.commit()
+                self._total = total - (removed or 0)
+            except sqlite3.Error as e:
+                logger.warning(f"Record spillover invalidation failed: {e}")
+                self._rollback(conn)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._total = None
+
+    def _stored_bytes(self, conn: sqlite3.Connection) -> int:
+        """Size of the stored records, counted from the file on first use."""
+        if self._total is None:
+            self._total = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM records"
+            ).fetchone()[0]
+        return self._total
+
+    def _rollback(self, conn: sqlite3.Connection) -> None:
+        """Undo a failed write and recount the size on next use."""
+        self._total = None
+        with contextlib.suppress(sqlite3.Error):
+            conn.rollback()
+
+
+class RecordCache:
+    """In-memory LRU of records keyed by ID and version."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_SIZE,
+        latest_ttl: float = DEFAULT_LATEST_TTL,
+        spillover: RecordSpillover | None = None,
+    ):
+        """Initialize the record cache.
+
+        Args:
+            max_entries: Records kept in memory
+            latest_ttl: Seconds to reuse latest-version lookups
+            spillover: Optional on-disk store for evicted record versions
+        """
+        self.max_entries = max(1, max_entries)
+        self.latest_ttl = latest_ttl
+        self.spillover = spillover
+        # key -> (record, stored_at)
+        self._entries: OrderedDict[CacheKey, tuple[dict, float]] = OrderedDict()
+        # Latest-version invalidations: (server_url, partition, record_id) ->
+        # generation, oldest first and bounded like the entries. Lookups of
+        # forgotten records are compared against the newest forgotten one.
+        self._generation = 0
+        self._invalidated: OrderedDict[tuple[str, str, str], int] = OrderedDict()
+        self._forgotten = 0
+
+    def __len__(self) -> int:
+        """Number of records held in memory."""
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter to take before fetching a latest version.
+
+        Passing it back to :meth:`put` keeps a record fetched before a
+        concurrent write from being stored as the latest version.
+        """
+        return self._generation
+
+    async def get(
+        self, server_url: str, partition: str, record_id: str, version: int | None
+    ) -> dict | None:
+        """Look up a record.
+
+        Args:
+            server_url: OSDU server URL
+            partition: Data partition
+            record_id: Record ID
+            version: Record version, or None for the latest version
+
+        Returns:
+            Copy of the cached record, or None on a miss
+        """
+        key = (server_url, partition, record_id, version)
+        entry = self._entries.get(key)
+        if entry is not None:
+            record, stored_at = entry
+            if version is None and time.monotonic() - stored_at >= self.latest_ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(record)
+
+        if version is None or self.spillover is None:
+            return None
+        spilled = await asyncio.to_thread(self.spillover.get, key)
+        if spilled is not None:
+            self._store(key, copy.deepcopy(spilled))
+            await self._evict()
+        return spilled
+
+    async def put(
+        self,
+        server_url: str,
+        partition: str,
+        record: dict[str, Any],
+        latest: bool = False,
+        generation: int | None = None,
+    ) -> None:
+        """Store a record under its version, and as the latest if it is.
+
+        Args:
+            server_url: OSDU server URL
+            partition: Data partition
+            record: Full record (with "id" and "version")
+            latest: Whether the record was returned by a latest-version lookup
+            generation: :attr:`generation` taken before the lookup; the
+                latest version is not stored if the record was invalidated
+                since
+        """
+        record_id = record.get("id")
+        if not isinstance(record_id, str):
+            return
+        record = copy.deepcopy(record)
+        if latest and not self._invalidated_since(
+            (server_url, partition, record_id), generation
+        ):
+            self._store((server_url, partition, record_id, None), record)
+        version = record.get("version")
+        if isinstance(version, int):
+            self._store((server_url, partition, record_id, version), record)
+
+        await self._evict()
+
+    def invalidate_latest(
+        self, server_url: str, partition: str, record_id: str
+    ) -> None:
+        """Forget the latest version of a record (after a write or delete).
+
+        Args:
+            server_url: OSDU server URL
+            partition: Data partition
+            record_id: Record ID
+        """
+        self._entries.pop((server_url, partition, record_id, None), None)
+        self._generation += 1
+        key = (server_url, partition, record_id)
+        self._invalidated.pop(key, None)
+        self._invalidated[key] = self._generation
+        while len(self._invalidated) > self.max_entries:
+            _, self._forgotten = self._invalidated.popitem(last=False)
+
+    async def invalidate_all(
+        self, server_url: str, partition: str, record_id: str
+    ) -> None:
+        """Forget every version of a record (after a purge).
+
+        Args:
+            server_url: OSDU server URL
+            partition: Data partition
+            record_id: Record ID
+        """
+        self.invalidate_latest(server_url, partition, record_id)
+        for key in [
+            k for k in self._entries if k[:3] == (server_url, partition, record_id)
+        ]:
+            del self._entries[key]
+        if self.spillover is not None:
+            await asyncio.to_thread(
+                self.spillover.discard, server_url, partition, record_id
+            )
+
+    def close(self) -> None:
+        """Drop cached records and close the spillover store."""
+        self._entries.clear()
+        if self.spillover is not None:
+            self.spillover.close()
+
+    def _invalidated_since(
+        self, key: tuple[str, str, str], generation: int | None
+    ) -> bool:
+        """Check whether a record's latest version went stale during a lookup."""
+        if generation is None:
+            return False
+        return self._invalidated.get(key, self._forgotten) > generation
+
+    def _store(self, key: CacheKey, record: dict) -> None:
+        """Insert an entry as most recently used."""
+        self._entries[key] = (record, time.monotonic())
+        self._entries.move_to_end(key)
+
+    async def _evict(self) -> None:
+        """Drop least recently used entries over the bound.
+
+        Evicted record versions move to the spillover store when configured.
+        """
+        while len(self._entries) > self.max_entries:
+            key, (record, _) = self._entries.popitem(last=False)
+            if self.spillover is not None and key[3] is not None:
+                await asyncio.to_thread(self.spillover.put, key, record)
+
+
+# Shared cache for the process lifetime
+_shared_cache: RecordCache | None = None
+
+
+def get_record_cache() -> RecordCache | None:
+    """Get the process-wide record cache.
+
+    Returns:
+        Shared record cache, or None if caching is disabled
+    """
+    global _shared_cache
+    config = get_config()
+    if not config.get("storage", "record_cache_enabled", True):
+        return None
+
+    if _shared_cache is None:
+        spillover = None
+        disk_path = config.get("storage", "record_cache_disk_path")
+        if disk_path:
+            max_mb = float(
+                config.get("storage", "record_cache_disk_max_mb", DEFAULT_DISK_MAX_MB)
+                or DEFAULT_DISK_MAX_MB
+            )
+            spillover = RecordSpillover(
+                Path(disk_path).expanduser(), int(max_mb * 1024 * 1024)
+            )
+        _shared_cache = RecordCache(
+            max_entries=int(
+                config.get("storage", "record_cache_size", DEFAULT_CACHE_SIZE)
+                or DEFAULT_CACHE_SIZE
+            ),
+            latest_ttl=float(
+                config.get("storage", "record_cache_ttl", DEFAULT_LATEST_TTL) or 0
+            ),
+            spillover=spillover,
+        )
+    return _shared_cache
+
+
+def reset_record_cache() -> None:
+    """Close and discard the shared record cache."""
+    global _shared_cache
+    if _shared_cache is not None:
+        _shared_cache.close()
+    _shared_cache = None
@@ -0,0 +1,131 @@
+"""Page sources shared by the record export tools.
+
+Exports walk their source one page at a time and hand each page to a file
+writer, so the size of an export is bounded by disk space rather than
+memory. A writer only needs ``count``, ``write(records)``, ``commit()`` and
+``abort()``.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any, Protocol
+
+from .clients.search_client import CURSOR_PAGE_SIZE, SearchClient
+from .clients.storage_client import KIND_QUERY_PAGE_SIZE, StorageClient
+from .deadline import remaining
+from .exceptions import OSMCPTimeoutError
+from .logging_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+class RecordWriter(Protocol):
+    """File writer accepted by :func:`write_pages`."""
+
+    count: int
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Append a page of records."""
+        ...
+
+    def commit(self) -> None:
+        """Finish the file and move it into place."""
+        ...
+
+    def abort(self) -> None:
+        """Discard the partially written file."""
+        ...
+
+
+async def storage_pages(
+    client: StorageClient, kind: str, stats: dict[str, Any]
+) -> AsyncGenerator[list[dict[str, Any]], None]:
+    """Yield the full records of a kind, one ID page at a time.
+
+    Args:
+        client: Storage client to query with
+        kind: Kind to export
+        stats: Updated with "invalid", the number of IDs that could not be
+            fetched
+
+    Yields:
+        Lists of records
+    """
+    pages = client.iter_record_pages_by_kind(kind, KIND_QUERY_PAGE_SIZE)
+    try:
+        async for page in pages:
+            if not page["results"]:
+                continue
+            response = await client.fetch_records_bulk(page["results"], use_cache=False)
+            stats["invalid"] = (
+                stats.get("invalid", 0)
+                + len(response["invalidRecords"])
+                + len(response["retryRecords"])
+            )
+            yield response["records"]
+    finally:
+        await pages.aclose()
+
+
+async def search_pages(
+    client: SearchClient, query: str, kind: str
+) -> AsyncGenerator[list[dict[str, Any]], None]:
+    """Yield the hits of a query in pages of the search cursor page size.
+
+    Args:
+        client: Search client to query with
+        query: Elasticsearch query syntax
+        kind: Kind pattern to search
+
+    Yields:
+        Lists of standardized search hits
+    """
+    page: list[dict[str, Any]] = []
+    hits = client.iter_query_with_cursor(query, kind)
+    try:
+        async for hit in hits:
+            page.append(hit)
+            if len(page) >= CURSOR_PAGE_SIZE:
+                yield page
+                page = []
+    finally:
+        await hits.aclose()
+    if page:
+        yield page
+
+
+async def write_pages(
+    writer: RecordWriter,
+    pages: AsyncGenerator[list[dict[str, Any]], None],
+    max_count: int | None,
+) -> bool:
+    """Write record pages until the source is exhausted or max_count is hit.
+
+    Args:
+        writer: Destination file writer
+        pages: Page source
+        max_count: Maximum number of records to write
+
+    Returns:
+        True if the whole source was written, False if max_count or the tool
+        deadline stopped the export (the pages written so far are kept)
+    """
+    try:
+        async for records in pages:
+            if max_count is not None and writer.count + len(records) > max_count:
+                left = max_count - writer.count
+                await asyncio.to_thread(writer.write, records[:left])
+                return False
+            await asyncio.to_thread(writer.write, records)
+        return True
+    except OSMCPTimeoutError as e:
+        left = remaining()
+        if left is None or left > 0:
+            raise
+        logger.warning(
+            f"Export stopped at the deadline after {writer.count} records: {e}",
+            extra={"record_count": writer.count, "operation": "write_pages"},
+        )
+        return False
+    finally:
+        await pages.aclose()
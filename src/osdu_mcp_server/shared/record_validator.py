@@ -0,0 +1,287 @@
+"""Local validation of record data against OSDU schemas.
+
+A record's ``kind`` is the ID of the schema its ``data`` block must satisfy.
+Validating locally lets batch writes fail fast with per-record errors instead
+of spending a Storage service round trip per rejected batch.
+
+Each kind is resolved through the schema cache and compiled once into a
+reusable JSON Schema validator. ``$ref`` targets that point at other schema
+IDs (e.g. ``osdu:wks:AbstractCommonResources:1.0.0``) are fetched and
+registered alongside the schema so references resolve without the network at
+validation time.
+
+Validation is best effort: if a schema cannot be fetched or compiled,
+records of that kind are left to the Storage service to validate. A missing
+``jsonschema`` package is reported as a configuration error rather than
+skipping validation silently.
+
+Configuration:
+- OSDU_MCP_STORAGE_VALIDATE_SCHEMAS: Validate record data before writes (default: true)
+- OSDU_MCP_STORAGE_VALIDATION_MAX_ERRORS: Errors reported per record (default: 5)
+"""
+
+import asyncio
+import re
+import time
+from typing import Any
+
+from .clients.schema_client import SchemaClient
+from .config_manager import get_config
+from .exceptions import OSMCPConfigError
+from .logging_manager import get_logger
+from .schema_index import schema_body
+
+logger = get_logger(__name__)
+
+PUBLISHED_STATUS = "PUBLISHED"
+DEFAULT_VALIDATOR_TTL = 300
+DEFAULT_MAX_ERRORS = 5
+
+# authority:source:entity:major.minor.patch
+SCHEMA_ID_RE = re.compile(r"^[\w.\-]+:[\w.\-]+:[\w.\-/]+:\d+\.\d+\.\d+$")
+
+
+def _external_refs(obj: Any, refs: set[str]) -> set[str]:
+    """Collect $ref targets that name another schema ID."""
+    if isinstance(obj, dict):
+        ref = obj.get("$ref")
+        if isinstance(ref, str):
+            uri = ref.split("#", 1)[0]
+            if SCHEMA_ID_RE.match(uri):
+                refs.add(uri)
+        for value in obj.values():
+            _external_refs(value, refs)
+    elif isinstance(obj, list):
+        for item in obj:
+            _external_refs(item, refs)
+    return refs
+
+
+class CompiledSchema:
+    """Validator for the data block of one record kind."""
+
+    def __init__(self, kind: str, validator: Any, status: str | None):
+        """Initialize a compiled schema.
+
+        Args:
+            kind: Record kind (schema ID)
+            validator: jsonschema validator for the data block
+            status: Schema status (PUBLISHED validators never expire)
+        """
+        self.kind = kind
+        self.validator = validator
+        self.status = status
+        self.compiled_at = time.monotonic()
+
+    def errors(self, data: Any, max_errors: int = DEFAULT_MAX_ERRORS) -> list[str]:
+        """Validate a data block.
+
+        Args:
+            data: Record data block
+            max_errors: Maximum number of errors to report
+
+        Returns:
+            Error messages (empty if the data is valid)
+        """
+        try:
+            found = sorted(
+                self.validator.iter_errors(data), key=lambda e: list(e.absolute_path)
+            )
+        except Exception as e:
+            # Unresolvable references or patterns Python cannot compile
+            logger.warning(f"Cannot validate records of kind {self.kind}: {e}")
+            return []
+
+        messages = []
+        for error in found[:max_errors]:
+            path = "".join(
+                f"[{p}]" if isinstance(p, int) else f".{p}" for p in error.absolute_path
+            )
+            messages.append(f"data{path}: {error.message}")
+        if len(found) > max_errors:
+            messages.append(f"... and {len(found) - max_errors} more errors")
+        return messages
+
+
+async def fetch_referenced_schemas(
+    client: SchemaClient, kind: str, root: dict[str, Any]
+) -> tuple[dict[str, dict[str, Any]], set[str]]:
+    """Fetch the schemas a schema references by ID, transitively.
+
+    Referenced schemas are fetched breadth-first, each at most once, through
+    the schema cache.
+
+    Args:
+        client: Schema client to fetch with
+        kind: ID of the referencing schema
+        root: Body of the referencing schema
+
+    Returns:
+        Bodies keyed by schema ID, and the IDs that could not be fetched
+    """
+    bodies: dict[str, dict[str, Any]] = {}
+    unavailable: set[str] = set()
+    pending = _external_refs(root, set()) - {kind}
+    while pending:
+        ids = sorted(pending)
+        results = await asyncio.gather(
+            *(client.get_schema(sid) for sid in ids), return_exceptions=True
+        )
+        pending = set()
+        for sid, result in zip(ids, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"Referenced schema {sid} unavailable: {result}")
+                unavailable.add(sid)
+                continue
+            bodies[sid] = schema_body(result)
+            pending |= _external_refs(bodies[sid], set())
+        pending -= bodies.keys() | unavailable | {kind}
+    return bodies, unavailable
+
+
+async def compile_schema(client: SchemaClient, kind: str) -> CompiledSchema | None:
+    """Fetch a schema and its referenced schemas and compile a validator.
+
+    Args:
+        client: Schema client to fetch with (uses the schema cache)
+        kind: Record kind (schema ID)
+
+    Returns:
+        Compiled schema, or None if the kind cannot be validated locally
+
+    Raises:
+        OSMCPConfigError: If jsonschema is not installed
+    """
+    try:
+        from jsonschema import Draft7Validator
+        from jsonschema.validators import validator_for
+        from referencing import Registry, Resource
+        from referencing.jsonschema import DRAFT7
+    except ImportError as e:
+        raise OSMCPConfigError(
+            "jsonschema library not installed, records cannot be validated. "
+            "Install with: pip install 'jsonschema>=4.18' "
+            "(or set OSDU_MCP_STORAGE_VALIDATE_SCHEMAS=false)"
+        ) from e
+
+    try:
+        response = await client.get_schema(kind)
+    except Exception as e:
+        logger.warning(f"Schema for kind {kind} unavailable, skipping validation: {e}")
+        return None
+
+    root = schema_body(response)
+    data_schema = root.get("properties", {}).get("data")
+    if not isinstance(data_schema, dict):
+        return None
+
+    schema_info = response.get("schemaInfo")
+    status = schema_info.get("status") if isinstance(schema_info, dict) else None
+
+    references, _ = await fetch_referenced_schemas(client, kind, root)
+    bodies = {kind: root, **references}
+    registry = Registry().with_resources(
+        (sid, Resource.from_contents(body, default_specification=DRAFT7))
+        for sid, body in bodies.items()
+    )
+    try:
+        cls = validator_for(root, default=Draft7Validator)
+        validator = cls({"$ref": f"{kind}#/properties/data"}, registry=registry)
+    except Exception as e:
+        logger.warning(f"Cannot compile schema {kind}, skipping validation: {e}")
+        return None
+
+    return CompiledSchema(kind, validator, status)
+
+
+# Compiled validators keyed by (server URL, data partition, kind)
+_compiled: dict[tuple[str, str, str], CompiledSchema] = {}
+
+
+async def get_compiled_schema(client: SchemaClient, kind: str) -> CompiledSchema | None:
+    """Get the process-wide compiled validator for a record kind.
+
+    Args:
+        client: Schema client used on a miss
+        kind: Record kind (schema ID)
+
+    Returns:
+        Compiled schema, or None if the kind cannot be validated locally
+    """
+    key = (
+        client.config.get("server", "url"),
+        client.config.get("server", "data_partition"),
+        kind,
+    )
+    compiled = _compiled.get(key)
+    if compiled is not None:
+        ttl = float(get_config().get("schema", "cache_ttl", DEFAULT_VALIDATOR_TTL) or 0)
+        if (
+            compiled.status == PUBLISHED_STATUS
+            or time.monotonic() - compiled.compiled_at < ttl
+        ):
+            return compiled
+
+    compiled = await compile_schema(client, kind)
+    if compiled is not None:
+        _compiled[key] = compiled
+    else:
+        _compiled.pop(key, None)
+    return compiled
+
+
+def _kind(record: Any) -> Any:
+    """Read the kind of a record that may not be an object."""
+    return record.get("kind") if isinstance(record, dict) else None
+
+
+def reset_compiled_schemas() -> None:
+    """Discard all compiled record validators."""
+    _compiled.clear()
+
+
+async def validate_records(
+    client: SchemaClient, records: list[dict[str, Any]], max_errors: int
+) -> dict[int, list[str]]:
+    """Validate the data block of each record against its kind's schema.
+
+    Args:
+        client: Schema client used to resolve kinds
+        records: Records to validate
+        max_errors: Maximum number of errors to report per record
+
+    Returns:
+        Mapping of record index to error messages, for invalid records only
+        (including records whose kind is not a schema ID string)
+
+    Raises:
+        OSMCPConfigError: If jsonschema is not installed
+    """
+    kinds = sorted(
+        {
+            kind
+            for kind in (_kind(record) for record in records)
+            if isinstance(kind, str) and kind
+        }
+    )
+    compiled = dict(
+        zip(
+            kinds,
+            await asyncio.gather(*(get_compiled_schema(client, k) for k in kinds)),
+            strict=True,
+        )
+    )
+
+    failures: dict[int, list[str]] = {}
+    for i, record in enumerate(records):
+        kind = _kind(record)
+        if not isinstance(kind, str) or not kind:
+            failures[i] = [f"kind must be a non-empty string, got {kind!r}"]
+            continue
+        schema = compiled.get(kind)
+        if schema is None:
+            continue
+        errors = schema.errors(record.get("data"), max_errors)
+        if errors:
+            failures[i] = errors
+    return failures
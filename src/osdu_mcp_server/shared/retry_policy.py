@@ -0,0 +1,178 @@
+"""Retry policy for OSDU HTTP requests.
+
+Decides whether a failed request is retried and how long to wait first:
+
+- Connection errors, 408, 500, 502 and 504 are retried for idempotent
+  methods only, because the request may already have been applied.
+- 429 and 503 mean the platform refused the request, so they are retried
+  for every method, waiting at least as long as ``Retry-After`` asks.
+- Backoff is exponential with full jitter, so clients throttled together
+  do not retry in lockstep.
+- Each call has a time budget; a retry that would overrun it is not made.
+
+Configuration:
+- OSDU_MCP_SERVER_RETRY_MAX_ATTEMPTS: Attempts per request (default: 3)
+- OSDU_MCP_SERVER_RETRY_BASE_DELAY: First backoff cap in seconds (default: 1)
+- OSDU_MCP_SERVER_RETRY_MAX_DELAY: Largest backoff in seconds (default: 30)
+- OSDU_MCP_SERVER_RETRY_BUDGET: Seconds a call may spend retrying (default: 60)
+- OSDU_MCP_SERVER_RETRY_JITTER: Randomize backoff delays (default: true)
+- OSDU_MCP_SERVER_RETRY_STATUS_CODES: Retryable status codes
+  (default: 408,429,500,502,503,504)
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from .config_manager import ConfigManager, parse_setting
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+DEFAULT_RETRY_BUDGET = 60.0
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+# Statuses returned before the request was processed: safe for any method
+REFUSED_STATUS_CODES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _status_codes(value: Any) -> frozenset[int]:
+    """Parse a status code list given as a sequence or comma-separated string."""
+    if isinstance(value, str):
+        value = [v for v in value.split(",") if v.strip()]
+    return frozenset(int(v) for v in value)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Retry rules and backoff schedule shared by OSDU clients."""
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        budget: float = DEFAULT_RETRY_BUDGET,
+        jitter: bool = True,
+        retry_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES,
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts: Attempts per request, including the first
+            base_delay: Backoff cap in seconds before the first retry
+            max_delay: Largest backoff in seconds
+            budget: Seconds a call may spend, after which no retry is made
+            jitter: Draw each delay uniformly below its cap (full jitter)
+            retry_status_codes: HTTP status codes worth retrying
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.jitter = jitter
+        self.retry_status_codes = retry_status_codes
+
+    @classmethod
+    def from_config(cls, config: ConfigManager) -> "RetryPolicy":
+        """Build a policy from the server configuration.
+
+        Args:
+            config: Configuration manager instance
+
+        Returns:
+            Configured retry policy
+        """
+        jitter = config.get("server", "retry_jitter", True)
+        if isinstance(jitter, str):
+            jitter = jitter.lower() in ("true", "1", "yes", "on")
+        return cls(
+            max_attempts=parse_setting(
+                config, "server", "retry_max_attempts", int, DEFAULT_MAX_ATTEMPTS
+            ),
+            base_delay=parse_setting(
+                config, "server", "retry_base_delay", float, DEFAULT_BASE_DELAY
+            ),
+            max_delay=parse_setting(
+                config, "server", "retry_max_delay", float, DEFAULT_MAX_DELAY
+            ),
+            budget=parse_setting(
+                config, "server", "retry_budget", float, DEFAULT_RETRY_BUDGET
+            ),
+            jitter=jitter is True,
+            retry_status_codes=parse_setting(
+                config,
+                "server",
+                "retry_status_codes",
+                _status_codes,
+                RETRYABLE_STATUS_CODES,
+            ),
+        )
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status: int | None = None,
+        idempotent: bool | None = None,
+    ) -> bool:
+        """Decide whether a failed attempt is retried.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Zero-based number of the attempt that failed
+            status: HTTP status code, or None for a connection error
+            idempotent: Override for whether the request can be repeated
+                safely (e.g. read-only POST queries)
+
+        Returns:
+            True if another attempt should be made
+        """
+        if attempt + 1 >= self.max_attempts:
+            return False
+        if status is not None and status not in self.retry_status_codes:
+            return False
+        if status in REFUSED_STATUS_CODES:
+            return True
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return idempotent
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Compute the delay before the next attempt.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            retry_after: Delay requested by the server, honored as a minimum
+
+        Returns:
+            Seconds to wait
+        """
+        cap = min(self.max_delay, self.base_delay * (2**attempt))
+        delay = random.uniform(0, cap) if self.jitter else cap
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
@@ -0,0 +1,236 @@
+"""Persistent on-disk cache for OSDU schema bodies.
+
+A PUBLISHED schema is immutable for a given
+``authority:source:entity:major.minor.patch`` ID, so once fetched it can be
+served locally forever. DEVELOPMENT (or unknown-status) schemas may still
+change and are only reused for a short TTL.
+
+Entries are stored as zlib-compressed JSON in a SQLite database keyed by
+server URL, data partition and schema ID, so one cache file can safely serve
+several OSDU environments.
+
+Configuration:
+- OSDU_MCP_SCHEMA_CACHE_ENABLED: Enable the cache (default: true)
+- OSDU_MCP_SCHEMA_CACHE_PATH: Database file (default: ~/.cache/osdu-mcp-server/schemas.db)
+- OSDU_MCP_SCHEMA_CACHE_TTL: Seconds to reuse non-PUBLISHED schemas (default: 300)
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from .config_manager import get_config
+from .json_codec import get_json_codec
+from .logging_manager import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "osdu-mcp-server" / "schemas.db"
+DEFAULT_CACHE_TTL = 300
+PUBLISHED_STATUS = "PUBLISHED"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS schemas (
+    server_url TEXT NOT NULL,
+    partition TEXT NOT NULL,
+    schema_id TEXT NOT NULL,
+    status TEXT,
+    fetched_at REAL NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (server_url, partition, schema_id)
+)
+"""
+
+
+class SchemaCache:
+    """SQLite-backed store of schema bodies.
+
+    Storage errors never propagate: a cache that cannot be read or written
+    simply behaves as a miss so that schema tools keep working.
+    """
+
+    def __init__(self, path: Path, ttl: float = DEFAULT_CACHE_TTL):
+        """Initialize the schema cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+            ttl: Seconds to reuse schemas that are not PUBLISHED
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open the database on first use.
+
+        Returns:
+            Open connection, or None if the cache is unusable
+        """
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(_SCHEMA)
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Schema cache disabled, cannot open {self.path}: {e}")
+                self._disabled = True
+        return self._conn
+
+    def get(self, server_url: str, partition: str, schema_id: str) -> dict | None:
+        """Look up a cached schema body.
+
+        Args:
+            server_url: OSDU server URL
+            partition: Data partition
+            schema_id: Schema ID
+
+        Returns:
+            Schema body, or None on a miss or expired entry
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT status, fetched_at, body FROM schemas "
+                    "WHERE server_url = ? AND partition = ? AND schema_id = ?",
+                    (server_url, partition, schema_id),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Schema cache read failed: {e}")
+                return None
+
+        if row is None:
+            return None
+
+        status, fetched_at, body = row
+        if status != PUBLISHED_STATUS and time.time() - fetched_at >= self.ttl:
+            return None
+
+        try:
+            return get_json_codec().loads(zlib.decompress(body))
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Discarding corrupt schema cache entry {schema_id}: {e}")
+            self.invalidate(server_url, partition, schema_id)
+            return None
+
+    def put(
+        self,
+        server_url: str,
+        partition: str,
+        schema_id: str,
+        body: dict[str, Any],
+        status: str | None = None,
+    ) -> None:
+        """Store a schema body.
+
+        Args:
+            server_url: OSDU server URL
+            partition: Data partition
+            schema_id: Schema ID
+            body: Schema body as returned by the Schema service
+            status: Schema status (PUBLISHED entries never expire)
+        """
+        blob = zlib.compress(get_json_codec().dumps(body))
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO schemas "
+                    "(server_url, partition, schema_id, status, fetched_at, body) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (server_url, partition, schema_id, status, time.time(), blob),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Schema cache write failed: {e}")
+
+    def invalidate(self, server_url: str, partition: str, schema_id: str) -> None:
+        """Remove a schema from the cache (e.g., after it was updated).
+
+        Args:
+            server_url: OSDU server URL
+            partition: Data partition
+            schema_id: Schema ID
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "DELETE FROM schemas "
+                    "WHERE server_url = ? AND partition = ? AND schema_id = ?",
+                    (server_url, partition, schema_id),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Schema cache invalidation failed: {e}")
+
+    async def aget(
+        self, server_url: str, partition: str, schema_id: str
+    ) -> dict | None:
+        """Look up a cached schema body without blocking the event loop."""
+        return await asyncio.to_thread(self.get, server_url, partition, schema_id)
+
+    async def aput(
+        self,
+        server_url: str,
+        partition: str,
+        schema_id: str,
+        body: dict[str, Any],
+        status: str | None = None,
+    ) -> None:
+        """Store a schema body without blocking the event loop."""
+        await asyncio.to_thread(
+            self.put, server_url, partition, schema_id, body, status
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Shared cache for the process lifetime
+_shared_cache: SchemaCache | None = None
+
+
+def get_schema_cache() -> SchemaCache | None:
+    """Get the process-wide schema cache.
+
+    Returns:
+        Shared schema cache, or None if caching is disabled
+    """
+    global _shared_cache
+    config = get_config()
+    if not config.get("schema", "cache_enabled", True):
+        return None
+
+    if _shared_cache is None:
+        path = config.get("schema", "cache_path") or DEFAULT_CACHE_PATH
+        ttl = float(config.get("schema", "cache_ttl", DEFAULT_CACHE_TTL) or 0)
+        _shared_cache = SchemaCache(Path(path).expanduser(), ttl)
+    return _shared_cache
+
+
+def reset_schema_cache() -> None:
+    """Close and discard the shared schema cache."""
+    global _shared_cache
+    if _shared_cache is not None:
+        _shared_cache.close()
+    _shared_cache = None
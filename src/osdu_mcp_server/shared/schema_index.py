@@ -0,0 +1,435 @@
+"""In-memory inverted index for schema full-text search.
+
+Schema search used to lowercase and walk every schema's property tree for
+every query, after fetching each body over HTTP. This index is built
+incrementally from schema listings and schema bodies (normally served by the
+on-disk schema cache) and answers text queries with relevance ranking.
+
+Matching keeps the substring semantics of the original search: a query term
+matches any indexed term that contains it, so "pressure" still finds a
+property named "BottomHolePressure". Matching terms are found by binary
+search over the sorted suffixes of each field's vocabulary (rebuilt only
+after the vocabulary changes), and their postings are then read directly.
+Multi-word queries require every word to match.
+
+Configuration:
+- OSDU_MCP_SCHEMA_INDEX_REFRESH_INTERVAL: Seconds between background index
+  refreshes while the server runs (default: 0, disabled)
+"""
+
+import asyncio
+import re
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any
+
+from .auth_handler import get_auth_handler
+from .clients.schema_client import SchemaClient
+from .config_manager import get_config
+from .logging_manager import get_logger
+
+logger = get_logger(__name__)
+
+PUBLISHED_STATUS = "PUBLISHED"
+DEFAULT_FETCH_CONCURRENCY = 10
+DEFAULT_BODY_TTL = 300
+
+# Relevance weight of a match per indexed field
+IDENTITY_WEIGHTS = {"entityType": 3.0, "id": 1.0, "authority": 1.0, "source": 1.0}
+TITLE_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 2.0
+PROPERTY_NAME_WEIGHT = 2.0
+PROPERTY_TEXT_WEIGHT = 1.0
+EXACT_MATCH_BONUS = 2.0
+
+# search_in values that stand for several indexed fields
+FIELD_ALIASES = {"content": ("title", "description", "properties")}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric terms.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def schema_id(schema: dict) -> str | None:
+    """Get the schema ID from a schema listing entry."""
+    return schema.get("schemaIdentity", {}).get("id")
+
+
+def schema_body(response: dict[str, Any]) -> dict:
+    """Extract the JSON schema body from a get_schema response."""
+    body = response.get("schema")
+    return body if isinstance(body, dict) else response
+
+
+async def fetch_schema_bodies(
+    client: SchemaClient, schemas: list[dict], concurrency: int
+) -> dict[str, dict | None]:
+    """Fetch schema bodies concurrently, each ID at most once.
+
+    Args:
+        client: Schema client to fetch with
+        schemas: Schema listing entries whose bodies are needed
+        concurrency: Maximum number of requests in flight
+
+    Returns:
+        Mapping of schema ID to body (None if the fetch failed)
+    """
+    statuses: dict[str, str | None] = {}
+    for schema in schemas:
+        sid = schema_id(schema)
+        if sid:
+            statuses[sid] = schema.get("status")
+    if not statuses:
+        return {}
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(sid: str) -> dict | None:
+        async with semaphore:
+            try:
+                return schema_body(await client.get_schema(sid, status=statuses[sid]))
+            except Exception as e:
+                logger.warning(f"Failed to fetch schema content for {sid}: {e}")
+                return None
+
+    ids = list(statuses)
+    results = await asyncio.gather(*(fetch(sid) for sid in ids))
+    return dict(zip(ids, results, strict=True))
+
+
+class SchemaIndex:
+    """Inverted index over schema identity, titles, descriptions and properties."""
+
+    def __init__(self, body_ttl: float = DEFAULT_BODY_TTL):
+        """Initialize an empty index.
+
+        Args:
+            body_ttl: Seconds before a non-PUBLISHED schema body is re-indexed
+        """
+        self.body_ttl = body_ttl
+        # field -> term -> {schema_id: weight}
+        self._postings: dict[str, dict[str, dict[str, float]]] = defaultdict(dict)
+        # schema_id -> field -> terms, used to replace a schema's entries
+        self._schema_terms: dict[str, dict[str, set[str]]] = defaultdict(dict)
+        # schema_id -> (status, indexed_at) for indexed bodies
+        self._bodies: dict[str, tuple[str | None, float]] = {}
+        # field -> sorted (suffix, term) pairs for substring lookups
+        self._suffixes: dict[str, list[tuple[str, str]]] = {}
+        # Fields whose vocabulary changed since their suffixes were built
+        self._stale_fields: set[str] = set()
+
+    def __len__(self) -> int:
+        """Number of schemas with an indexed body."""
+        return len(self._bodies)
+
+    def add_listing(self, schema: dict) -> None:
+        """Index the identity fields of a schema listing entry.
+
+        Args:
+            schema: Entry from a schema listing (with schemaIdentity)
+        """
+        sid = schema_id(schema)
+        if not sid:
+            return
+
+        identity = schema.get("schemaIdentity", {})
+        for field, weight in IDENTITY_WEIGHTS.items():
+            self._replace(sid, field, self._weigh(identity.get(field), weight))
+
+    def add_body(self, sid: str, body: dict, status: str | None = None) -> None:
+        """Index (or re-index) the body of a schema.
+
+        Args:
+            sid: Schema ID
+            body: JSON schema body
+            status: Schema status (PUBLISHED bodies are never re-indexed)
+        """
+        self._replace(sid, "title", self._weigh(body.get("title"), TITLE_WEIGHT))
+        self._replace(
+            sid,
+            "description",
+            self._weigh(body.get("description"), DESCRIPTION_WEIGHT),
+        )
+
+        property_terms: dict[str, float] = {}
+        self._collect_properties(body.get("properties", {}), property_terms)
+        self._replace(sid, "properties", property_terms)
+
+        self._bodies[sid] = (status, time.monotonic())
+
+    def needs_body(self, sid: str | None, status: str | None = None) -> bool:
+        """Check whether a schema's body is missing or stale in the index.
+
+        Args:
+            sid: Schema ID
+            status: Current status from the schema listing
+
+        Returns:
+            True if the body should be (re-)fetched and indexed
+        """
+        if not sid:
+            return False
+        entry = self._bodies.get(sid)
+        if entry is None:
+            return True
+
+        indexed_status, indexed_at = entry
+        if indexed_status == PUBLISHED_STATUS and status in (None, PUBLISHED_STATUS):
+            return False
+        return status != indexed_status or (
+            time.monotonic() - indexed_at >= self.body_ttl
+        )
+
+    def search(
+        self,
+        text: str,
+        fields: list[str],
+        candidates: list[str] | None = None,
+    ) -> dict[str, float]:
+        """Find schemas matching every term of a query.
+
+        Args:
+            text: Query text
+            fields: Fields to search (title, description, properties, id,
+                authority, source, entityType, or content for the first three)
+            candidates: Optional schema IDs to restrict the result to
+
+        Returns:
+            Mapping of matching schema ID to relevance score
+        """
+        terms = tokenize(text)
+        if not terms:
+            return {}
+
+        allowed = set(candidates) if candidates is not None else None
+        fields = list(
+            dict.fromkeys(
+                name for field in fields for name in FIELD_ALIASES.get(field, (field,))
+            )
+        )
+        scores: dict[str, float] | None = None
+
+        for term in terms:
+            term_scores: dict[str, float] = defaultdict(float)
+            for field in fields:
+                field_postings = self._postings.get(field, {})
+                for indexed_term in self._matching_terms(field, term):
+                    bonus = EXACT_MATCH_BONUS if indexed_term == term else 1.0
+                    for sid, weight in field_postings[indexed_term].items():
+                        if allowed is None or sid in allowed:
+                            term_scores[sid] += weight * bonus
+
+            # Every query term must match
+            if scores is None:
+                scores = dict(term_scores)
+            else:
+                scores = {
+                    sid: score + term_scores[sid]
+                    for sid, score in scores.items()
+                    if sid in term_scores
+                }
+            if not scores:
+                return {}
+
+        return scores or {}
+
+    def _matching_terms(self, field: str, term: str) -> set[str]:
+        """Find the indexed terms of a field that contain a query term.
+
+        Args:
+            field: Indexed field
+            term: Query term
+
+        Returns:
+            Indexed terms containing the query term
+        """
+        if field in self._stale_fields or field not in self._suffixes:
+            self._suffixes[field] = sorted(
+                (indexed[i:], indexed)
+                for indexed in self._postings.get(field, {})
+                for i in range(len(indexed))
+            )
+            self._stale_fields.discard(field)
+
+        # A term contains the query iff one of its suffixes starts with it
+        suffixes = self._suffixes[field]
+        matches = set()
+        for i in range(bisect_left(suffixes, (term, "")), len(suffixes)):
+            suffix, indexed_term = suffixes[i]
+            if not suffix.startswith(term):
+                break
+            matches.add(indexed_term)
+        return matches
+
+    def _replace(self, sid: str, field: str, terms: dict[str, float]) -> None:
+        """Replace the indexed terms of one field of a schema."""
+        postings = self._postings[field]
+        for term in self._schema_terms[sid].get(field, set()) - terms.keys():
+            entry = postings.get(term)
+            if entry is not None:
+                entry.pop(sid, None)
+                if not entry:
+                    del postings[term]
+                    self._stale_fields.add(field)
+
+        for term, weight in terms.items():
+            entry = postings.get(term)
+            if entry is None:
+                entry = postings[term] = {}
+                self._stale_fields.add(field)
+            entry[sid] = weight
+        self._schema_terms[sid][field] = set(terms)
+
+    @staticmethod
+    def _weigh(value: Any, weight: float) -> dict[str, float]:
+        """Turn a text value into weighted terms."""
+        if not isinstance(value, str):
+            return {}
+        return {term: weight for term in tokenize(value)}
+
+    def _collect_properties(self, obj: Any, terms: dict[str, float]) -> None:
+        """Collect weighted terms from a property tree."""
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                self._add_terms(terms, self._weigh(key, PROPERTY_NAME_WEIGHT))
+                if isinstance(value, str):
+                    self._add_terms(terms, self._weigh(value, PROPERTY_TEXT_WEIGHT))
+                else:
+                    self._collect_properties(value, terms)
+        elif isinstance(obj, list):
+            for item in obj:
+                if isinstance(item, str):
+                    self._add_terms(terms, self._weigh(item, PROPERTY_TEXT_WEIGHT))
+                else:
+                    self._collect_properties(item, terms)
+
+    @staticmethod
+    def _add_terms(terms: dict[str, float], new_terms: dict[str, float]) -> None:
+        """Merge terms, keeping the highest weight per term."""
+        for term, weight in new_terms.items():
+            if weight > terms.get(term, 0.0):
+                terms[term] = weight
+
+
+async def ensure_indexed(
+    index: SchemaIndex,
+    client: SchemaClient,
+    schemas: list[dict],
+    include_bodies: bool,
+    concurrency: int,
+) -> dict[str, dict | None]:
+    """Bring the index up to date for a set of listed schemas.
+
+    Args:
+        index: Index to update
+        client: Schema client used to fetch missing bodies
+        schemas: Schema listing entries
+        include_bodies: Whether title/description/property fields are needed
+        concurrency: Maximum number of body fetches in flight
+
+    Returns:
+        Bodies fetched during this call, keyed by schema ID
+    """
+    for schema in schemas:
+        index.add_listing(schema)
+
+    if not include_bodies:
+        return {}
+
+    stale = [s for s in schemas if index.needs_body(schema_id(s), s.get("status"))]
+    bodies = await fetch_schema_bodies(client, stale, concurrency)
+
+    statuses = {schema_id(s): s.get("status") for s in stale}
+    for sid, body in bodies.items():
+        if body is not None:
+            index.add_body(sid, body, statuses.get(sid))
+
+    return bodies
+
+
+# Shared indexes keyed by (server URL, data partition)
+_indexes: dict[tuple[str, str], SchemaIndex] = {}
+
+
+def get_schema_index(server_url: str, partition: str) -> SchemaIndex:
+    """Get the process-wide schema index for an OSDU environment.
+
+    Args:
+        server_url: OSDU server URL
+        partition: Data partition
+
+    Returns:
+        Shared schema index
+    """
+    key = (server_url, partition)
+    index = _indexes.get(key)
+    if index is None:
+        ttl = float(get_config().get("schema", "cache_ttl", DEFAULT_BODY_TTL) or 0)
+        index = _indexes[key] = SchemaIndex(body_ttl=ttl)
+    return index
+
+
+def reset_schema_index() -> None:
+    """Discard all shared schema indexes."""
+    _indexes.clear()
+
+
+async def refresh_schema_index_periodically(interval: float) -> None:
+    """Keep the shared schema index warm while the server runs.
+
+    Each cycle lists schemas and indexes any body that is missing or stale.
+    Bodies normally come from the on-disk schema cache, so steady-state
+    refreshes do not touch the network for PUBLISHED schemas.
+
+    Args:
+        interval: Seconds between refresh cycles
+    """
+    while True:
+        config = get_config()
+        client = SchemaClient(config, get_auth_handler(config))
+        try:
+            index = get_schema_index(
+                config.get("server", "url"), config.get("server", "data_partition")
+            )
+            schemas = [
+                schema
+                async for page in client.iter_schema_pages(status=None)
+                for schema in page.get("schemaInfos") or page.get("schemas", [])
+            ]
+            fetched = await ensure_indexed(
+                index,
+                client,
+                schemas,
+                include_bodies=True,
+                concurrency=int(
+                    config.get("schema", "fetch_concurrency", DEFAULT_FETCH_CONCURRENCY)
+                    or DEFAULT_FETCH_CONCURRENCY
+                ),
+            )
+            logger.info(
+                "Schema index refreshed",
+                extra={
+                    "schema_count": len(schemas),
+                    "bodies_indexed": len(fetched),
+                    "index_size": len(index),
+                },
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Schema index refresh failed: {e}")
+        finally:
+            await client.close()
+
+        await asyncio.sleep(interval)
@@ -0,0 +1,373 @@
+"""Per-service circuit breakers and adaptive concurrency limits.
+
+Every OSDU service (storage, search, schema, ...) gets its own guard, so a
+degraded service sheds load quickly while healthy ones keep their full
+throughput.
+
+- The circuit breaker opens after consecutive failures (connection errors,
+  timeouts and 5xx responses) and then rejects calls immediately. After the
+  reset timeout a single probe request is let through (half-open); its
+  outcome closes the circuit again or keeps it open.
+- The concurrency limiter follows AIMD: each healthy response raises the
+  limit by 1/limit (about one slot per round of requests), while failures,
+  throttling (429) and latency well above the observed baseline halve it.
+  Baselines are kept per HTTP method, so slow bulk writes (PUT) are not
+  compared against quick reads.
+
+Configuration:
+- OSDU_MCP_SERVER_CIRCUIT_BREAKER_ENABLED: Enable circuit breakers (default: true)
+- OSDU_MCP_SERVER_CIRCUIT_FAILURE_THRESHOLD: Failures that open a circuit (default: 5)
+- OSDU_MCP_SERVER_CIRCUIT_RESET_TIMEOUT: Seconds before a probe is allowed (default: 30)
+- OSDU_MCP_SERVER_ADAPTIVE_CONCURRENCY_ENABLED: Enable the limiter (default: true)
+- OSDU_MCP_SERVER_ADAPTIVE_MAX_CONCURRENCY: Upper limit per service
+  (default: connection_limit_per_host)
+- OSDU_MCP_SERVER_ADAPTIVE_LATENCY_TOLERANCE: Latency, as a multiple of the
+  baseline, treated as congestion (default: 4.0)
+"""
+
+import asyncio
+import time
+from collections import deque
+
+from .config_manager import ConfigManager, parse_setting
+from .exceptions import OSMCPConnectionError
+from .logging_manager import get_logger
+from .service_urls import OSMCPService
+from .session_registry import DEFAULT_CONNECTION_LIMIT_PER_HOST
+
+logger = get_logger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+DEFAULT_LATENCY_TOLERANCE = 4.0
+DEFAULT_MIN_CONCURRENCY = 1
+# Share of the distance to a slower sample the latency baseline moves per call
+BASELINE_DRIFT = 0.01
+DECREASE_FACTOR = 0.5
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one service."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ):
+        """Initialize a closed circuit breaker.
+
+        Args:
+            name: Service name used in errors and logs
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def check(self) -> bool:
+        """Admit a call or reject it while the circuit is open.
+
+        Returns:
+            True if the admitted call is the half-open probe
+
+        Raises:
+            OSMCPConnectionError: If the circuit is open
+        """
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                raise OSMCPConnectionError(
+                    f"{self.name} service unavailable: circuit open after "
+                    f"{self._failures} consecutive failures, next probe in "
+                    f"{remaining:.0f}s"
+                )
+            self.state = self.HALF_OPEN
+
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                raise OSMCPConnectionError(
+                    f"{self.name} service unavailable: waiting for the "
+                    "recovery probe to complete"
+                )
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self, probe: bool = False) -> None:
+        """Record a call that reached a healthy service."""
+        if probe:
+            self._probe_in_flight = False
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit for {self.name} service closed")
+        self.state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self, probe: bool = False) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        if probe:
+            self._probe_in_flight = False
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    f"Circuit for {self.name} service opened",
+                    extra={
+                        "service": self.name,
+                        "failures": self._failures,
+                        "reset_timeout": self.reset_timeout,
+                    },
+                )
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def record_abandoned(self, probe: bool = False) -> None:
+        """Record a call that ended without an outcome (e.g. cancelled)."""
+        if probe:
+            self._probe_in_flight = False
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for one service."""
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = DEFAULT_MIN_CONCURRENCY,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+    ):
+        """Initialize the limiter at its maximum.
+
+        Args:
+            max_limit: Largest number of requests in flight
+            min_limit: Smallest number of requests in flight
+            latency_tolerance: Latency, as a multiple of the baseline,
+                treated as congestion
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        # Lowest typical latency per HTTP method
+        self._baselines: dict[str | None, float] = {}
+        self._last_decrease = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next waiter if the limit allows."""
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self, latency: float, method: str | None = None) -> None:
+        """Adjust the limit after a healthy response.
+
+        Args:
+            latency: Seconds the request took
+            method: HTTP method, whose own latency baseline is used
+        """
+        baseline = self._baselines.get(method)
+        if baseline is None or latency < baseline:
+            baseline = latency
+        else:
+            baseline += (latency - baseline) * BASELINE_DRIFT
+        self._baselines[method] = baseline
+
+        if latency > baseline * self.latency_tolerance:
+            self.on_overload(latency)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._wake()
+
+    def on_overload(self, latency: float) -> None:
+        """Halve the limit, at most once per round trip.
+
+        Args:
+            latency: Seconds the overloaded request took
+        """
+        now = time.monotonic()
+        if now - self._last_decrease < latency:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * DECREASE_FACTOR)
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters in arrival order."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class ServiceGuard:
+    """Circuit breaker and concurrency limiter wrapped around one service."""
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker | None = None,
+        limiter: AdaptiveLimiter | None = None,
+    ):
+        """Initialize the guard.
+
+        Args:
+            breaker: Circuit breaker, or None if disabled
+            limiter: Concurrency limiter, or None if disabled
+        """
+        self.breaker = breaker
+        self.limiter = limiter
+
+    async def acquire(self) -> bool:
+        """Admit a request, waiting for a concurrency slot if needed.
+
+        Returns:
+            True if the request is the circuit breaker's half-open probe
+
+        Raises:
+            OSMCPConnectionError: If the service's circuit is open
+        """
+        probe = self.breaker.check() if self.breaker else False
+        if self.limiter:
+            try:
+                await self.limiter.acquire()
+            except BaseException:
+                if self.breaker:
+                    self.breaker.record_abandoned(probe)
+                raise
+        return probe
+
+    def release(
+        self,
+        probe: bool,
+        latency: float,
+        status: int | None = None,
+        failed: bool = False,
+        method: str | None = None,
+    ) -> None:
+        """Record the outcome of an admitted request.
+
+        Args:
+            probe: Value returned by acquire()
+            latency: Seconds the request took
+            status: HTTP status code, or None if there was no response
+            failed: Whether the request failed to reach the service
+                (connection error or timeout)
+            method: HTTP method of the request
+        """
+        unhealthy = failed or (status is not None and status >= 500)
+        if self.breaker:
+            if unhealthy:
+                self.breaker.record_failure(probe)
+            elif status is not None:
+                self.breaker.record_success(probe)
+            else:
+                self.breaker.record_abandoned(probe)
+        if self.limiter:
+            if unhealthy or status == 429:
+                self.limiter.on_overload(latency)
+            elif status is not None:
+                self.limiter.on_success(latency, method)
+            self.limiter.release()
+
+
+# Guards for the process lifetime, keyed by server URL and service
+_guards: dict[tuple[str, OSMCPService], ServiceGuard] = {}
+
+
+def _enabled(config: ConfigManager, key: str) -> bool:
+    """Read an on/off server setting that defaults to on."""
+    value = config.get("server", key, True)
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes", "on")
+    return value is not False
+
+
+def get_service_guard(
+    config: ConfigManager, server_url: str, service: OSMCPService
+) -> ServiceGuard:
+    """Get the shared guard for a service.
+
+    Args:
+        config: Configuration manager instance
+        server_url: OSDU server URL
+        service: OSDU service the request is for
+
+    Returns:
+        Shared guard for the service
+    """
+    key = (server_url, service)
+    guard = _guards.get(key)
+    if guard is None:
+        breaker = None
+        if _enabled(config, "circuit_breaker_enabled"):
+            breaker = CircuitBreaker(
+                service.value,
+                failure_threshold=parse_setting(
+                    config,
+                    "server",
+                    "circuit_failure_threshold",
+                    int,
+                    DEFAULT_FAILURE_THRESHOLD,
+                ),
+                reset_timeout=parse_setting(
+                    config,
+                    "server",
+                    "circuit_reset_timeout",
+                    float,
+                    DEFAULT_RESET_TIMEOUT,
+                ),
+            )
+        limiter = None
+        if _enabled(config, "adaptive_concurrency_enabled"):
+            max_limit = parse_setting(
+                config,
+                "server",
+                "connection_limit_per_host",
+                int,
+                DEFAULT_CONNECTION_LIMIT_PER_HOST,
+            )
+            limiter = AdaptiveLimiter(
+                max_limit=parse_setting(
+                    config, "server", "adaptive_max_concurrency", int, max_limit
+                ),
+                latency_tolerance=parse_setting(
+                    config,
+                    "server",
+                    "adaptive_latency_tolerance",
+                    float,
+                    DEFAULT_LATENCY_TOLERANCE,
+                ),
+            )
+        guard = _guards[key] = ServiceGuard(breaker, limiter)
+    return guard
+
+
+def reset_service_guards() -> None:
+    """Discard all circuit breaker and concurrency limiter state."""
+    _guards.clear()
@@ -0,0 +1,141 @@
+"""Process-wide HTTP session registry for OSDU MCP Server.
+
+This module keeps one pooled, keep-alive aiohttp session per OSDU base URL
+for the lifetime of the MCP server (see ADR-005). Tools keep creating their
+service clients per call, but while the registry is active those clients
+borrow the shared session instead of opening a new TCP/TLS connection.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+from aiohttp import ClientSession, TCPConnector
+
+from .config_manager import ConfigManager, get_config
+from .json_codec import get_json_codec
+from .logging_manager import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 30
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+
+
+class SessionRegistry:
+    """Registry of long-lived aiohttp sessions keyed by base URL.
+
+    The registry is inactive until ``start()`` is called, which happens in the
+    server lifespan. While inactive, clients fall back to owning a private
+    session so that library and test usage keep working unchanged.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an inactive session registry."""
+        self._sessions: dict[str, ClientSession] = {}
+        self._lock = asyncio.Lock()
+        self._active = False
+        self._connection_limit = DEFAULT_CONNECTION_LIMIT
+        self._connection_limit_per_host = DEFAULT_CONNECTION_LIMIT_PER_HOST
+        self._keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+        self._json_serialize: Callable[[Any], str] = json.dumps
+
+    @property
+    def active(self) -> bool:
+        """Whether shared sessions are being handed out."""
+        return self._active
+
+    def start(self, config: ConfigManager | None = None) -> None:
+        """Activate the registry and read connection pool settings.
+
+        Reads configuration from:
+        - OSDU_MCP_SERVER_CONNECTION_LIMIT: Total pooled connections (default: 100)
+        - OSDU_MCP_SERVER_CONNECTION_LIMIT_PER_HOST: Per-host connections (default: 30)
+        - OSDU_MCP_SERVER_KEEPALIVE_TIMEOUT: Idle keep-alive seconds (default: 30)
+
+        Args:
+            config: Configuration manager instance (if None, the shared one is used)
+        """
+        config = config or get_config()
+        self._connection_limit = int(
+            config.get("server", "connection_limit", DEFAULT_CONNECTION_LIMIT)
+        )
+        self._connection_limit_per_host = int(
+            config.get(
+                "server",
+                "connection_limit_per_host",
+                DEFAULT_CONNECTION_LIMIT_PER_HOST,
+            )
+        )
+        self._keepalive_timeout = float(
+            config.get("server", "keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT)
+        )
+        self._json_serialize = get_json_codec(config).dumps_str
+        self._active = True
+
+        logger.info(
+            "Shared HTTP session registry started",
+            extra={
+                "connection_limit": self._connection_limit,
+                "connection_limit_per_host": self._connection_limit_per_host,
+                "keepalive_timeout": self._keepalive_timeout,
+            },
+        )
+
+    async def get_session(self, base_url: str) -> ClientSession:
+        """Get the shared session for a base URL, creating it on first use.
+
+        Args:
+            base_url: OSDU platform base URL
+
+        Returns:
+            Open aiohttp session backed by a keep-alive connection pool
+        """
+        session = self._sessions.get(base_url)
+        if session is not None and not session.closed:
+            return session
+
+        async with self._lock:
+            session = self._sessions.get(base_url)
+            if session is None or session.closed:
+                connector = TCPConnector(
+                    limit=self._connection_limit,
+                    limit_per_host=self._connection_limit_per_host,
+                    keepalive_timeout=self._keepalive_timeout,
+                )
+                session = ClientSession(
+                    connector=connector, json_serialize=self._json_serialize
+                )
+                self._sessions[base_url] = session
+                logger.debug(f"Opened shared HTTP session for {base_url}")
+            return session
+
+    async def close(self) -> None:
+        """Close all shared sessions and deactivate the registry."""
+        self._active = False
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+        logger.info(
+            "Shared HTTP session registry closed",
+            extra={"session_count": len(sessions)},
+        )
+
+
+# Global instance for the server lifetime
+_registry = SessionRegistry()
+
+
+def get_session_registry() -> SessionRegistry:
+    """Get the process-wide session registry (convenience function).
+
+    Returns:
+        Shared session registry instance
+    """
+    return _registry
@@ -0,0 +1,120 @@
+"""Pluggable token exchange hooks for OSDU on AWS.
+
+OSDU on AWS deployments usually front the platform with Amazon Cognito and
+expect a Cognito-issued JWT rather than an STS session token. A token
+exchange turns deployment-specific credentials into a Bearer token with a
+known expiry, which AuthHandler then caches until it is close to expiring.
+
+Configuration (environment variables):
+- OSDU_MCP_AUTH_COGNITO_TOKEN_URL: Cognito OAuth2 token endpoint
+- OSDU_MCP_AUTH_COGNITO_CLIENT_ID: App client ID
+- OSDU_MCP_AUTH_COGNITO_CLIENT_SECRET: App client secret
+- OSDU_MCP_AUTH_SCOPE: Optional space-separated OAuth scopes
+"""
+
+import os
+import time
+from typing import Protocol
+
+import aiohttp
+
+from .exceptions import OSMCPAuthError
+from .logging_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenExchange(Protocol):
+    """Source of Bearer tokens with an absolute expiry."""
+
+    async def exchange(self) -> tuple[str, float]:
+        """Obtain a new token.
+
+        Returns:
+            Tuple of (access token, expiry as POSIX timestamp)
+        """
+        ...
+
+
+class CognitoClientCredentialsExchange:
+    """OAuth2 client-credentials flow against an Amazon Cognito token endpoint."""
+
+    def __init__(
+        self,
+        token_url: str,
+        client_id: str,
+        client_secret: str,
+        scope: str | None = None,
+        timeout: float = 30,
+    ):
+        """Initialize the Cognito client-credentials exchange.
+
+        Args:
+            token_url: Cognito token endpoint (https://<domain>/oauth2/token)
+            client_id: Cognito app client ID
+            client_secret: Cognito app client secret
+            scope: Optional space-separated OAuth scopes
+            timeout: Request timeout in seconds
+        """
+        self.token_url = token_url
+        self.client_id = client_id
+        self._client_secret = client_secret
+        self.scope = scope
+        self._timeout = timeout
+
+    @classmethod
+    def from_environment(cls) -> "CognitoClientCredentialsExchange | None":
+        """Create an exchange from environment variables if fully configured.
+
+        Returns:
+            Configured exchange, or None if Cognito settings are absent
+        """
+        token_url = os.environ.get("OSDU_MCP_AUTH_COGNITO_TOKEN_URL")
+        client_id = os.environ.get("OSDU_MCP_AUTH_COGNITO_CLIENT_ID")
+        client_secret = os.environ.get("OSDU_MCP_AUTH_COGNITO_CLIENT_SECRET")
+        if not (token_url and client_id and client_secret):
+            return None
+
+        return cls(
+            token_url,
+            client_id,
+            client_secret,
+            scope=os.environ.get("OSDU_MCP_AUTH_SCOPE"),
+        )
+
+    async def exchange(self) -> tuple[str, float]:
+        """Request an access token using the client-credentials grant.
+
+        Returns:
+            Tuple of (access token, expiry as POSIX timestamp)
+
+        Raises:
+            OSMCPAuthError: If the token endpoint rejects the request
+        """
+        form = {"grant_type": "client_credentials"}
+        if self.scope:
+            form["scope"] = self.scope
+
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self._timeout)
+        ) as session:
+            async with session.post(
+                self.token_url,
+                data=form,
+                auth=aiohttp.BasicAuth(self.client_id, self._client_secret),
+            ) as response:
+                if response.status >= 400:
+                    error_text = await response.text()
+                    raise OSMCPAuthError(
+                        f"Cognito token request failed (HTTP {response.status}): "
+                        f"{error_text}"
+                    )
+                payload = await response.json()
+
+        token = payload.get("access_token")
+        if not token:
+            raise OSMCPAuthError("Cognito token response missing access_token")
+
+        expires_on = time.time() + float(payload.get("expires_in", 3600))
+        logger.info("Cognito access token obtained successfully")
+        return token, expires_on
@@ -5,8 +5,8 @@ This module implements the health check tool as defined in ADR-007.
 
 from typing import Any
 
-from ..shared.auth_handler import AuthHandler
-from ..shared.config_manager import ConfigManager
+from ..shared.auth_handler import get_auth_handler
+from ..shared.config_manager import get_config
 from ..shared.exceptions import handle_osdu_exceptions
 from ..shared.osdu_client import OsduClient
 from ..shared.service_urls import OSMCPService, get_service_info_endpoint
@@ -30,8 +30,8 @@ async def health_check(
         Health status of OSDU connection and services
     """
     # Initialize components
-    config = ConfigManager()
-    auth_handler = AuthHandler(config)
+    config = get_config()
+    auth_handler = get_auth_handler(config)
     client = OsduClient(config, auth_handler)
 
     result = {
@@ -61,9 +61,8 @@ async def health_check(
         raise
 
     finally:
-        # Clean up resources
+        # Clean up resources (the shared auth handler outlives this call)
         await client.close()
-        auth_handler.close()
 
     return result
 
@@ -2,9 +2,9 @@
 
 import logging
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.legal_client import LegalClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import OSMCPError, handle_osdu_exceptions
 
 logger = logging.getLogger(__name__)
@@ -32,8 +32,8 @@ async def legaltag_batch_retrieve(names: list[str]) -> dict:
     if len(names) > 25:
         raise OSMCPError("Maximum 25 legal tags can be retrieved at once")
 
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = LegalClient(config, auth)
 
     try:
@@ -4,9 +4,9 @@ import logging
 import os
 from typing import Any
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.legal_client import LegalClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import OSMCPAPIError, handle_osdu_exceptions
 
 logger = logging.getLogger(__name__)
@@ -53,8 +53,8 @@ async def legaltag_create(
             status_code=403,
         )
 
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = LegalClient(config, auth)
 
     try:
@@ -2,9 +2,9 @@
 
 import logging
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.legal_client import LegalClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import OSMCPAPIError, handle_osdu_exceptions
 
 logger = logging.getLogger(__name__)
@@ -33,8 +33,8 @@ async def legaltag_delete(name: str, confirm: bool) -> dict:
             status_code=400,
         )
 
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = LegalClient(config, auth)
 
     try:
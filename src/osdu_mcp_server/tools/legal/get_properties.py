@@ -2,9 +2,9 @@
 
 import logging
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.legal_client import LegalClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import handle_osdu_exceptions
 
 logger = logging.getLogger(__name__)
@@ -47,8 +47,8 @@ async def legaltag_get_properties() -> dict:
             }
         }
     """
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = LegalClient(config, auth)
 
     try:
@@ -5,9 +5,9 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.partition_client import PartitionClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import OSMCPError, handle_osdu_exceptions
 from ...shared.utils import get_trace_id
 
@@ -60,8 +60,8 @@ async def partition_list(
 
     try:
         # Initialize dependencies
-        config = ConfigManager()
-        auth_handler = AuthHandler(config)
+        config = get_config()
+        auth_handler = get_auth_handler(config)
         client = PartitionClient(config, auth_handler)
 
         # Get partitions
@@ -3,9 +3,9 @@
 import logging
 from typing import Any
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.schema_client import SchemaClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import handle_osdu_exceptions
 
 logger = logging.getLogger(__name__)
@@ -81,8 +81,8 @@ async def schema_get(id: str) -> dict[str, Any]:
         - Schema status can be "DEVELOPMENT", "PUBLISHED", or "OBSOLETE"
         - Only DEVELOPMENT status schemas can be modified
     """
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = SchemaClient(config, auth)
 
     try:
@@ -2,9 +2,9 @@
 
 import logging
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.schema_client import SchemaClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import handle_osdu_exceptions
 
 logger = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ async def schema_list(
         status (str, optional): Schema status. Options: "DEVELOPMENT", "PUBLISHED", "OBSOLETE"
         scope (str, optional): Schema scope. Options: "INTERNAL" (custom schemas), "SHARED" (standard schemas)
         latest_version (bool, optional): Only return latest versions. Default: False
-        limit (int, optional): Maximum results to return. Range: 1-100. Default: 10
+        limit (int, optional): Maximum results to return; larger limits are paged transparently. Default: 10
         offset (int, optional): Pagination offset. Default: 0
 
     Returns:
@@ -52,8 +52,8 @@ async def schema_list(
         # List OSDU schemas with pagination
         schema_list(authority="osdu", limit=20, offset=40)
     """
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = SchemaClient(config, auth)
 
     try:
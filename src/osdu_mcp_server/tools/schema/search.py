@@ -3,15 +3,26 @@
 import fnmatch
 from typing import Dict, List, Union
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.schema_client import SchemaClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import handle_osdu_exceptions
 from ...shared.logging_manager import get_logger
+from ...shared.schema_index import (
+    ensure_indexed,
+    fetch_schema_bodies,
+    get_schema_index,
+    schema_id,
+)
 
 # Get a logger with feature flag support
 logger = get_logger(__name__)
 
+DEFAULT_FETCH_CONCURRENCY = 10
+
+# search_in fields that need the schema body rather than the schema listing
+CONTENT_SEARCH_FIELDS = ("title", "description", "properties", "content")
+
 
 @handle_osdu_exceptions
 async def schema_search(
@@ -28,13 +39,13 @@ async def schema_search(
     offset: int = 0,
     # Advanced options
     include_content: bool = False,
-    sort_by: str = "dateCreated",
+    sort_by: str | None = None,
     sort_order: str = "DESC",
 ) -> dict:
     """Advanced schema discovery with rich filtering and text search.
 
     Args:
-        text (str, optional): Text to search across schema content. Example: "pressure"
+        text (str, optional): Text to search across schema content. Every word must match. Example: "pressure"
         search_in (List[str], optional): Fields to search in. Default: ["title", "description", "properties"]
         version_pattern (str, optional): Version with wildcard support. Examples: "1.1.0", "1.*.*"
         filter (Dict, optional): Key-value filter criteria. Keys include:
@@ -47,7 +58,7 @@ async def schema_search(
         limit (int, optional): Maximum results to return. Range: 1-1000. Default: 100
         offset (int, optional): Pagination offset. Default: 0
         include_content (bool, optional): Include full schema content. Default: False
-        sort_by (str, optional): Field to sort by. Options: "dateCreated", "authority", "source", "entityType", "status", "scope", "id". Default: "dateCreated"
+        sort_by (str, optional): Field to sort by. Options: "relevance", "dateCreated", "authority", "source", "entityType", "status", "scope", "id". Default: "relevance" with text, otherwise "dateCreated"
         sort_order (str, optional): Sort direction. Options: "ASC", "DESC". Default: "DESC"
 
     Returns:
@@ -86,8 +97,8 @@ async def schema_search(
             limit=200
         )
     """
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = SchemaClient(config, auth)
 
     # Default search fields if not provided
@@ -146,26 +157,31 @@ async def schema_search(
 
         # Apply server-side filtering through the API
         logger.info(f"Executing schema list with server filters: {server_filters}")
-        api_limit = min(1000, limit * 2)  # Request more to account for client filtering
+
+        schemas_retrieved = 0
+        total_count = 0
+        filtered_schemas = []
 
         try:
-            # Make API request with server-side filters using search_schemas which internally redirects
-            # to list_schemas with the appropriate parameters - this ensures forward compatibility
-            # if a dedicated search endpoint is added in the future
-            response = await client.search_schemas(
+            # Walk every listing page (fetched concurrently) so matches beyond
+            # the first page are not missed; client-side filters are applied
+            # to each page as it arrives
+            async for page in client.search_schema_pages(
                 filter_criteria=server_filters,
                 latest_version=latest_version,
-                limit=api_limit,
-                offset=offset,
-            )
+            ):
+                # API returns "schemaInfos" but we map to "schemas" for consistency
+                page_schemas = page.get("schemaInfos") or page.get("schemas", [])
+                schemas_retrieved += len(page_schemas)
+                total_count = max(total_count, page.get("totalCount", 0))
 
-            # Extract schemas from response - API returns "schemaInfos" but we map to "schemas" for consistency
-            schemas = response.get("schemaInfos", [])
-            if not schemas:
-                # Fallback - though schemaInfos is the expected field name from the API
-                schemas = response.get("schemas", [])
+                filtered_schemas.extend(
+                    schema
+                    for schema in page_schemas
+                    if _matches_client_filters(schema, client_filters, version_pattern)
+                )
 
-            logger.info(f"Retrieved {len(schemas)} schemas from API response")
+            logger.info(f"Retrieved {schemas_retrieved} schemas from API response")
 
         except Exception as e:
             logger.error(f"Error during schema search: {str(e)}")
@@ -175,46 +191,62 @@ async def schema_search(
                 "partition": partition,
             }
 
-        total_count = response.get("totalCount", len(schemas))
+        total_count = total_count or schemas_retrieved
 
-        logger.info(
-            f"Retrieved {len(schemas)} schemas from server, applying client-side filtering"
+        fetch_concurrency = int(
+            config.get("schema", "fetch_concurrency", DEFAULT_FETCH_CONCURRENCY)
+            or DEFAULT_FETCH_CONCURRENCY
         )
 
-        # Apply client-side filtering
-        filtered_schemas = []
-        for schema in schemas:
-            if _matches_client_filters(schema, client_filters, version_pattern):
-                # If text search is enabled, check if schema matches
-                if text:
-                    matches = await _matches_text_search(
-                        schema, text, search_in, include_content, client
-                    )
-                    if not matches:
-                        continue
-
-                # Add schema to filtered results
-                filtered_schemas.append(schema)
-
-                # Fetch full schema content if requested
-                if include_content and "id" in schema.get("schemaIdentity", {}):
-                    schema_id = schema["schemaIdentity"]["id"]
-                    try:
-                        schema_content = await client.get_schema(schema_id)
-                        schema["schemaContent"] = schema_content.get("schema", {})
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to fetch schema content for {schema_id}: {e}"
-                        )
+        # Schema bodies fetched during this search, reused for schemaContent
+        bodies: dict[str, dict | None] = {}
+        scores: dict[str, float] = {}
+
+        # If text search is enabled, answer it from the local schema index
+        if text:
+            index = get_schema_index(config.get("server", "url"), partition)
+            bodies = await ensure_indexed(
+                index,
+                client,
+                filtered_schemas,
+                include_bodies=any(f in search_in for f in CONTENT_SEARCH_FIELDS),
+                concurrency=fetch_concurrency,
+            )
+            # Listing entries without an ID cannot be matched and are dropped
+            ids = [sid for sid in map(schema_id, filtered_schemas) if sid]
+            scores = index.search(text, search_in, ids)
+            filtered_schemas = [
+                schema for schema in filtered_schemas if schema_id(schema) in scores
+            ]
 
         # Apply sorting if needed
-        if sort_by:
+        if sort_by is None:
+            sort_by = "relevance" if text else "dateCreated"
+        if sort_by == "relevance":
+            filtered_schemas.sort(
+                key=lambda schema: scores.get(schema_id(schema) or "", 0.0),
+                reverse=(sort_order.upper() == "DESC"),
+            )
+        elif sort_by:
             filtered_schemas = _sort_schemas(filtered_schemas, sort_by, sort_order)
 
-        # Apply pagination
-        start_idx = 0
-        end_idx = min(limit, len(filtered_schemas))
-        paginated_schemas = filtered_schemas[start_idx:end_idx]
+        # Apply pagination to the complete filtered set
+        end_idx = offset + limit
+        paginated_schemas = filtered_schemas[offset:end_idx]
+
+        # Attach full schema content, fetching only bodies not already loaded
+        if include_content:
+            missing = [
+                schema
+                for schema in paginated_schemas
+                if schema_id(schema) not in bodies
+            ]
+            bodies.update(await fetch_schema_bodies(client, missing, fetch_concurrency))
+            for schema in paginated_schemas:
+                sid = schema_id(schema)
+                body = bodies.get(sid) if sid else None
+                if body is not None:
+                    schema["schemaContent"] = body
 
         # Build response
         result = {
@@ -231,8 +263,7 @@ async def schema_search(
         logger.info(
             "Schema search completed successfully",
             extra={
-                "requested": api_limit,
-                "retrieved": len(schemas),
+                "retrieved": schemas_retrieved,
                 "filtered": len(filtered_schemas),
                 "returned": len(paginated_schemas),
             },
@@ -283,115 +314,6 @@ def _matches_client_filters(
     return True
 
 
-async def _matches_text_search(
-    schema: dict,
-    text: str,
-    search_fields: list[str],
-    include_content: bool,
-    client: SchemaClient,
-) -> bool:
-    """Check if schema matches text search criteria."""
-    # Convert to lowercase for case-insensitive search
-    text_lower = text.lower()
-
-    # Search in schema metadata
-    schema_identity = schema.get("schemaIdentity", {})
-
-    # Check in identity fields
-    if (
-        "id" in search_fields
-        and schema_identity.get("id", "").lower().find(text_lower) != -1
-    ):
-        return True
-    if (
-        "authority" in search_fields
-        and schema_identity.get("authority", "").lower().find(text_lower) != -1
-    ):
-        return True
-    if (
-        "source" in search_fields
-        and schema_identity.get("source", "").lower().find(text_lower) != -1
-    ):
-        return True
-    if (
-        "entityType" in search_fields
-        and schema_identity.get("entityType", "").lower().find(text_lower) != -1
-    ):
-        return True
-
-    # Need to fetch full schema if searching in content
-    if any(
-        field in search_fields
-        for field in ["title", "description", "properties", "content"]
-    ):
-        if include_content and "schemaContent" in schema:
-            schema_content = schema["schemaContent"]
-        else:
-            try:
-                schema_id = schema_identity.get("id")
-                if not schema_id:
-                    return False
-
-                schema_data = await client.get_schema(schema_id)
-                schema_content = schema_data.get("schema", {})
-            except Exception:
-                return False
-
-        # Search in schema content fields
-        if (
-            "title" in search_fields
-            and schema_content.get("title", "").lower().find(text_lower) != -1
-        ):
-            return True
-        if (
-            "description" in search_fields
-            and schema_content.get("description", "").lower().find(text_lower) != -1
-        ):
-            return True
-
-        # Search in properties (recursively)
-        if "properties" in search_fields:
-            properties = schema_content.get("properties", {})
-            if _search_in_object(properties, text_lower):
-                return True
-
-    return False
-
-
-def _search_in_object(obj: dict, text: str) -> bool:
-    """Recursively search for text in a nested object."""
-    if not isinstance(obj, dict):
-        return False
-
-    # Search in current object
-    for key, value in obj.items():
-        # Check if text is in key
-        if text in key.lower():
-            return True
-
-        # Check if text is in string value
-        if isinstance(value, str) and text in value.lower():
-            return True
-
-        # Recursively check nested objects
-        elif isinstance(value, dict):
-            if _search_in_object(value, text):
-                return True
-
-        # Check in list elements
-        elif isinstance(value, list):
-            for item in value:
-                if (
-                    isinstance(item, dict)
-                    and _search_in_object(item, text)
-                    or isinstance(item, str)
-                    and text in item.lower()
-                ):
-                    return True
-
-    return False
-
-
 def _sort_schemas(schemas: list[dict], sort_by: str, sort_order: str) -> list[dict]:
     """Sort schemas by the specified field."""
     # Map sort_by values to actual schema keys
@@ -1,11 +1,13 @@
 """Search service tools."""
 
 from .query import search_query
+from .query_with_cursor import search_query_with_cursor
 from .search_by_id import search_by_id
 from .search_by_kind import search_by_kind
 
 __all__ = [
     "search_query",
+    "search_query_with_cursor",
     "search_by_id",
     "search_by_kind",
 ]
@@ -1,16 +1,20 @@
 """Execute search queries using Elasticsearch syntax."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from ...shared.clients import SearchClient
-from ...shared.config_manager import ConfigManager
-from ...shared.auth_handler import AuthHandler
+from ...shared.config_manager import get_config
+from ...shared.auth_handler import get_auth_handler
 from ...shared.exceptions import handle_osdu_exceptions
 
 
 @handle_osdu_exceptions
 async def search_query(
-    query: str, kind: str = "*:*:*:*", limit: int = 50, offset: int = 0
+    query: str,
+    kind: str = "*:*:*:*",
+    limit: int = 50,
+    offset: int = 0,
+    returned_fields: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Execute search queries using Elasticsearch syntax.
 
@@ -19,6 +23,9 @@ async def search_query(
         kind: Kind pattern to search (default: "*:*:*:*")
         limit: Maximum results (default: 50, max: 1000)
         offset: Pagination offset (default: 0)
+        returned_fields: Optional fields to return instead of the full record,
+            e.g. ["data.FacilityName", "data.SpatialLocation"]. Bare names are
+            treated as data fields. Omit to return the whole data block
 
     Returns:
         Dictionary containing search results with the following structure:
@@ -48,13 +55,17 @@ async def search_query(
     if limit > 1000:
         limit = 1000
 
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = SearchClient(config, auth)
 
     try:
         result = await client.search_query(
-            query=query, kind=kind, limit=limit, offset=offset
+            query=query,
+            kind=kind,
+            limit=limit,
+            offset=offset,
+            returned_fields=returned_fields,
         )
         return result
     finally:
@@ -0,0 +1,77 @@
+"""Page through large search result sets using search cursors."""
+
+from typing import Any, Dict, List, Optional
+
+from ...shared.auth_handler import get_auth_handler
+from ...shared.clients import SearchClient
+from ...shared.config_manager import get_config
+from ...shared.exceptions import handle_osdu_exceptions
+
+
+@handle_osdu_exceptions
+async def search_query_with_cursor(
+    query: str,
+    kind: str = "*:*:*:*",
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    returned_fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Page through large search result sets using search cursors.
+
+    Use this instead of search_query when walking more results than fit in a
+    single offset window. Pass the returned cursor back unchanged to get the
+    next page; every page costs the same regardless of depth.
+
+    Args:
+        query: Elasticsearch query syntax
+        kind: Kind pattern to search (default: "*:*:*:*")
+        limit: Maximum results per page (default: 100, max: 1000)
+        cursor: Continuation token from the previous page (omit for the first)
+        returned_fields: Optional fields to return instead of the full record,
+            e.g. ["data.FacilityName", "data.SpatialLocation"]. Bare names are
+            treated as data fields. Omit to return the whole data block
+
+    Returns:
+        Dictionary containing search results with the following structure:
+        {
+            "success": true,
+            "results": [
+                {
+                    "id": str,
+                    "kind": str,
+                    "data": {...},
+                    "createTime": str,
+                    "version": int (optional)
+                }
+            ],
+            "totalCount": int,
+            "cursor": str | None,  # None when there are no more pages
+            "searchMeta": {
+                "query_executed": str,
+                "execution_time_ms": int
+            },
+            "partition": str
+        }
+    """
+    # Validate parameters
+    if not query:
+        raise ValueError("Query parameter is required")
+
+    if limit > 1000:
+        limit = 1000
+
+    config = get_config()
+    auth = get_auth_handler(config)
+    client = SearchClient(config, auth)
+
+    try:
+        result = await client.search_query_with_cursor(
+            query=query,
+            kind=kind,
+            limit=limit,
+            cursor=cursor,
+            returned_fields=returned_fields,
+        )
+        return result
+    finally:
+        await client.close()
@@ -1,20 +1,25 @@
 """Find specific records by ID."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from ...shared.clients import SearchClient
-from ...shared.config_manager import ConfigManager
-from ...shared.auth_handler import AuthHandler
+from ...shared.config_manager import get_config
+from ...shared.auth_handler import get_auth_handler
 from ...shared.exceptions import handle_osdu_exceptions
 
 
 @handle_osdu_exceptions
-async def search_by_id(id: str, limit: int = 10) -> Dict[str, Any]:
+async def search_by_id(
+    id: str, limit: int = 10, returned_fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """Find specific records by ID.
 
     Args:
         id: Record ID to search for
         limit: Maximum results (default: 10)
+        returned_fields: Optional fields to return instead of the full record,
+            e.g. ["data.FacilityName", "data.SpatialLocation"]. Bare names are
+            treated as data fields. Omit to return the whole data block
 
     Returns:
         Dictionary containing search results with the following structure:
@@ -41,12 +46,14 @@ async def search_by_id(id: str, limit: int = 10) -> Dict[str, Any]:
     if not id:
         raise ValueError("ID parameter is required")
 
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = SearchClient(config, auth)
 
     try:
-        result = await client.search_by_id(record_id=id, limit=limit)
+        result = await client.search_by_id(
+            record_id=id, limit=limit, returned_fields=returned_fields
+        )
         return result
     finally:
         await client.close()
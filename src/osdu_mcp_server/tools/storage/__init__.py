@@ -3,9 +3,13 @@
 # Import all storage tools for easy access
 from .create_update_records import storage_create_update_records
 from .delete_record import storage_delete_record
+from .export_ndjson import storage_export_ndjson
+from .export_parquet import storage_export_parquet
 from .fetch_records import storage_fetch_records
 from .get_record import storage_get_record
+from .get_record_history import storage_get_record_history
 from .get_record_version import storage_get_record_version
+from .ingest_ndjson import storage_ingest_ndjson
 from .list_record_versions import storage_list_record_versions
 from .purge_record import storage_purge_record
 from .query_records_by_kind import storage_query_records_by_kind
@@ -15,8 +19,12 @@ __all__ = [
     "storage_get_record",
     "storage_get_record_version",
     "storage_list_record_versions",
+    "storage_get_record_history",
     "storage_query_records_by_kind",
     "storage_fetch_records",
+    "storage_ingest_ndjson",
+    "storage_export_ndjson",
+    "storage_export_parquet",
     "storage_delete_record",
     "storage_purge_record",
 ]
@@ -1,8 +1,8 @@
 """Tool for creating or updating records."""
 
-from ...shared.auth_handler import AuthHandler
-from ...shared.clients.storage_client import StorageClient
-from ...shared.config_manager import ConfigManager
+from ...shared.auth_handler import get_auth_handler
+from ...shared.clients.storage_client import INGEST_BATCH_SIZE, StorageClient
+from ...shared.config_manager import get_config
 from ...shared.exceptions import handle_osdu_exceptions
 from ...shared.logging_manager import get_logger
 
@@ -11,7 +11,7 @@ logger = get_logger(__name__)
 
 @handle_osdu_exceptions
 async def storage_create_update_records(
-    records: list[dict], skip_dupes: bool = False
+    records: list[dict], skip_dupes: bool = False, bulk: bool = False
 ) -> dict:
     """Create new records or update existing ones.
 
@@ -31,6 +31,9 @@ async def storage_create_update_records(
             - meta: Optional array - Additional metadata
             - tags: Optional object - User-defined tags
         skip_dupes: Optional boolean - Skip duplicates when updating (default: false)
+        bulk: Optional boolean - Split records into concurrent batches and report
+            failures per record instead of failing the whole call. Used
+            automatically for more than 500 records (default: false)
 
     Returns:
         Dictionary containing created/updated record information with the structure:
@@ -49,13 +52,35 @@ async def storage_create_update_records(
             "partition": str
         }
 
+        In bulk mode, record entries also carry their input "index", and the
+        result adds "failedRecords" (with "error"), "batchCount" and
+        "failedBatchCount". Invalid records are reported in "failedRecords"
+        while the valid ones are written; "success" is false if any record
+        failed.
+
+    Each record's data is validated locally against the schema of its kind
+    before anything is written; violations are reported per record.
+
     Note: Requires OSDU_MCP_ENABLE_WRITE_MODE=true
     """
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = StorageClient(config, auth)
 
     try:
+        if bulk or len(records) > INGEST_BATCH_SIZE:
+            report = await client.ingest_records(records, skip_dupes)
+            result = {
+                "success": not report["failedRecords"],
+                **report,
+                "created": True,
+                "write_enabled": True,
+                "partition": config.get("server", "data_partition"),
+            }
+            if not report["skippedRecords"]:
+                del result["skippedRecords"]
+            return result
+
         # Create or update records
         response = await client.create_update_records(records, skip_dupes)
 
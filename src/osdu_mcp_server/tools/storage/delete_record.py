@@ -1,8 +1,8 @@
 """Tool for logically deleting a record."""
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.storage_client import StorageClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import handle_osdu_exceptions
 from ...shared.logging_manager import get_logger
 
@@ -28,8 +28,8 @@ async def storage_delete_record(id: str) -> dict:
 
     Note: Requires OSDU_MCP_ENABLE_DELETE_MODE=true
     """
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = StorageClient(config, auth)
 
     try:
@@ -0,0 +1,107 @@
+"""Tool for exporting records to an NDJSON file."""
+
+import asyncio
+
+from ...shared.auth_handler import get_auth_handler
+from ...shared.clients.search_client import SearchClient
+from ...shared.clients.storage_client import StorageClient
+from ...shared.config_manager import get_config
+from ...shared.exceptions import handle_osdu_exceptions
+from ...shared.logging_manager import get_logger
+from ...shared.ndjson import NdjsonWriter, resolve_export_path
+from ...shared.record_export import search_pages, storage_pages, write_pages
+
+logger = get_logger(__name__)
+
+
+@handle_osdu_exceptions
+async def storage_export_ndjson(
+    kind: str,
+    file_path: str,
+    query: str | None = None,
+    max_count: int | None = None,
+    overwrite: bool = False,
+) -> dict:
+    """Export all records of a kind, or a search result set, to an NDJSON file.
+
+    Without ``query`` every record ID of the kind is enumerated from Storage
+    and the full records are fetched in concurrent batches. With ``query``
+    the search result set is walked with search cursors (``kind`` may then be
+    a wildcard pattern). Records are written page by page, so memory use
+    does not grow with the export size, and only a summary is returned. A
+    ``.gz`` file name produces gzip-compressed output.
+
+    Args:
+        kind: Required string - Kind to export (pattern when query is given)
+        file_path: Required string - Output path, relative to the export
+            directory (OSDU_MCP_STORAGE_EXPORT_DIR) or absolute inside it
+        query: Optional string - Search query selecting the records to export
+        max_count: Optional integer - Stop after this many records
+        overwrite: Optional boolean - Replace an existing file; requires
+            OSDU_MCP_ENABLE_WRITE_MODE=true (default: false)
+
+    Returns:
+        Dictionary containing the export summary with the structure:
+        {
+            "success": true,
+            "file_path": str,
+            "recordCount": int,
+            "source": "storage" | "search",
+            "complete": bool,  # False if max_count or the deadline stopped it
+            "invalidRecordCount": int,  # storage only: IDs that could not be fetched
+            "partition": str
+        }
+    """
+    config = get_config()
+    auth = get_auth_handler(config)
+    path = resolve_export_path(config, file_path, overwrite)
+    writer = NdjsonWriter(path, overwrite)
+
+    stats = {"invalid": 0}
+    try:
+        if query is None:
+            storage = StorageClient(config, auth)
+            try:
+                complete = await write_pages(
+                    writer, storage_pages(storage, kind, stats), max_count
+                )
+            finally:
+                await storage.close()
+        else:
+            search = SearchClient(config, auth)
+            try:
+                complete = await write_pages(
+                    writer, search_pages(search, query, kind), max_count
+                )
+            finally:
+                await search.close()
+
+        await asyncio.to_thread(writer.commit)
+    except BaseException:
+        await asyncio.to_thread(writer.abort)
+        raise
+
+    source = "storage" if query is None else "search"
+    logger.info(
+        f"Exported {writer.count} records to {path}",
+        extra={
+            "kind": kind,
+            "file_path": str(path),
+            "record_count": writer.count,
+            "source": source,
+            "complete": complete,
+            "operation": "export_ndjson",
+        },
+    )
+
+    result = {
+        "success": True,
+        "file_path": str(path),
+        "recordCount": writer.count,
+        "source": source,
+        "complete": complete,
+        "partition": config.get("server", "data_partition"),
+    }
+    if query is None:
+        result["invalidRecordCount"] = stats["invalid"]
+    return result
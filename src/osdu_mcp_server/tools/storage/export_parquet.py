@@ -0,0 +1,148 @@
+"""Tool for exporting records to a Parquet or Arrow file."""
+
+import asyncio
+
+from ...shared.auth_handler import AuthHandler, get_auth_handler
+from ...shared.clients.schema_client import SchemaClient
+from ...shared.clients.search_client import SearchClient
+from ...shared.clients.storage_client import StorageClient
+from ...shared.columnar import ColumnarWriter, schema_columns
+from ...shared.config_manager import ConfigManager, get_config
+from ...shared.exceptions import handle_osdu_exceptions
+from ...shared.logging_manager import get_logger
+from ...shared.ndjson import resolve_export_path
+from ...shared.record_export import search_pages, storage_pages, write_pages
+from ...shared.record_validator import fetch_referenced_schemas
+from ...shared.schema_index import schema_body
+
+logger = get_logger(__name__)
+
+
+@handle_osdu_exceptions
+async def storage_export_parquet(
+    kind: str,
+    file_path: str,
+    query: str | None = None,
+    max_count: int | None = None,
+    overwrite: bool = False,
+) -> dict:
+    """Export records of a kind, or a search result set, to a columnar file.
+
+    Records are flattened into one column per data path (e.g.
+    ``data.FacilityName``) and written one row group per page as pages
+    arrive. Column types come from the kind's schema and the abstract
+    schemas it references (via the schema cache) when ``kind`` names a
+    single schema, otherwise from the first page. Columns behind referenced
+    schemas that cannot be fetched are inferred from the first page.
+    Arrays and free-form objects are stored as JSON text. A file ending in
+    ``.arrow``, ``.feather`` or ``.ipc`` is written in Arrow IPC format,
+    anything else as Parquet. Requires the optional pyarrow package.
+
+    Args:
+        kind: Required string - Kind to export (pattern when query is given)
+        file_path: Required string - Output path, relative to the export
+            directory (OSDU_MCP_STORAGE_EXPORT_DIR) or absolute inside it
+        query: Optional string - Search query selecting the records to export
+        max_count: Optional integer - Stop after this many records
+        overwrite: Optional boolean - Replace an existing file; requires
+            OSDU_MCP_ENABLE_WRITE_MODE=true (default: false)
+
+    Returns:
+        Dictionary containing the export summary with the structure:
+        {
+            "success": true,
+            "file_path": str,
+            "format": "parquet" | "arrow",
+            "recordCount": int,
+            "columnCount": int,
+            "columnTypesFrom": "schema" | "records",
+            "unresolvedSchemaRefs": [str],  # Referenced schemas not fetched
+            "droppedColumns": [str],  # Data paths not in the column set
+            "source": "storage" | "search",
+            "complete": bool,  # False if max_count or the deadline stopped it
+            "partition": str
+        }
+    """
+    config = get_config()
+    auth = get_auth_handler(config)
+    path = resolve_export_path(config, file_path, overwrite)
+
+    columns, unresolved = await _kind_columns(config, auth, kind)
+    writer = ColumnarWriter(path, columns, overwrite, infer_missing=bool(unresolved))
+
+    try:
+        if query is None:
+            storage = StorageClient(config, auth)
+            try:
+                complete = await write_pages(
+                    writer, storage_pages(storage, kind, {}), max_count
+                )
+            finally:
+                await storage.close()
+        else:
+            search = SearchClient(config, auth)
+            try:
+                complete = await write_pages(
+                    writer, search_pages(search, query, kind), max_count
+                )
+            finally:
+                await search.close()
+
+        await asyncio.to_thread(writer.commit)
+    except BaseException:
+        await asyncio.to_thread(writer.abort)
+        raise
+
+    source = "storage" if query is None else "search"
+    logger.info(
+        f"Exported {writer.count} records to {path}",
+        extra={
+            "kind": kind,
+            "file_path": str(path),
+            "format": writer.format,
+            "record_count": writer.count,
+            "column_count": len(writer.columns or ()),
+            "source": source,
+            "complete": complete,
+            "operation": "export_parquet",
+        },
+    )
+
+    return {
+        "success": True,
+        "file_path": str(path),
+        "format": writer.format,
+        "recordCount": writer.count,
+        "columnCount": len(writer.columns or ()),
+        "columnTypesFrom": "schema" if columns else "records",
+        "unresolvedSchemaRefs": sorted(unresolved),
+        "droppedColumns": writer.dropped_columns(),
+        "source": source,
+        "complete": complete,
+        "partition": config.get("server", "data_partition"),
+    }
+
+
+async def _kind_columns(
+    config: ConfigManager, auth: AuthHandler, kind: str
+) -> tuple[dict[str, str] | None, set[str]]:
+    """Derive column types from the kind's schema, if it names one schema.
+
+    Returns:
+        Column types (None to infer them all), and the IDs of referenced
+        schemas that could not be fetched
+    """
+    if "*" in kind:
+        return None, set()
+
+    client = SchemaClient(config, auth)
+    try:
+        body = schema_body(await client.get_schema(kind))
+        references, unresolved = await fetch_referenced_schemas(client, kind, body)
+    except Exception as e:
+        logger.warning(f"Schema for {kind} unavailable, inferring columns: {e}")
+        return None, set()
+    finally:
+        await client.close()
+
+    return schema_columns(body, references) or None, unresolved
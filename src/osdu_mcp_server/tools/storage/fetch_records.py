@@ -1,8 +1,8 @@
 """Tool for fetching multiple records at once."""
 
-from ...shared.auth_handler import AuthHandler
+from ...shared.auth_handler import get_auth_handler
 from ...shared.clients.storage_client import StorageClient
-from ...shared.config_manager import ConfigManager
+from ...shared.config_manager import get_config
 from ...shared.exceptions import handle_osdu_exceptions
 from ...shared.logging_manager import get_logger
 
@@ -16,7 +16,8 @@ async def storage_fetch_records(
     """Retrieve multiple records at once.
 
     Args:
-        records: Required array of strings - Record IDs (max 100)
+        records: Required array of strings - Record IDs. Lists longer than 100
+            are split into batches that are fetched concurrently
         attributes: Optional array of strings - Specific data fields to return
 
     Returns:
@@ -35,16 +36,17 @@ async def storage_fetch_records(
             ],
             "count": int,
             "invalidRecords": [str, ...],
+            "retryRecords": [str, ...],  # Only if still unavailable after retries
             "partition": str
         }
     """
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = StorageClient(config, auth)
 
     try:
-        # Fetch multiple records
-        response = await client.fetch_records(records, attributes)
+        # Fetch in 100-ID batches, re-attempting retryRecords automatically
+        response = await client.fetch_records_bulk(records, attributes)
 
         # Build response
         result = {
@@ -55,8 +57,8 @@ async def storage_fetch_records(
             "partition": config.get("server", "data_partition"),
         }
 
-        # Include retry records if present
-        if "retryRecords" in response:
+        # Include records that stayed unavailable after retries
+        if response.get("retryRecords"):
             result["retryRecords"] = response["retryRecords"]
 
         logger.info(
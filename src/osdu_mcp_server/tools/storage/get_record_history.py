@@ -0,0 +1,97 @@
+"""Tool for retrieving the full version history of a record."""
+
+from itertools import pairwise
+
+from ...shared.auth_handler import get_auth_handler
+from ...shared.clients.storage_client import StorageClient
+from ...shared.config_manager import get_config
+from ...shared.exceptions import handle_osdu_exceptions
+from ...shared.json_patch import diff_json
+from ...shared.logging_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+@handle_osdu_exceptions
+async def storage_get_record_history(id: str, as_patches: bool = False) -> dict:
+    """Get every version of a record in one call.
+
+    Args:
+        id: Required string - Record ID
+        as_patches: Optional boolean - Return the oldest version in full and
+            each later version as a JSON Patch (RFC 6902) against the one
+            before it, instead of every version in full (default: false)
+
+    Returns:
+        Dictionary containing the record history with the structure:
+        {
+            "success": true,
+            "recordId": str,
+            "versions": [int, int, ...],  # Ascending
+            "count": int,
+            "records": [{...}, ...],  # Without as_patches
+            "baseRecord": {...},  # With as_patches: oldest fetched version
+            "patches": [  # With as_patches, between consecutive fetched versions
+                {"fromVersion": int, "version": int, "patch": [{...}, ...]},
+                ...
+            ],
+            "failedVersions": [{"version": int, "error": str}, ...],
+            "partition": str
+        }
+    """
+    config = get_config()
+    auth = get_auth_handler(config)
+    client = StorageClient(config, auth)
+
+    try:
+        history = await client.get_record_history(id)
+        records = history["records"]
+
+        result = {
+            "success": True,
+            "recordId": history["recordId"],
+            "versions": history["versions"],
+            "count": len(history["versions"]),
+        }
+
+        if as_patches:
+            # Pair each record with its version explicitly, so a failed
+            # version shows up as a gap between fromVersion and version
+            failed = {f["version"] for f in history["failedVersions"]}
+            fetched = list(
+                zip(
+                    [v for v in history["versions"] if v not in failed],
+                    records,
+                    strict=True,
+                )
+            )
+            result["baseRecord"] = records[0] if records else None
+            result["patches"] = [
+                {
+                    "fromVersion": from_version,
+                    "version": version,
+                    "patch": diff_json(previous, current),
+                }
+                for (from_version, previous), (version, current) in pairwise(fetched)
+            ]
+        else:
+            result["records"] = records
+
+        result["failedVersions"] = history["failedVersions"]
+        result["partition"] = config.get("server", "data_partition")
+
+        logger.info(
+            f"Retrieved {len(records)} versions of record {id}",
+            extra={
+                "record_id": id,
+                "version_count": result["count"],
+                "failed_count": len(history["failedVersions"]),
+                "as_patches": as_patches,
+                "operation": "get_record_history",
+            },
+        )
+
+        return result
+
+    finally:
+        await client.close()
@@ -0,0 +1,135 @@
+"""Tool for ingesting records from an NDJSON file."""
+
+import asyncio
+
+from ...shared.auth_handler import get_auth_handler
+from ...shared.clients.storage_client import StorageClient
+from ...shared.config_manager import get_config
+from ...shared.exceptions import handle_osdu_exceptions
+from ...shared.logging_manager import get_logger
+from ...shared.ndjson import NdjsonReader, resolve_path
+
+logger = get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 2000
+MAX_REPORTED_FAILURES = 20
+
+
+@handle_osdu_exceptions
+async def storage_ingest_ndjson(file_path: str, skip_dupes: bool = False) -> dict:
+    """Create or update records read from a local NDJSON file.
+
+    The file holds one record per line (optionally gzip-compressed) and is
+    streamed in chunks into the bulk ingest path: each chunk is split into
+    concurrent batches while the next chunk is read, so memory use does not
+    grow with the file size. Only a summary is returned.
+
+    Args:
+        file_path: Required string - Path to the NDJSON file on the server host
+        skip_dupes: Optional boolean - Skip duplicates when updating (default: false)
+
+    Returns:
+        Dictionary containing the ingest summary with the structure:
+        {
+            "success": bool,  # False if any line failed
+            "file_path": str,
+            "lineCount": int,
+            "createdCount": int,
+            "skippedCount": int,
+            "failedCount": int,
+            "failures": [  # First 20 failures
+                {"line": int, "id": str, "error": str}
+            ],
+            "write_enabled": bool,
+            "partition": str
+        }
+
+    Note: Requires OSDU_MCP_ENABLE_WRITE_MODE=true
+    """
+    config = get_config()
+    auth = get_auth_handler(config)
+    client = StorageClient(config, auth)
+
+    try:
+        # Fail before reading anything if writes are disabled
+        client.check_write_permission()
+
+        path = resolve_path(file_path)
+        chunk_size = int(
+            config.get("storage", "ingest_chunk_size", DEFAULT_CHUNK_SIZE)
+            or DEFAULT_CHUNK_SIZE
+        )
+        reader = NdjsonReader(path)
+
+        created = skipped = 0
+        failures: list[dict] = []
+        failed_count = 0
+
+        def record_failure(line: int, record_id: str | None, error: str) -> None:
+            nonlocal failed_count
+            failed_count += 1
+            if len(failures) < MAX_REPORTED_FAILURES:
+                failures.append({"line": line, "id": record_id, "error": error})
+
+        next_chunk = asyncio.ensure_future(
+            asyncio.to_thread(reader.read_chunk, chunk_size)
+        )
+        try:
+            while True:
+                chunk, bad_lines = await next_chunk
+                if not chunk and not bad_lines:
+                    break
+                # Read ahead while this chunk is being written
+                next_chunk = asyncio.ensure_future(
+                    asyncio.to_thread(reader.read_chunk, chunk_size)
+                )
+
+                for line, error in bad_lines:
+                    record_failure(line, None, error)
+                if not chunk:
+                    continue
+
+                # Invalid records come back in failedRecords, so one bad
+                # line does not stop the rest of the file
+                lines = [line for line, _ in chunk]
+                report = await client.ingest_records(
+                    [record for _, record in chunk], skip_dupes
+                )
+
+                created += report["recordCount"]
+                skipped += len(report["skippedRecords"])
+                for failure in report["failedRecords"]:
+                    record_failure(
+                        lines[failure["index"]], failure["id"], failure["error"]
+                    )
+        finally:
+            # Let an in-flight read finish before closing the file under it
+            await asyncio.wait([next_chunk])
+            await asyncio.to_thread(reader.close)
+
+        logger.info(
+            f"Ingested {created} records from {path}",
+            extra={
+                "file_path": str(path),
+                "line_count": reader.line_number,
+                "created_count": created,
+                "skipped_count": skipped,
+                "failed_count": failed_count,
+                "operation": "ingest_ndjson",
+            },
+        )
+
+        return {
+            "success": failed_count == 0,
+            "file_path": str(path),
+            "lineCount": reader.line_number,
+            "createdCount": created,
+            "skippedCount": skipped,
+            "failedCount": failed_count,
+            "failures": failures,
+            "write_enabled": True,
+            "partition": config.get("server", "data_partition"),
+        }
+
+    finally:
+        await client.close()
@@ -1,24 +1,52 @@
 """Tool for querying records by kind."""
 
-from ...shared.auth_handler import AuthHandler
-from ...shared.clients.storage_client import StorageClient
-from ...shared.config_manager import ConfigManager
-from ...shared.exceptions import handle_osdu_exceptions
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from ...shared.auth_handler import get_auth_handler
+from ...shared.clients.storage_client import KIND_QUERY_PAGE_SIZE, StorageClient
+from ...shared.config_manager import ConfigManager, get_config, parse_setting
+from ...shared.deadline import remaining
+from ...shared.exceptions import OSMCPTimeoutError, handle_osdu_exceptions
 from ...shared.logging_manager import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on IDs collected by enumerate_all when max_count is not given
+DEFAULT_ENUMERATE_MAX_COUNT = 100_000
+
 
 @handle_osdu_exceptions
 async def storage_query_records_by_kind(
-    kind: str, limit: int = 10, cursor: str | None = None
+    kind: str,
+    limit: int = 10,
+    cursor: str | None = None,
+    enumerate_all: bool = False,
+    max_count: int | None = None,
+    time_budget_seconds: float | None = None,
 ) -> dict:
     """Get record IDs of a specific kind.
 
+    By default one page is returned and the caller follows ``cursor``. With
+    ``enumerate_all`` the server follows cursors itself (1000 IDs per page,
+    prefetching the next page) until the kind is exhausted, ``max_count`` IDs
+    were collected or ``time_budget_seconds`` elapsed.
+
+    Reads configuration from:
+    - OSDU_MCP_STORAGE_ENUMERATE_MAX_COUNT: IDs collected by enumerate_all
+      when max_count is not given (default: 100000)
+
     Args:
         kind: Required string - Kind to query for
-        limit: Optional integer - Maximum number of results (default: 10)
+        limit: Optional integer - Maximum number of results (default: 10).
+            Ignored when enumerate_all is set
         cursor: Optional string - Cursor for pagination
+        enumerate_all: Optional boolean - Follow cursors until done (default: False)
+        max_count: Optional integer - Stop enumerating after this many IDs
+            (default: 100000)
+        time_budget_seconds: Optional number - Stop enumerating after this long
 
     Returns:
         Dictionary containing query results with the structure:
@@ -31,14 +59,32 @@ async def storage_query_records_by_kind(
                 ...
             ],
             "count": int,
-            "partition": str
+            "partition": str,
+            "complete": bool,  # enumerate_all only: False if stopped early
+            "truncated": bool,  # enumerate_all only: True if max_count was hit
+            "pages": int  # enumerate_all only
         }
+
+        When enumeration stops early, ``cursor`` resumes from the last page
+        that was not fully returned, so a few IDs may be repeated. A page
+        that does not arrive within the time budget ends enumeration early.
     """
-    config = ConfigManager()
-    auth = AuthHandler(config)
+    config = get_config()
+    auth = get_auth_handler(config)
     client = StorageClient(config, auth)
 
     try:
+        if enumerate_all:
+            return await _enumerate_kind(
+                client,
+                kind,
+                cursor,
+                max_count,
+                time_budget_seconds,
+                config.get("server", "data_partition"),
+                config,
+            )
+
         # Query records by kind
         response = await client.query_records_by_kind(kind, limit, cursor)
 
@@ -66,3 +112,130 @@ async def storage_query_records_by_kind(
 
     finally:
         await client.close()
+
+
+async def _enumerate_kind(
+    client: StorageClient,
+    kind: str,
+    cursor: str | None,
+    max_count: int | None,
+    time_budget_seconds: float | None,
+    partition: str | None,
+    config: ConfigManager,
+) -> dict[str, Any]:
+    """Collect record IDs of a kind by following cursors.
+
+    Each page fetch is bounded by the time left in ``time_budget_seconds``
+    and in the tool's deadline, so a slow page ends enumeration with the
+    IDs collected so far instead of overrunning the budget.
+
+    Args:
+        client: Storage client to query with
+        kind: Kind to enumerate
+        cursor: Cursor to resume from
+        max_count: Maximum number of IDs to collect (None uses the
+            storage.enumerate_max_count setting)
+        time_budget_seconds: Maximum time to spend enumerating
+        partition: Data partition for the response
+        config: Configuration manager instance
+
+    Returns:
+        Tool response with the collected IDs and a resume cursor
+    """
+    if max_count is None:
+        max_count = parse_setting(
+            config, "storage", "enumerate_max_count", int, DEFAULT_ENUMERATE_MAX_COUNT
+        )
+    started = time.monotonic()
+    results: list[str] = []
+    pages = 0
+    complete = True
+    truncated = False
+    resume_cursor = cursor
+
+    page_iter: AsyncGenerator[dict[str, Any], None] = client.iter_record_pages_by_kind(
+        kind, KIND_QUERY_PAGE_SIZE, cursor
+    )
+    try:
+        while True:
+            left = _time_left(started, time_budget_seconds)
+            if left is not None and left <= 0:
+                complete = False
+                break
+            scope = asyncio.timeout(left)
+            try:
+                async with scope:
+                    page = await anext(page_iter)
+            except StopAsyncIteration:
+                break
+            except (TimeoutError, OSMCPTimeoutError):
+                # A request capped at the tool deadline may give up first
+                left = _time_left(started, time_budget_seconds)
+                if not scope.expired() and (left is None or left > 0):
+                    raise
+                # resume_cursor still points at the page that did not arrive
+                complete = False
+                break
+            pages += 1
+            page_results = page["results"]
+            resume_cursor = page["cursor"]
+
+            if len(results) + len(page_results) > max_count:
+                results.extend(page_results[: max_count - len(results)])
+                resume_cursor = page["request_cursor"]
+                complete = False
+                truncated = True
+                break
+            results.extend(page_results)
+
+            if resume_cursor is None:
+                break
+            if len(results) >= max_count:
+                complete = False
+                truncated = True
+                break
+    finally:
+        await page_iter.aclose()
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"Enumerated {len(results)} records of kind {kind}",
+        extra={
+            "kind": kind,
+            "record_count": len(results),
+            "pages": pages,
+            "complete": complete,
+            "truncated": truncated,
+            "duration_seconds": round(elapsed, 3),
+            "operation": "query_records_by_kind",
+        },
+    )
+
+    return {
+        "success": True,
+        "cursor": resume_cursor,
+        "results": results,
+        "count": len(results),
+        "partition": partition,
+        "complete": complete,
+        "truncated": truncated,
+        "pages": pages,
+    }
+
+
+def _time_left(started: float, time_budget_seconds: float | None) -> float | None:
+    """Seconds left for enumeration.
+
+    Args:
+        started: Monotonic time enumeration started
+        time_budget_seconds: Enumeration budget, or None
+
+    Returns:
+        The smaller of the budget left and the tool deadline left, or None
+        if neither applies
+    """
+    left = remaining()
+    if time_budget_seconds is not None:
+        budget_left = time_budget_seconds - (time.monotonic() - started)
+        left = budget_left if left is None else min(left, budget_left)
+    return left
@@ -0,0 +1,52 @@
+"""Shared pytest fixtures for OSDU MCP Server tests."""
+
+import pytest
+
+from osdu_mcp_server.shared import (
+    record_cache,
+    record_validator,
+    schema_cache,
+    schema_index,
+    service_guard,
+)
+from osdu_mcp_server.shared.auth_handler import reset_auth_handler
+from osdu_mcp_server.shared.config_manager import reset_config
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_auth_handler():
+    """Give every test a fresh process-wide authentication handler."""
+    reset_auth_handler()
+    yield
+    reset_auth_handler()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_config():
+    """Give every test a freshly resolved process-wide configuration."""
+    reset_config()
+    yield
+    reset_config()
+
+
+@pytest.fixture(autouse=True)
+def reset_service_guards():
+    """Give every test closed circuits and full concurrency limits."""
+    service_guard.reset_service_guards()
+    yield
+    service_guard.reset_service_guards()
+
+
+@pytest.fixture(autouse=True)
+def isolated_schema_cache(tmp_path, monkeypatch):
+    """Keep the on-disk schema cache inside the test's temporary directory."""
+    monkeypatch.setattr(schema_cache, "DEFAULT_CACHE_PATH", tmp_path / "schemas.db")
+    schema_cache.reset_schema_cache()
+    schema_index.reset_schema_index()
+    record_validator.reset_compiled_schemas()
+    record_cache.reset_record_cache()
+    yield
+    schema_cache.reset_schema_cache()
+    schema_index.reset_schema_index()
+    record_validator.reset_compiled_schemas()
+    record_cache.reset_record_cache()
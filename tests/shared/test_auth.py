@@ -427,3 +427,30 @@ def test_auth_handler_mode_detection_error():
                     OSMCPAuthError, match="No authentication credentials configured"
                 ):
                     AuthHandler(mock_config)
+
+
+def test_shared_auth_handler_detects_mode_once():
+    """Test that the process-wide handler is created once and reused."""
+    from osdu_mcp_server.shared.auth_handler import (
+        get_auth_handler,
+        reset_auth_handler,
+    )
+
+    mock_config = MagicMock(spec=ConfigManager)
+    mock_config.get.return_value = False
+
+    with patch("osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"):
+        with patch.dict(os.environ, {"AZURE_CLIENT_ID": "test-client-id"}):
+            with patch.object(
+                AuthHandler,
+                "_detect_authentication_mode",
+                return_value=AuthenticationMode.AZURE,
+            ) as mock_detect:
+                first = get_auth_handler(mock_config)
+                second = get_auth_handler(mock_config)
+
+                assert first is second
+                mock_detect.assert_called_once()
+
+                reset_auth_handler()
+                assert get_auth_handler(mock_config) is not first
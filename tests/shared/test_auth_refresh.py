@@ -0,0 +1,122 @@
+"""Tests for single-flight and background token renewal in AuthHandler."""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from azure.core.credentials import AccessToken
+
+from osdu_mcp_server.shared.auth_handler import AuthHandler
+from osdu_mcp_server.shared.config_manager import ConfigManager
+
+
+def _azure_handler(get_token):
+    """Create an Azure-mode handler whose credential uses get_token."""
+    mock_config = MagicMock(spec=ConfigManager)
+    mock_config.get.side_effect = lambda section, key, default=None: default
+
+    with patch(
+        "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+    ) as mock_cred:
+        mock_cred_instance = MagicMock()
+        mock_cred_instance.get_token.side_effect = get_token
+        mock_cred.return_value = mock_cred_instance
+        auth = AuthHandler(mock_config)
+
+    return auth, mock_cred_instance
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_refresh():
+    """Test that concurrent callers with no cached token trigger one refresh."""
+    started = threading.Event()
+
+    def slow_get_token(scope):
+        started.set()
+        time.sleep(0.05)
+        return AccessToken("shared-token", int(time.time()) + 3600)
+
+    with patch.dict(os.environ, {"AZURE_CLIENT_ID": "test-client-id"}):
+        auth, credential = _azure_handler(slow_get_token)
+
+        tokens = await asyncio.gather(*(auth.get_access_token() for _ in range(20)))
+
+    assert tokens == ["shared-token"] * 20
+    assert credential.get_token.call_count == 1
+    assert started.is_set()
+
+    metrics = auth.get_refresh_metrics()["azure"]
+    assert metrics["count"] == 1
+    assert metrics["failures"] == 0
+    assert metrics["last_seconds"] > 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_failure_is_shared_and_counted():
+    """Test that all waiters see a failed refresh and metrics record it."""
+    with patch.dict(os.environ, {"AZURE_CLIENT_ID": "test-client-id"}):
+        auth, credential = _azure_handler(Exception("connection refused"))
+
+        results = await asyncio.gather(
+            *(auth.get_access_token() for _ in range(5)), return_exceptions=True
+        )
+
+    assert all("connect" in str(result) for result in results)
+    assert credential.get_token.call_count == 1
+    assert auth.get_refresh_metrics()["azure"]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_renews_before_expiry():
+    """Test that the background task acquires and renews tokens proactively."""
+    tokens = iter(
+        [
+            # Expires inside the proactive margin, so renewal is due at once
+            AccessToken("first-token", int(time.time()) + 120),
+            AccessToken("second-token", int(time.time()) + 3600),
+        ]
+    )
+
+    with patch.dict(os.environ, {"AZURE_CLIENT_ID": "test-client-id"}):
+        auth, credential = _azure_handler(lambda scope: next(tokens))
+
+        with patch("osdu_mcp_server.shared.auth_handler.BACKGROUND_MIN_INTERVAL", 0.01):
+            auth.start_background_refresh()
+            for _ in range(100):
+                if credential.get_token.call_count >= 2:
+                    break
+                await asyncio.sleep(0.01)
+            await auth.stop_background_refresh()
+
+    assert credential.get_token.call_count == 2
+    # Request path is served from the renewed cache without a new refresh
+    assert await auth.get_access_token() == "second-token"
+    assert credential.get_token.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_backs_off_while_the_token_is_unchanged():
+    """Test that renewals returning the cached token are spaced out."""
+    # Inside the proactive margin, and handed back again on every renewal
+    token = AccessToken("cached-token", int(time.time()) + 620)
+    delays = []
+
+    async def record_sleep(delay):
+        delays.append(delay)
+        if len(delays) == 5:
+            raise asyncio.CancelledError
+
+    with patch.dict(os.environ, {"AZURE_CLIENT_ID": "test-client-id"}):
+        auth, credential = _azure_handler(lambda scope: token)
+
+        with patch("osdu_mcp_server.shared.auth_handler.asyncio.sleep", record_sleep):
+            with pytest.raises(asyncio.CancelledError):
+                await auth._background_refresh_loop()
+
+    assert credential.get_token.call_count == 5
+    assert delays[:4] == [30, 60, 120, 240]
+    # Capped where the request path would refresh (default margin 300s)
+    assert 300 < delays[4] <= 320
@@ -0,0 +1,272 @@
+"""Tests for columnar record export."""
+
+import pytest
+
+from osdu_mcp_server.shared.columnar import (
+    ColumnarWriter,
+    flatten_record,
+    schema_columns,
+)
+
+WELLBORE_SCHEMA = {
+    "definitions": {
+        "AbstractFacility": {
+            "type": "object",
+            "properties": {
+                "FacilityName": {"type": "string"},
+                "FacilityStates": {"type": "array", "items": {"type": "object"}},
+            },
+        },
+        "Measurement": {
+            "type": "object",
+            "properties": {
+                "Value": {"type": "number"},
+                "UnitOfMeasureID": {"type": "string"},
+            },
+        },
+    },
+    "properties": {
+        "data": {
+            "allOf": [
+                {"$ref": "#/definitions/AbstractFacility"},
+                {
+                    "type": "object",
+                    "properties": {
+                        "TotalDepth": {"$ref": "#/definitions/Measurement"},
+                        "SidetrackNumber": {"type": ["integer", "null"]},
+                        "IsActive": {"type": "boolean"},
+                        "ExtensionProperties": {"type": "object"},
+                    },
+                },
+            ]
+        }
+    },
+}
+
+
+# Trimmed from osdu:wks:master-data--Wellbore:1.0.0: the data block is built
+# from abstract schemas referenced by ID
+WKS_WELLBORE_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "x-osdu-schema-source": "osdu:wks:master-data--Wellbore:1.0.0",
+    "type": "object",
+    "properties": {
+        "data": {
+            "allOf": [
+                {"$ref": "osdu:wks:AbstractCommonResources:1.0.0"},
+                {"$ref": "osdu:wks:AbstractMaster:1.0.0"},
+                {"$ref": "osdu:wks:AbstractFacility:1.1.0"},
+                {
+                    "type": "object",
+                    "properties": {
+                        "WellID": {"type": "string"},
+                        "VerticalMeasurements": {
+                            "type": "array",
+                            "items": {
+                                "$ref": "osdu:wks:AbstractFacilityVerticalMeasurement:1.0.0"
+                            },
+                        },
+                        "DefaultVerticalMeasurementID": {"type": "string"},
+                        "GeographicBottomHoleLocation": {
+                            "$ref": "osdu:wks:AbstractSpatialLocation:1.0.0#/properties/Wgs84Coordinates"
+                        },
+                    },
+                },
+                {
+                    "type": "object",
+                    "properties": {
+                        "ExtensionProperties": {"type": "object"},
+                    },
+                },
+            ]
+        }
+    },
+}
+
+WKS_REFERENCES = {
+    "osdu:wks:AbstractCommonResources:1.0.0": {
+        "type": "object",
+        "properties": {
+            "ResourceHomeRegionID": {"type": "string"},
+            "ResourceHostRegionIDs": {"type": "array", "items": {"type": "string"}},
+            "ResourceCurationStatus": {"type": "string"},
+            "Source": {"type": "string"},
+        },
+    },
+    "osdu:wks:AbstractMaster:1.0.0": {
+        "type": "object",
+        "properties": {
+            "NameAliases": {
+                "type": "array",
+                "items": {"$ref": "osdu:wks:AbstractAliasNames:1.0.0"},
+            },
+            "SpatialLocation": {"$ref": "osdu:wks:AbstractSpatialLocation:1.0.0"},
+        },
+    },
+    "osdu:wks:AbstractFacility:1.1.0": {
+        "definitions": {
+            "FacilityName": {"type": "string", "description": "Name of the facility"}
+        },
+        "type": "object",
+        "properties": {
+            "FacilityID": {"type": "string"},
+            "FacilityName": {"$ref": "#/definitions/FacilityName"},
+            "OperatingEnvironmentID": {"type": "string"},
+        },
+    },
+    "osdu:wks:AbstractSpatialLocation:1.0.0": {
+        "type": "object",
+        "properties": {
+            "SpatialLocationCoordinatesDate": {"type": "string", "format": "date-time"},
+            "QuantitativeAccuracyBandID": {"type": "string"},
+            "Wgs84Coordinates": {
+                "type": "object",
+                "properties": {
+                    "type": {"type": "string"},
+                    "features": {"type": "array"},
+                },
+            },
+        },
+    },
+}
+
+
+def _record(i, **data):
+    return {
+        "id": f"opendes:wellbore:{i}",
+        "kind": "osdu:wks:master-data--Wellbore:1.0.0",
+        "version": 1700000000000 + i,
+        "acl": {"viewers": ["v"], "owners": ["o"]},
+        "data": data,
+    }
+
+
+def test_schema_columns_flatten_refs_and_all_of():
+    """Test that column types are derived through $ref and allOf."""
+    assert schema_columns(WELLBORE_SCHEMA) == {
+        "data.FacilityName": "string",
+        "data.FacilityStates": "json",
+        "data.TotalDepth.Value": "number",
+        "data.TotalDepth.UnitOfMeasureID": "string",
+        "data.SidetrackNumber": "integer",
+        "data.IsActive": "boolean",
+        "data.ExtensionProperties": "json",
+    }
+
+
+def test_schema_columns_resolve_abstract_schemas_by_id():
+    """Test that allOf parts referenced by schema ID contribute columns."""
+    columns = schema_columns(WKS_WELLBORE_SCHEMA, WKS_REFERENCES)
+
+    assert columns == {
+        "data.ResourceHomeRegionID": "string",
+        "data.ResourceHostRegionIDs": "json",
+        "data.ResourceCurationStatus": "string",
+        "data.Source": "string",
+        "data.NameAliases": "json",
+        "data.SpatialLocation.SpatialLocationCoordinatesDate": "string",
+        "data.SpatialLocation.QuantitativeAccuracyBandID": "string",
+        "data.SpatialLocation.Wgs84Coordinates.type": "string",
+        "data.SpatialLocation.Wgs84Coordinates.features": "json",
+        "data.FacilityID": "string",
+        # Local reference inside the referenced schema
+        "data.FacilityName": "string",
+        "data.OperatingEnvironmentID": "string",
+        "data.WellID": "string",
+        "data.VerticalMeasurements": "json",
+        "data.DefaultVerticalMeasurementID": "string",
+        # Reference by ID with a fragment
+        "data.GeographicBottomHoleLocation.type": "string",
+        "data.GeographicBottomHoleLocation.features": "json",
+        "data.ExtensionProperties": "json",
+    }
+    # Without the referenced bodies only the kind's own columns are known
+    assert "data.FacilityName" not in schema_columns(WKS_WELLBORE_SCHEMA)
+
+
+def test_columnar_writer_infers_columns_behind_unresolved_refs(tmp_path):
+    """Test that columns missing from a partial schema come from the data."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "wells.parquet"
+    references = dict(WKS_REFERENCES)
+    del references["osdu:wks:AbstractFacility:1.1.0"]
+
+    writer = ColumnarWriter(
+        path, schema_columns(WKS_WELLBORE_SCHEMA, references), infer_missing=True
+    )
+    writer.write([_record(1, FacilityName="A-1", WellID="W-1")])
+    writer.write([_record(2, FacilityName="A-2", FacilityID="F-2")])
+    writer.commit()
+
+    table = pq.read_table(path)
+    assert table.column("data.FacilityName").to_pylist() == ["A-1", "A-2"]
+    assert table.column("data.WellID").to_pylist() == ["W-1", None]
+    # Only the first page is used for inference
+    assert writer.dropped_columns() == ["data.FacilityID"]
+
+
+def test_flatten_record_keeps_known_object_columns_whole():
+    """Test that free-form objects stay whole when they are a column."""
+    record = _record(
+        1,
+        TotalDepth={"Value": 10.5, "UnitOfMeasureID": "m"},
+        ExtensionProperties={"a": {"b": 1}},
+    )
+
+    row = flatten_record(record, schema_columns(WELLBORE_SCHEMA))
+
+    assert row["data.TotalDepth.Value"] == 10.5
+    assert row["data.ExtensionProperties"] == {"a": {"b": 1}}
+    assert "acl" not in row
+    assert flatten_record(record)["data.ExtensionProperties.a.b"] == 1
+
+
+def test_columnar_writer_writes_typed_row_groups(tmp_path):
+    """Test that each page becomes a typed Parquet row group."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "wells.parquet"
+
+    writer = ColumnarWriter(path, schema_columns(WELLBORE_SCHEMA))
+    writer.write(
+        [
+            _record(
+                1,
+                FacilityName="A-1",
+                FacilityStates=[{"State": "Active"}],
+                TotalDepth={"Value": 1200, "UnitOfMeasureID": "m"},
+                SidetrackNumber=2,
+            )
+        ]
+    )
+    writer.write([_record(2, FacilityName="A-2", Unknown="x", SidetrackNumber="2")])
+    writer.commit()
+
+    parquet = pq.ParquetFile(path)
+    table = parquet.read()
+    assert parquet.metadata.num_row_groups == 2
+    assert table.schema.field("data.TotalDepth.Value").type == "double"
+    assert table.schema.field("data.SidetrackNumber").type == "int64"
+    assert table.column("data.FacilityName").to_pylist() == ["A-1", "A-2"]
+    assert table.column("data.FacilityStates").to_pylist() == [
+        '[{"State":"Active"}]',
+        None,
+    ]
+    # Values that do not fit the schema type are left empty
+    assert table.column("data.SidetrackNumber").to_pylist() == [2, None]
+    assert writer.dropped_columns() == ["data.Unknown"]
+    assert not (tmp_path / "wells.parquet.partial").exists()
+
+
+def test_columnar_writer_infers_columns_for_arrow(tmp_path):
+    """Test column inference from the first page when no schema is known."""
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / "hits.arrow"
+
+    writer = ColumnarWriter(path)
+    writer.write([_record(1, Name="A", Depth=1), _record(2, Name="B", Depth=2.5)])
+    writer.commit()
+
+    with pa.OSFile(str(path), "rb") as source:
+        table = pa.ipc.open_file(source).read_all()
+    assert table.column_names == ["id", "kind", "version", "data.Depth", "data.Name"]
+    assert table.column("data.Depth").to_pylist() == [1.0, 2.5]
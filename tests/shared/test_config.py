@@ -1,13 +1,21 @@
 """Tests for the ConfigManager class."""
 
+import asyncio
 import os
+import signal
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
 import pytest
 
-from osdu_mcp_server.shared.config_manager import ConfigManager
+from osdu_mcp_server.shared.config_manager import (
+    ConfigManager,
+    get_config,
+    reload_config,
+)
 from osdu_mcp_server.shared.exceptions import OSMCPConfigError
+from osdu_mcp_server.shared.service_guard import get_service_guard
+from osdu_mcp_server.shared.service_urls import OSMCPService
 
 
 def test_config_manager_env_priority():
@@ -134,3 +142,102 @@ server:
 
         config = ConfigManager(config_file=custom_path)
         assert config.get("server", "url") == "https://custom-osdu.com"
+
+
+def test_config_manager_snapshot_is_resolved_once():
+    """Test that values are resolved at creation, not on every lookup."""
+    with patch.dict(os.environ, {"OSDU_MCP_SERVER_TIMEOUT": "30"}):
+        config = ConfigManager(config_file=Path("/nonexistent/config.yaml"))
+
+    # Environment changes after startup are not visible until reload
+    with patch.dict(os.environ, {"OSDU_MCP_SERVER_TIMEOUT": "60"}):
+        assert config.get("server", "timeout") == 30
+        with pytest.raises(TypeError):
+            config.snapshot.environment["OSDU_MCP_SERVER_TIMEOUT"] = 90
+
+        assert config.reload() is True
+        assert config.get("server", "timeout") == 60
+
+
+def test_config_snapshot_parses_typed_settings(tmp_path):
+    """Test that hot-path settings are parsed once into typed fields."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "server:\n  url: https://yaml-osdu.com\n  data_partition: opendes\n"
+        "timeouts:\n  tool: 300\n  search_query: fast\n"
+    )
+    env = {
+        "OSDU_MCP_SERVER_URL": "https://env-osdu.com",
+        "OSDU_MCP_TIMEOUTS_STORAGE_EXPORT_NDJSON": "0",
+    }
+
+    with patch.dict(os.environ, env, clear=True):
+        snapshot = ConfigManager(config_file=config_file).snapshot
+
+    assert snapshot.server_url == "https://env-osdu.com"
+    assert snapshot.data_partition == "opendes"
+    # Invalid values are dropped so the defaults apply
+    assert snapshot.timeouts == {"tool": 300.0, "storage_export_ndjson": 0.0}
+    with pytest.raises(TypeError):
+        snapshot.timeouts["tool"] = 10
+
+
+def test_config_manager_reload_if_file_changed(tmp_path):
+    """Test that a modified YAML file is picked up by the mtime check."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("server:\n  url: https://first-osdu.com\n")
+
+    with patch.dict(os.environ, {}, clear=True):
+        config = ConfigManager(config_file=config_file)
+        assert config.get("server", "url") == "https://first-osdu.com"
+        assert config.reload_if_changed() is False
+
+        config_file.write_text("server:\n  url: https://second-osdu.com\n")
+        os.utime(config_file, ns=(0, config.snapshot.file_mtime_ns + 1_000_000))
+
+        assert config.reload_if_changed() is True
+        assert config.get("server", "url") == "https://second-osdu.com"
+
+
+def test_reload_config_keeps_previous_snapshot_on_error(tmp_path, monkeypatch):
+    """Test that a broken config file does not replace working values."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("server:\n  url: https://good-osdu.com\n")
+    monkeypatch.chdir(tmp_path)
+
+    with patch.dict(os.environ, {}, clear=True):
+        config = get_config()
+        assert get_config() is config
+
+        config_file.write_text("invalid: yaml: content:")
+        reload_config()
+
+        assert config.get("server", "url") == "https://good-osdu.com"
+
+
+@pytest.mark.asyncio
+async def test_server_reloads_config_on_sighup():
+    """Test that SIGHUP reloads the shared configuration while serving."""
+    from osdu_mcp_server.server import mcp, server_lifespan
+
+    with patch.dict(os.environ, {"OSDU_MCP_AUTH_BACKGROUND_REFRESH": "false"}):
+        async with server_lifespan(mcp):
+            config = get_config()
+            guard = get_service_guard(config, "https://osdu", OSMCPService.STORAGE)
+            with patch.dict(
+                os.environ,
+                {
+                    "OSDU_MCP_SERVER_TIMEOUT": "45",
+                    "OSDU_MCP_SERVER_CIRCUIT_FAILURE_THRESHOLD": "2",
+                },
+            ):
+                os.kill(os.getpid(), signal.SIGHUP)
+                await asyncio.sleep(0.05)
+
+                assert config.get("server", "timeout") == 45
+                # Guards are rebuilt with the new settings
+                rebuilt = get_service_guard(
+                    config, "https://osdu", OSMCPService.STORAGE
+                )
+                assert rebuilt is not guard
+                assert rebuilt.breaker.failure_threshold == 2
@@ -0,0 +1,123 @@
+"""Tests for tool deadlines and per-phase timeouts."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from osdu_mcp_server.shared.clients.search_client import SearchClient
+from osdu_mcp_server.shared.config_manager import get_config
+from osdu_mcp_server.shared.deadline import (
+    deadline_scope,
+    phase_timeouts,
+    remaining,
+    tool_timeout,
+)
+from osdu_mcp_server.shared.exceptions import OSMCPTimeoutError
+from osdu_mcp_server.shared.service_guard import get_service_guard
+from osdu_mcp_server.shared.service_urls import OSMCPService
+
+TEST_ENV = {
+    "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+    "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+    "OSDU_MCP_SERVER_TIMEOUT": "30",
+    "OSDU_MCP_TIMEOUTS_CONNECT": "5",
+    "OSDU_MCP_TIMEOUTS_SEARCH_TOTAL": "90",
+    "OSDU_MCP_TIMEOUTS_SEARCH_SOCK_READ": "0",
+    "OSDU_MCP_TIMEOUTS_TOOL": "120",
+    "OSDU_MCP_TIMEOUTS_STORAGE_EXPORT_NDJSON": "0",
+}
+
+
+def test_phase_timeouts_resolve_per_service():
+    """Test that service overrides win over the shared phase timeouts."""
+    with patch.dict(os.environ, TEST_ENV):
+        config = get_config()
+
+        storage = phase_timeouts(config, OSMCPService.STORAGE, 30)
+        search = phase_timeouts(config, OSMCPService.SEARCH, 30)
+
+        assert (storage.total, storage.connect, storage.sock_read) == (30, 5, 30)
+        # 0 disables a phase
+        assert (search.total, search.connect, search.sock_read) == (90, 5, None)
+        assert tool_timeout(config, "search_query") == 120
+        assert tool_timeout(config, "storage_export_ndjson") is None
+
+
+@pytest.mark.asyncio
+async def test_deadline_scopes_only_shorten_and_reach_tasks():
+    """Test that nested scopes keep the earlier deadline and flow into tasks."""
+    assert remaining() is None
+    with deadline_scope(10):
+        with deadline_scope(60):
+            assert remaining() <= 10
+        child = await asyncio.create_task(asyncio.sleep(0, result=remaining()))
+        assert 0 < child <= 10
+    assert remaining() is None
+
+
+@pytest.mark.asyncio
+async def test_requests_are_capped_by_the_deadline():
+    """Test that each attempt's total timeout is capped at the time left."""
+    url = "https://test.osdu.com/api/search/v2/query"
+    with patch.dict(os.environ, TEST_ENV):
+        auth = AsyncMock()
+        auth.get_access_token.return_value = "test-token"
+        client = SearchClient(get_config(), auth)
+
+        with aioresponses() as mocked:
+            mocked.post(url, payload={"results": []})
+
+            with deadline_scope(2):
+                await client.post("/query", json={})
+            call = mocked.requests[("POST", URL(url))][0]
+            assert 0 < call.kwargs["timeout"].total <= 2
+            assert call.kwargs["timeout"].connect == 5
+
+            with deadline_scope(0):
+                with pytest.raises(OSMCPTimeoutError, match="Deadline exceeded"):
+                    await client.post("/query", json={})
+            # Nothing was sent once the deadline had passed
+            assert len(mocked.requests[("POST", URL(url))]) == 1
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_deadline_after_guard_wait_releases_half_open_probe():
+    """Test that a deadline passing after admission frees the probe and slot."""
+    url = "https://test.osdu.com/api/search/v2/query"
+    env = {
+        **TEST_ENV,
+        "OSDU_MCP_SERVER_CIRCUIT_FAILURE_THRESHOLD": "1",
+        "OSDU_MCP_SERVER_CIRCUIT_RESET_TIMEOUT": "0",
+    }
+    with patch.dict(os.environ, env):
+        config = get_config()
+        auth = AsyncMock()
+        auth.get_access_token.return_value = "test-token"
+        client = SearchClient(config, auth)
+        guard = get_service_guard(config, "https://test.osdu.com", OSMCPService.SEARCH)
+        guard.breaker.record_failure()
+
+        # The deadline passes while the request waits for its slot
+        expired = [10.0, OSMCPTimeoutError("Deadline exceeded before POST")]
+        with patch(
+            "osdu_mcp_server.shared.osdu_client.check_deadline", side_effect=expired
+        ):
+            with pytest.raises(OSMCPTimeoutError):
+                await client.post("/query", json={})
+
+        assert guard.limiter.in_flight == 0
+        assert not guard.breaker._probe_in_flight
+
+        # The next call is admitted as the probe and closes the circuit
+        with aioresponses() as mocked:
+            mocked.post(url, payload={"results": []})
+            await client.post("/query", json={})
+        assert guard.breaker.state == guard.breaker.CLOSED
+
+        await client.close()
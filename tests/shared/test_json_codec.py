@@ -0,0 +1,72 @@
+"""Tests for the JSON codec."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aioresponses import aioresponses
+
+from osdu_mcp_server.shared.json_codec import (
+    JsonCodec,
+    get_json_codec,
+    is_json_content_type,
+)
+from osdu_mcp_server.shared.osdu_client import OsduClient
+
+
+def test_codecs_round_trip_and_fall_back_for_large_integers():
+    """Test that every codec produces compact UTF-8 JSON."""
+    record = {"id": "opendes:wellbore:1", "data": {"Name": "Brønn", "Depth": 1.5}}
+    codec = get_json_codec()
+
+    assert codec.loads(codec.dumps(record)) == record
+    assert codec.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+    assert codec.loads(codec.dumps({"n": 2**70})) == {"n": 2**70}
+
+
+def test_codec_can_be_forced_to_stdlib():
+    """Test that json_codec=json selects the standard library codec."""
+    with patch.dict(os.environ, {"OSDU_MCP_SERVER_JSON_CODEC": "json"}):
+        assert type(get_json_codec()) is JsonCodec
+
+
+def test_json_content_types():
+    """Test content type detection matches aiohttp's response.json()."""
+    assert is_json_content_type("application/json")
+    assert is_json_content_type("application/geo+json")
+    assert not is_json_content_type("text/plain")
+
+
+@pytest.mark.asyncio
+async def test_client_decodes_bodies_once_by_content_type():
+    """Test JSON and plain text responses are decoded from the raw body."""
+    mock_config = MagicMock()
+    mock_config.get_required.side_effect = lambda section, key: {
+        ("server", "url"): "https://test-osdu.com",
+        ("server", "data_partition"): "test-partition",
+    }[(section, key)]
+    mock_config.get.side_effect = lambda section, key, default=None: default
+
+    mock_auth = AsyncMock()
+    mock_auth.get_access_token.return_value = "test-token"
+
+    with aioresponses() as mocked:
+        mocked.get(
+            "https://test-osdu.com/api/json",
+            body='{"name":"Brønn"}'.encode(),
+            content_type="application/json",
+        )
+        mocked.get(
+            "https://test-osdu.com/api/text", body="OK", content_type="text/plain"
+        )
+        mocked.get(
+            "https://test-osdu.com/api/broken",
+            body="{not json",
+            content_type="application/json",
+        )
+
+        client = OsduClient(mock_config, mock_auth)
+        assert await client.get("/api/json") == {"name": "Brønn"}
+        assert await client.get("/api/text") == {"response": "OK"}
+        assert await client.get("/api/broken") == {"response": "{not json"}
+        await client.close()
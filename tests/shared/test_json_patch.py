@@ -0,0 +1,25 @@
+"""Tests for JSON Patch generation."""
+
+from osdu_mcp_server.shared.json_patch import diff_json
+
+
+def test_diff_json_nested_changes():
+    """Test add, remove and replace operations with escaped pointers."""
+    source = {"data": {"a/b": 1, "old": True, "list": [1, 2], "tags": ["x"]}}
+    target = {"data": {"a/b": 2, "list": [1, 3], "tags": ["x", "y"], "n~": None}}
+
+    assert diff_json(source, target) == [
+        {"op": "remove", "path": "/data/old"},
+        {"op": "replace", "path": "/data/a~1b", "value": 2},
+        {"op": "replace", "path": "/data/list/1", "value": 3},
+        {"op": "replace", "path": "/data/tags", "value": ["x", "y"]},
+        {"op": "add", "path": "/data/n~0", "value": None},
+    ]
+
+
+def test_diff_json_identical_and_type_change():
+    """Test that equal values produce no operations."""
+    assert diff_json({"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}) == []
+    assert diff_json({"a": 1}, {"a": "1"}) == [
+        {"op": "replace", "path": "/a", "value": "1"}
+    ]
@@ -0,0 +1,144 @@
+"""Tests for incremental JSON parsing of array responses."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aioresponses import aioresponses
+
+from osdu_mcp_server.shared.exceptions import OSMCPAPIError
+from osdu_mcp_server.shared.json_stream import iter_array_items
+from osdu_mcp_server.shared.osdu_client import OsduClient
+from osdu_mcp_server.shared.service_guard import get_service_guard
+from osdu_mcp_server.shared.service_urls import OSMCPService
+
+URL = "https://test-osdu.com"
+
+
+class ChunkedStream:
+    """Byte stream that returns a body a few bytes at a time."""
+
+    def __init__(self, body: bytes, size: int = 7):
+        self._body = body
+        self._size = size
+
+    async def read(self, n: int = -1) -> bytes:
+        size = self._size if n < 0 else min(n, self._size)
+        chunk, self._body = self._body[:size], self._body[size:]
+        return chunk
+
+
+def _mock_config(stream_responses=True):
+    config = MagicMock()
+    config.get_required.side_effect = lambda section, key: {
+        ("server", "url"): URL,
+        ("server", "data_partition"): "test-partition",
+    }[(section, key)]
+    config.get.side_effect = lambda section, key, default=None: (
+        stream_responses if key == "stream_responses" else default
+    )
+    return config
+
+
+@pytest.mark.asyncio
+async def test_items_are_yielded_with_top_level_metadata():
+    """Test that array items and the other top-level values are decoded."""
+    body = (
+        b'{"cursor": "c1", "results": [{"id": "a", "data": {"Depth": 1.5, '
+        b'"Tags": ["x", {"y": null}]}}, "plain", {"id": "b"}], '
+        b'"totalCount": 3, "aggregations": [{"key": "k", "count": 2}]}'
+    )
+    meta = {}
+
+    items = [
+        item async for item in iter_array_items(ChunkedStream(body), "results", meta)
+    ]
+
+    assert items == [
+        {"id": "a", "data": {"Depth": 1.5, "Tags": ["x", {"y": None}]}},
+        "plain",
+        {"id": "b"},
+    ]
+    assert type(items[0]["data"]["Depth"]) is float
+    assert meta == {
+        "cursor": "c1",
+        "totalCount": 3,
+        "aggregations": [{"key": "k", "count": 2}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_first_item_arrives_before_the_body_is_read():
+    """Test that items are handed out while the rest is still unread."""
+    records = ",".join(f'{{"id": "r{i}", "data": {{"n": {i}}}}}' for i in range(500))
+    stream = ChunkedStream(f'{{"records": [{records}]}}'.encode(), size=64)
+    items = iter_array_items(stream, "records")
+
+    first = await anext(items)
+    await items.aclose()
+
+    assert first == {"id": "r0", "data": {"n": 0}}
+    assert stream._body
+
+
+@pytest.mark.asyncio
+async def test_invalid_json_raises_api_error():
+    """Test that a malformed body surfaces as an API error."""
+    stream = ChunkedStream(b'{"results": [{"id": "a"}, {"id": ')
+
+    with pytest.raises(OSMCPAPIError, match="Invalid JSON response"):
+        [item async for item in iter_array_items(stream, "results")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream_responses", [True, False])
+async def test_client_streams_items_with_and_without_ijson(stream_responses):
+    """Test that streamed and buffered parsing give the same result."""
+    auth = AsyncMock()
+    auth.get_access_token.return_value = "test-token"
+    client = OsduClient(_mock_config(stream_responses), auth)
+    assert client._stream is stream_responses
+
+    try:
+        with aioresponses() as mocked:
+            mocked.post(
+                f"{URL}/api/query",
+                payload={"results": [{"id": "a"}, {"id": "b"}], "cursor": "c1"},
+            )
+            meta = {}
+            items = [
+                item
+                async for item in client.stream_items(
+                    "POST", "/api/query", "results", meta, json={}, idempotent=True
+                )
+            ]
+    finally:
+        await client.close()
+
+    assert items == [{"id": "a"}, {"id": "b"}]
+    assert meta == {"cursor": "c1"}
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_releases_the_service_guard():
+    """Test that closing a stream mid-way frees the concurrency slot."""
+    auth = AsyncMock()
+    auth.get_access_token.return_value = "test-token"
+    config = _mock_config()
+    client = OsduClient(config, auth)
+    client._service = OSMCPService.SEARCH
+    limiter = get_service_guard(config, URL, OSMCPService.SEARCH).limiter
+
+    try:
+        with aioresponses() as mocked:
+            mocked.post(
+                f"{URL}/api/query",
+                payload={"results": [{"id": str(i)} for i in range(100)]},
+            )
+            items = client.stream_items("POST", "/api/query", json={})
+            assert await anext(items) == {"id": "0"}
+            assert limiter.in_flight == 1
+            await items.aclose()
+    finally:
+        await client.close()
+
+    assert limiter.in_flight == 0
@@ -10,6 +10,22 @@ from osdu_mcp_server.shared.exceptions import OSMCPAPIError, OSMCPConnectionErro
 from osdu_mcp_server.shared.osdu_client import OsduClient
 
 
+def _server_setting(section, key, default=None):
+    """Return the request timeout and the defaults for every other setting."""
+    return 30 if (section, key) == ("server", "timeout") else default
+
+
+def _mock_config():
+    """Create a mock configuration pointing at the test server."""
+    mock_config = MagicMock()
+    mock_config.get_required.side_effect = lambda section, key: {
+        ("server", "url"): "https://test-osdu.com",
+        ("server", "data_partition"): "test-partition",
+    }[(section, key)]
+    mock_config.get.side_effect = _server_setting
+    return mock_config
+
+
 @pytest.mark.asyncio
 async def test_osdu_client_get_success():
     """Test successful GET request returns correct data."""
@@ -109,7 +125,7 @@ async def test_osdu_client_retries_on_connection_error():
         ("server", "url"): "https://test-osdu.com",
         ("server", "data_partition"): "test-partition",
     }[(section, key)]
-    mock_config.get.return_value = 30
+    mock_config.get.side_effect = _server_setting
 
     mock_auth = AsyncMock()
     mock_auth.get_access_token.return_value = "test-token"
@@ -128,7 +144,14 @@ async def test_osdu_client_retries_on_connection_error():
             "https://test-osdu.com/api/flaky", payload={"result": "success"}, status=200
         )
 
-        with patch("asyncio.sleep") as mock_sleep:
+        with (
+            patch("asyncio.sleep") as mock_sleep,
+            # Draw the largest delay so the jittered schedule is predictable
+            patch(
+                "osdu_mcp_server.shared.retry_policy.random.uniform",
+                side_effect=lambda low, high: high,
+            ),
+        ):
             client = OsduClient(mock_config, mock_auth)
             result = await client.get("/api/flaky")
 
@@ -151,7 +174,7 @@ async def test_osdu_client_fails_after_max_retries():
         ("server", "url"): "https://test-osdu.com",
         ("server", "data_partition"): "test-partition",
     }[(section, key)]
-    mock_config.get.return_value = 30
+    mock_config.get.side_effect = _server_setting
 
     mock_auth = AsyncMock()
     mock_auth.get_access_token.return_value = "test-token"
@@ -232,7 +255,8 @@ async def test_osdu_client_correctly_formats_headers():
     ) as mock_session_class:
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json.return_value = {"result": "success"}
+        mock_response.content_type = "application/json"
+        mock_response.read.return_value = b'{"result": "success"}'
 
         # Create a context manager for the request
         mock_context = AsyncMock()
@@ -258,3 +282,79 @@ async def test_osdu_client_correctly_formats_headers():
         assert headers["Content-Type"] == "application/json"
 
         await client.close()
+
+
+@pytest.mark.asyncio
+async def test_osdu_client_honors_retry_after_on_throttling():
+    """Test that 429 is retried for any method after the requested delay."""
+    mock_auth = AsyncMock()
+    mock_auth.get_access_token.return_value = "test-token"
+
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://test-osdu.com/api/create",
+            status=429,
+            body="Too many requests",
+            headers={"Retry-After": "5"},
+        )
+        mocked.post("https://test-osdu.com/api/create", payload={"id": "123"})
+
+        with patch("asyncio.sleep") as mock_sleep:
+            client = OsduClient(_mock_config(), mock_auth)
+            result = await client.post("/api/create", {"name": "test"})
+
+            assert result == {"id": "123"}
+            mock_sleep.assert_called_once_with(5.0)
+
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_osdu_client_does_not_repeat_non_idempotent_requests():
+    """Test that a 502 on a POST is not retried unless marked idempotent."""
+    mock_auth = AsyncMock()
+    mock_auth.get_access_token.return_value = "test-token"
+
+    with aioresponses() as mocked:
+        mocked.post("https://test-osdu.com/api/create", status=502, body="Bad gateway")
+        mocked.post("https://test-osdu.com/api/query", status=502, body="Bad gateway")
+        mocked.post("https://test-osdu.com/api/query", payload={"results": []})
+
+        with patch("asyncio.sleep") as mock_sleep:
+            client = OsduClient(_mock_config(), mock_auth)
+
+            with pytest.raises(OSMCPAPIError) as exc_info:
+                await client.post("/api/create", {"name": "test"})
+            assert exc_info.value.status_code == 502
+            assert mock_sleep.call_count == 0
+
+            result = await client.post("/api/query", {}, idempotent=True)
+            assert result == {"results": []}
+            assert mock_sleep.call_count == 1
+
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_osdu_client_stops_retrying_when_budget_is_spent():
+    """Test that a Retry-After beyond the call budget fails immediately."""
+    mock_auth = AsyncMock()
+    mock_auth.get_access_token.return_value = "test-token"
+
+    with aioresponses() as mocked:
+        mocked.get(
+            "https://test-osdu.com/api/busy",
+            status=503,
+            body="Unavailable",
+            headers={"Retry-After": "3600"},
+        )
+
+        with patch("asyncio.sleep") as mock_sleep:
+            client = OsduClient(_mock_config(), mock_auth)
+
+            with pytest.raises(OSMCPAPIError) as exc_info:
+                await client.get("/api/busy")
+            assert exc_info.value.status_code == 503
+            assert mock_sleep.call_count == 0
+
+            await client.close()
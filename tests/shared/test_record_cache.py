@@ -0,0 +1,154 @@
+"""Tests for the record cache."""
+
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aioresponses import aioresponses
+
+from osdu_mcp_server.shared.clients.storage_client import StorageClient
+from osdu_mcp_server.shared.config_manager import get_config
+from osdu_mcp_server.shared.record_cache import RecordCache, RecordSpillover
+
+SERVER = "https://test.osdu.com"
+RECORD_URL = f"{SERVER}/api/storage/v2/records/opendes:wellbore:1"
+
+TEST_ENV = {
+    "OSDU_MCP_SERVER_URL": SERVER,
+    "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+    "OSDU_MCP_ENABLE_WRITE_MODE": "true",
+    "OSDU_MCP_ENABLE_DELETE_MODE": "true",
+}
+
+
+def _record(version, name="Well"):
+    return {
+        "id": "opendes:wellbore:1",
+        "version": version,
+        "kind": "osdu:wks:master-data--Wellbore:1.0.0",
+        "data": {"Name": name},
+    }
+
+
+@pytest.mark.asyncio
+async def test_latest_lookups_expire_but_versions_do_not():
+    """Test that only latest-version entries are subject to the TTL."""
+    cache = RecordCache(latest_ttl=0)
+    await cache.put(SERVER, "opendes", _record(1), latest=True)
+
+    assert await cache.get(SERVER, "opendes", "opendes:wellbore:1", None) is None
+    assert await cache.get(SERVER, "opendes", "opendes:wellbore:1", 1) == _record(1)
+
+
+@pytest.mark.asyncio
+async def test_evicted_versions_spill_to_disk(tmp_path):
+    """Test LRU eviction into the size-bounded spillover store."""
+    spillover = RecordSpillover(tmp_path / "records.db", max_bytes=10**6)
+    cache = RecordCache(max_entries=1, spillover=spillover)
+
+    await cache.put(SERVER, "opendes", _record(1))
+    await cache.put(SERVER, "opendes", _record(2))
+
+    assert len(cache) == 1
+    assert await cache.get(SERVER, "opendes", "opendes:wellbore:1", 1) == _record(1)
+
+    await cache.invalidate_all(SERVER, "opendes", "opendes:wellbore:1")
+    assert await cache.get(SERVER, "opendes", "opendes:wellbore:1", 1) is None
+    assert await cache.get(SERVER, "opendes", "opendes:wellbore:1", 2) is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_spillover_keeps_its_size_bound_across_reopens(tmp_path):
+    """Test that the running size total evicts the oldest versions."""
+    path = tmp_path / "records.db"
+    spillover = RecordSpillover(path, max_bytes=10**6)
+    key = (SERVER, "opendes", "opendes:wellbore:1")
+    spillover.put((*key, 1), _record(1))
+    size = spillover._stored_bytes(spillover._connect())
+    # Replacing a version does not count it twice
+    spillover.put((*key, 1), _record(1))
+    assert spillover._total == size
+    spillover.close()
+
+    # Counted again from the file, then kept to roughly two records
+    spillover = RecordSpillover(path, max_bytes=2 * size + size // 2)
+    spillover.put((*key, 2), _record(2))
+    spillover.put((*key, 3), _record(3))
+
+    assert spillover.get((*key, 1)) is None
+    assert spillover.get((*key, 2)) == _record(2)
+    assert spillover.get((*key, 3)) == _record(3)
+    indexes = spillover._connect().execute("PRAGMA index_list(records)").fetchall()
+    assert "records_stored_at" in {row[1] for row in indexes}
+
+    spillover.discard(SERVER, "opendes", "opendes:wellbore:1")
+    assert spillover._total == 0
+    spillover.close()
+
+
+@pytest.mark.asyncio
+async def test_lookup_in_flight_during_a_write_is_not_cached_as_latest():
+    """Test that an invalidation wins over a concurrent latest lookup."""
+    cache = RecordCache()
+    generation = cache.generation
+    # A write lands while the lookup is still waiting for its response
+    cache.invalidate_latest(SERVER, "opendes", "opendes:wellbore:1")
+    await cache.put(SERVER, "opendes", _record(1), latest=True, generation=generation)
+
+    assert await cache.get(SERVER, "opendes", "opendes:wellbore:1", None) is None
+    # The fetched version itself is still valid
+    assert await cache.get(SERVER, "opendes", "opendes:wellbore:1", 1) == _record(1)
+
+    generation = cache.generation
+    await cache.put(SERVER, "opendes", _record(2), latest=True, generation=generation)
+    assert await cache.get(SERVER, "opendes", "opendes:wellbore:1", None) == _record(2)
+
+
+@pytest.mark.asyncio
+async def test_get_record_is_cached_until_this_server_writes():
+    """Test that writes through the client invalidate the latest version."""
+    with patch.dict(os.environ, TEST_ENV):
+        auth = AsyncMock()
+        auth.get_access_token.return_value = "test-token"
+        client = StorageClient(get_config(), auth)
+
+        with aioresponses() as mocked:
+            mocked.get(RECORD_URL, payload=_record(1))
+            mocked.get(RECORD_URL, payload=_record(2, "Renamed"))
+            mocked.put(
+                f"{SERVER}/api/storage/v2/records",
+                payload={"recordCount": 1, "recordIds": ["opendes:wellbore:1"]},
+            )
+
+            first = await client.get_record("opendes:wellbore:1")
+            # Served locally: only two GETs are registered
+            assert await client.get_record("opendes:wellbore:1") == first
+            # Callers cannot corrupt the cached copy
+            first["data"]["Name"] = "Mutated"
+            assert (await client.get_record("opendes:wellbore:1"))["data"] == {
+                "Name": "Well"
+            }
+
+            with patch.object(client, "validate_records_against_schemas"):
+                await client.create_update_records(
+                    [
+                        {
+                            **_record(None, "Renamed"),
+                            "acl": {"viewers": ["v"], "owners": ["o"]},
+                            "legal": {
+                                "legaltags": ["t"],
+                                "otherRelevantDataCountries": ["US"],
+                            },
+                        }
+                    ]
+                )
+
+            latest = await client.get_record("opendes:wellbore:1")
+            assert latest["version"] == 2
+            # The earlier version is still served from the cache
+            assert await client.get_record_version("opendes:wellbore:1", 1) == _record(
+                1
+            )
+
+        await client.close()
@@ -0,0 +1,158 @@
+"""Tests for local record validation against OSDU schemas."""
+
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from osdu_mcp_server.shared.clients.storage_client import StorageClient
+from osdu_mcp_server.shared.config_manager import get_config
+from osdu_mcp_server.shared.exceptions import OSMCPConfigError, OSMCPValidationError
+from osdu_mcp_server.shared.record_validator import validate_records
+
+KIND = "osdu:wks:master-data--Wellbore:1.0.0"
+COMMON = "osdu:wks:AbstractCommonResources:1.0.0"
+
+WELLBORE_SCHEMA = {
+    "schemaInfo": {"status": "PUBLISHED"},
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "definitions": {
+        "Depth": {"type": "number", "minimum": 0},
+    },
+    "properties": {
+        "data": {
+            "allOf": [
+                {"$ref": COMMON},
+                {
+                    "type": "object",
+                    "properties": {
+                        "FacilityName": {"type": "string"},
+                        "TotalDepth": {"$ref": "#/definitions/Depth"},
+                    },
+                    "required": ["FacilityName"],
+                },
+            ]
+        }
+    },
+}
+
+COMMON_SCHEMA = {
+    "type": "object",
+    "properties": {"ResourceSecurityClassification": {"type": "string"}},
+}
+
+TEST_ENV = {
+    "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+    "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+}
+
+
+def _schema_client():
+    schemas = {KIND: WELLBORE_SCHEMA, COMMON: COMMON_SCHEMA}
+    client = MagicMock()
+    client.config = get_config()
+    client.get_schema = AsyncMock(side_effect=lambda sid, **kwargs: schemas[sid])
+    return client
+
+
+def _record(data, kind=KIND):
+    return {
+        "kind": kind,
+        "acl": {"viewers": ["v"], "owners": ["o"]},
+        "legal": {"legaltags": ["t"], "otherRelevantDataCountries": ["US"]},
+        "data": data,
+    }
+
+
+@pytest.mark.asyncio
+async def test_validate_records_reports_errors_per_record():
+    """Test that local and cross-schema $refs are resolved and checked."""
+    with patch.dict(os.environ, TEST_ENV):
+        client = _schema_client()
+        records = [
+            _record({"FacilityName": "A-1", "TotalDepth": 1200.5}),
+            _record({"TotalDepth": -5}),
+            _record({"FacilityName": "B", "ResourceSecurityClassification": 7}),
+        ]
+
+        failures = await validate_records(client, records, max_errors=5)
+        # The compiled validator is reused for later batches
+        await validate_records(client, records, max_errors=5)
+
+    assert set(failures) == {1, 2}
+    assert any("'FacilityName' is a required property" in e for e in failures[1])
+    assert any(e.startswith("data.TotalDepth:") for e in failures[1])
+    assert failures[2] == [
+        "data.ResourceSecurityClassification: 7 is not of type 'string'"
+    ]
+    assert sorted(c.args[0] for c in client.get_schema.await_args_list) == [
+        COMMON,
+        KIND,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validate_records_skips_unknown_kinds():
+    """Test that kinds without a retrievable schema are left to the service."""
+    with patch.dict(os.environ, TEST_ENV):
+        client = _schema_client()
+        client.get_schema.side_effect = Exception("404 Not Found")
+
+        failures = await validate_records(client, [_record({"x": 1})], max_errors=5)
+
+    assert failures == {}
+
+
+@pytest.mark.asyncio
+async def test_validate_records_reports_kinds_that_are_not_strings():
+    """Test that list or object kinds are invalid instead of unhashable."""
+    with patch.dict(os.environ, TEST_ENV):
+        client = _schema_client()
+        records = [
+            _record({"FacilityName": "A"}, kind=[KIND]),
+            _record({"FacilityName": "B"}, kind={"id": KIND}),
+            _record({"FacilityName": "C"}),
+        ]
+
+        failures = await validate_records(client, records, max_errors=5)
+
+    assert set(failures) == {0, 1}
+    assert failures[0] == [f"kind must be a non-empty string, got {[KIND]!r}"]
+
+
+@pytest.mark.asyncio
+async def test_validate_records_reports_missing_jsonschema():
+    """Test that a missing validation library is surfaced, not skipped."""
+    with (
+        patch.dict(os.environ, TEST_ENV),
+        patch.dict(sys.modules, {"jsonschema": None}),
+    ):
+        with pytest.raises(OSMCPConfigError, match="jsonschema library not installed"):
+            await validate_records(
+                _schema_client(), [_record({"FacilityName": "A"})], max_errors=5
+            )
+
+
+@pytest.mark.asyncio
+async def test_create_update_records_fails_fast_on_schema_violations():
+    """Test that invalid batches are rejected before any write is sent."""
+    env = {**TEST_ENV, "OSDU_MCP_ENABLE_WRITE_MODE": "true"}
+    with patch.dict(os.environ, env):
+        client = StorageClient(get_config(), AsyncMock())
+        client.put = AsyncMock()
+
+        with patch(
+            "osdu_mcp_server.shared.clients.schema_client.SchemaClient.get_schema",
+            new=_schema_client().get_schema,
+        ):
+            with pytest.raises(OSMCPValidationError) as exc_info:
+                await client.create_update_records(
+                    [_record({"FacilityName": "A"}), _record({"TotalDepth": 10})]
+                )
+
+        await client.close()
+
+    assert "1 of 2 records failed schema validation" in str(exc_info.value)
+    assert "Record 2" in str(exc_info.value)
+    client.put.assert_not_awaited()
@@ -0,0 +1,85 @@
+"""Tests for the persistent schema cache."""
+
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aioresponses import aioresponses
+
+from osdu_mcp_server.shared.clients.schema_client import SchemaClient
+from osdu_mcp_server.shared.config_manager import get_config
+from osdu_mcp_server.shared.schema_cache import SchemaCache, get_schema_cache
+
+SERVER = "https://test.osdu.com"
+SCHEMA_ID = "osdu:wks:master-data--Wellbore:1.0.0"
+
+
+def test_published_schemas_never_expire(tmp_path):
+    """Test that PUBLISHED schemas are served regardless of age."""
+    cache = SchemaCache(tmp_path / "schemas.db", ttl=0)
+    cache.put(SERVER, "opendes", SCHEMA_ID, {"title": "Wellbore"}, "PUBLISHED")
+    cache.put(SERVER, "opendes", "dev:schema:1.0.0", {"title": "Dev"}, "DEVELOPMENT")
+
+    assert cache.get(SERVER, "opendes", SCHEMA_ID) == {"title": "Wellbore"}
+    # A zero TTL expires non-PUBLISHED entries immediately
+    assert cache.get(SERVER, "opendes", "dev:schema:1.0.0") is None
+    cache.close()
+
+
+def test_cache_is_keyed_by_server_and_partition(tmp_path):
+    """Test that entries from different environments do not collide."""
+    path = tmp_path / "schemas.db"
+    cache = SchemaCache(path)
+    cache.put(SERVER, "opendes", SCHEMA_ID, {"title": "A"}, "PUBLISHED")
+    cache.close()
+
+    # Entries survive a restart
+    reopened = SchemaCache(path)
+    assert reopened.get(SERVER, "opendes", SCHEMA_ID) == {"title": "A"}
+    assert reopened.get(SERVER, "other", SCHEMA_ID) is None
+    assert reopened.get("https://other.osdu.com", "opendes", SCHEMA_ID) is None
+
+    reopened.invalidate(SERVER, "opendes", SCHEMA_ID)
+    assert reopened.get(SERVER, "opendes", SCHEMA_ID) is None
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_get_schema_reads_published_schema_from_cache():
+    """Test that a PUBLISHED schema is fetched over the network only once."""
+    test_env = {
+        "OSDU_MCP_SERVER_URL": SERVER,
+        "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+    }
+    schema_body = {
+        "schemaInfo": {"status": "PUBLISHED"},
+        "title": "Wellbore",
+        "properties": {},
+    }
+
+    with patch.dict(os.environ, test_env):
+        auth = AsyncMock()
+        auth.get_access_token.return_value = "test-token"
+
+        with aioresponses() as mocked:
+            mocked.get(
+                f"{SERVER}/api/schema-service/v1/schema/{SCHEMA_ID}",
+                payload=schema_body,
+            )
+
+            first = SchemaClient(get_config(), auth)
+            assert await first.get_schema(SCHEMA_ID) == schema_body
+            await first.close()
+
+            # Second call is answered locally (no further mock registered)
+            second = SchemaClient(get_config(), auth)
+            assert await second.get_schema(SCHEMA_ID) == schema_body
+            await second.close()
+
+        assert get_schema_cache().get(SERVER, "opendes", SCHEMA_ID) == schema_body
+
+
+def test_schema_cache_can_be_disabled():
+    """Test that caching is skipped when disabled in configuration."""
+    with patch.dict(os.environ, {"OSDU_MCP_SCHEMA_CACHE_ENABLED": "false"}):
+        assert get_schema_cache() is None
@@ -0,0 +1,95 @@
+"""Tests for the schema full-text search index."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from osdu_mcp_server.shared.schema_index import SchemaIndex, ensure_indexed
+
+
+def _listing(schema_id, status="PUBLISHED"):
+    authority, source, entity, _ = schema_id.split(":")
+    return {
+        "schemaIdentity": {
+            "id": schema_id,
+            "authority": authority,
+            "source": source,
+            "entityType": entity,
+        },
+        "status": status,
+    }
+
+
+def test_index_ranks_by_field_relevance():
+    """Test that title matches outrank property description matches."""
+    index = SchemaIndex()
+    index.add_body("a:b:Gauge:1.0.0", {"title": "Pressure Gauge"}, "PUBLISHED")
+    index.add_body(
+        "a:b:Wellbore:1.0.0",
+        {
+            "title": "Wellbore",
+            "properties": {
+                "BottomHolePressure": {"description": "Measured pressure"},
+            },
+        },
+        "PUBLISHED",
+    )
+    index.add_body("a:b:Unrelated:1.0.0", {"title": "Seismic"}, "PUBLISHED")
+
+    scores = index.search("pressure", ["title", "properties"])
+
+    assert set(scores) == {"a:b:Gauge:1.0.0", "a:b:Wellbore:1.0.0"}
+    assert scores["a:b:Gauge:1.0.0"] > scores["a:b:Wellbore:1.0.0"]
+    # Substring matching: "hole" is found inside the property name
+    assert set(index.search("hole pressure", ["properties"])) == {"a:b:Wellbore:1.0.0"}
+    # Only the requested fields are searched
+    assert index.search("pressure", ["description"]) == {}
+
+
+def test_index_replaces_entries_on_reindex():
+    """Test that re-indexing a schema drops its previous terms."""
+    index = SchemaIndex(body_ttl=0)
+    index.add_body("a:b:Dev:1.0.0", {"title": "Draft porosity"}, "DEVELOPMENT")
+    assert index.needs_body("a:b:Dev:1.0.0", "DEVELOPMENT") is True
+
+    index.add_body("a:b:Dev:1.0.0", {"title": "Final permeability"}, "PUBLISHED")
+
+    assert index.search("porosity", ["title"]) == {}
+    assert "a:b:Dev:1.0.0" in index.search("permeability", ["title"])
+    assert index.needs_body("a:b:Dev:1.0.0", "PUBLISHED") is False
+
+
+def test_index_lookups_follow_vocabulary_changes():
+    """Test that substring lookups see terms added after an earlier search."""
+    index = SchemaIndex()
+    index.add_listing(_listing("a:b:Wellbore:1.0.0"))
+    index.add_body("a:b:Wellbore:1.0.0", {"title": "Wellbore"}, "PUBLISHED")
+    assert index.search("bore", ["content"]) == {"a:b:Wellbore:1.0.0": 3.0}
+
+    index.add_body("a:b:Well:1.0.0", {"description": "Borehole log"}, "PUBLISHED")
+    assert set(index.search("bore", ["content"])) == {
+        "a:b:Wellbore:1.0.0",
+        "a:b:Well:1.0.0",
+    }
+
+    # Re-listing a schema with unchanged identity leaves the lookups valid
+    assert set(index.search("wellb", ["entityType"])) == {"a:b:Wellbore:1.0.0"}
+    index.add_listing(_listing("a:b:Wellbore:1.0.0"))
+    assert "entityType" not in index._stale_fields
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexed_fetches_only_missing_bodies():
+    """Test that warm indexes answer queries without fetching bodies again."""
+    schemas = [_listing("osdu:wks:Well:1.0.0"), _listing("osdu:wks:Log:1.0.0")]
+    client = AsyncMock()
+    client.get_schema.side_effect = lambda sid, status=None: {"title": sid}
+
+    index = SchemaIndex()
+    first = await ensure_indexed(index, client, schemas, True, concurrency=2)
+    second = await ensure_indexed(index, client, schemas, True, concurrency=2)
+
+    assert set(first) == {"osdu:wks:Well:1.0.0", "osdu:wks:Log:1.0.0"}
+    assert second == {}
+    assert client.get_schema.await_count == 2
+    assert set(index.search("well", ["entityType"])) == {"osdu:wks:Well:1.0.0"}
@@ -0,0 +1,122 @@
+"""Tests for per-service circuit breakers and concurrency limits."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from osdu_mcp_server.shared.clients.schema_client import SchemaClient
+from osdu_mcp_server.shared.clients.search_client import SearchClient
+from osdu_mcp_server.shared.config_manager import get_config
+from osdu_mcp_server.shared.exceptions import OSMCPAPIError, OSMCPConnectionError
+from osdu_mcp_server.shared.service_guard import AdaptiveLimiter, CircuitBreaker
+
+SERVER = "https://test.osdu.com"
+
+TEST_ENV = {
+    "OSDU_MCP_SERVER_URL": SERVER,
+    "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+    "OSDU_MCP_SERVER_CIRCUIT_FAILURE_THRESHOLD": "2",
+    "OSDU_MCP_SERVER_RETRY_MAX_ATTEMPTS": "1",
+}
+
+
+def test_circuit_breaker_half_open_probe():
+    """Test that an open circuit lets a single probe through after the timeout."""
+    breaker = CircuitBreaker("schema", failure_threshold=2, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    probe = breaker.check()
+    assert probe is True
+    # Other calls are shed while the probe is in flight
+    with pytest.raises(OSMCPConnectionError, match="recovery probe"):
+        breaker.check()
+
+    breaker.record_failure(probe)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    probe = breaker.check()
+    breaker.record_success(probe)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.check() is False
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_aimd():
+    """Test multiplicative decrease, additive increase and queued waiters."""
+    limiter = AdaptiveLimiter(max_limit=4)
+
+    for _ in range(4):
+        await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.on_overload(latency=0)
+    assert limiter.limit == 2
+    # A second overload within the same round trip is ignored
+    limiter.on_overload(latency=60)
+    assert limiter.limit == 2
+
+    for _ in range(3):
+        limiter.release()
+    # One slot in flight, limit 2: the waiter is admitted
+    await asyncio.wait_for(waiter, 1)
+    assert limiter.in_flight == 2
+
+    limiter.on_success(latency=0.1)
+    assert limiter.limit == 2.5
+    # Latency far above the baseline counts as congestion
+    limiter._last_decrease = 0
+    limiter.on_success(latency=10)
+    assert limiter.limit == 1.25
+
+
+def test_slow_writes_do_not_look_like_congestion_for_reads():
+    """Test that latency baselines are kept per HTTP method."""
+    limiter = AdaptiveLimiter(max_limit=4)
+    limiter.limit = 2
+
+    limiter.on_success(latency=0.05, method="GET")
+    # A large ingest PUT is measured against other PUTs, not against reads
+    limiter.on_success(latency=5, method="PUT")
+    limiter.on_success(latency=6, method="PUT")
+    assert limiter.limit > 2
+
+    # A read that slow is still treated as congestion
+    limiter.on_success(latency=5, method="GET")
+    assert limiter.limit < 2
+
+
+@pytest.mark.asyncio
+async def test_failing_service_sheds_load_without_affecting_others():
+    """Test that an open schema circuit fails fast while search keeps working."""
+    with patch.dict("os.environ", TEST_ENV):
+        auth = AsyncMock()
+        auth.get_access_token.return_value = "test-token"
+        config = get_config()
+        schema = SchemaClient(config, auth)
+        search = SearchClient(config, auth)
+
+        with aioresponses() as mocked:
+            url = f"{SERVER}/api/schema-service/v1/schema/osdu:wks:a:1.0.0"
+            mocked.get(url, status=503, body="Unavailable", repeat=True)
+            mocked.post(f"{SERVER}/api/search/v2/query", payload={"results": []})
+
+            for _ in range(2):
+                with pytest.raises(OSMCPAPIError):
+                    await schema.get("/schema/osdu:wks:a:1.0.0")
+
+            with pytest.raises(OSMCPConnectionError, match="circuit open"):
+                await schema.get("/schema/osdu:wks:a:1.0.0")
+            assert len(mocked.requests[("GET", URL(url))]) == 2
+
+            assert await search.post("/query", json={}) == {"results": []}
+
+        await schema.close()
+        await search.close()
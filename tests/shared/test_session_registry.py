@@ -0,0 +1,92 @@
+"""Tests for the shared HTTP session registry."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aioresponses import aioresponses
+
+from osdu_mcp_server.server import mcp, server_lifespan
+from osdu_mcp_server.shared.osdu_client import OsduClient
+from osdu_mcp_server.shared.session_registry import (
+    SessionRegistry,
+    get_session_registry,
+)
+
+
+def _mock_config():
+    config = MagicMock()
+    config.get_required.side_effect = lambda section, key: {
+        ("server", "url"): "https://test-osdu.com",
+        ("server", "data_partition"): "test-partition",
+    }[(section, key)]
+    config.get.side_effect = lambda section, key, default=None: default
+    return config
+
+
+def _mock_auth():
+    auth = AsyncMock()
+    auth.get_access_token.return_value = "test-token"
+    return auth
+
+
+@pytest.mark.asyncio
+async def test_registry_inactive_by_default():
+    """Test that clients own their session when no server lifespan is running."""
+    assert get_session_registry().active is False
+
+    client = OsduClient(_mock_config(), _mock_auth())
+    session = await client._ensure_session()
+
+    await client.close()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_clients_share_pooled_session_during_lifespan():
+    """Test that clients reuse one session across tool calls while serving."""
+    with patch.dict(os.environ, {"OSDU_MCP_AUTH_BACKGROUND_REFRESH": "false"}):
+        async with server_lifespan(mcp):
+            first = OsduClient(_mock_config(), _mock_auth())
+            second = OsduClient(_mock_config(), _mock_auth())
+
+            with aioresponses() as mocked:
+                mocked.get("https://test-osdu.com/api/a", payload={"n": 1})
+                mocked.get("https://test-osdu.com/api/b", payload={"n": 2})
+
+                assert await first.get("/api/a") == {"n": 1}
+                shared = first._session
+                await first.close()
+
+                assert await second.get("/api/b") == {"n": 2}
+                assert second._session is shared
+                await second.close()
+
+            # Closing a client must not tear down the shared session
+            assert not shared.closed
+
+    # Shutting down the server closes shared sessions
+    assert shared.closed
+    assert get_session_registry().active is False
+
+
+@pytest.mark.asyncio
+async def test_registry_applies_pool_configuration():
+    """Test that connection pool limits come from configuration."""
+    config = MagicMock()
+    config.get.side_effect = lambda section, key, default=None: {
+        "connection_limit": 10,
+        "connection_limit_per_host": 5,
+        "keepalive_timeout": 60,
+    }.get(key, default)
+
+    registry = SessionRegistry()
+    registry.start(config)
+    session = await registry.get_session("https://test-osdu.com")
+
+    assert session.connector.limit == 10
+    assert session.connector.limit_per_host == 5
+    assert await registry.get_session("https://test-osdu.com") is session
+
+    await registry.close()
+    assert session.closed
@@ -11,8 +11,8 @@ from osdu_mcp_server.tools.health_check import health_check
 async def test_health_check_success():
     """Test successful health check with mocked dependencies."""
     with (
-        patch("osdu_mcp_server.tools.health_check.ConfigManager") as mock_config,
-        patch("osdu_mcp_server.tools.health_check.AuthHandler") as mock_auth,
+        patch("osdu_mcp_server.tools.health_check.get_config") as mock_config,
+        patch("osdu_mcp_server.tools.health_check.get_auth_handler") as mock_auth,
         patch("osdu_mcp_server.tools.health_check.OsduClient") as mock_client,
     ):
 
@@ -48,8 +48,8 @@ async def test_health_check_success():
 async def test_health_check_auth_failure():
     """Test health check with authentication failure."""
     with (
-        patch("osdu_mcp_server.tools.health_check.ConfigManager") as mock_config,
-        patch("osdu_mcp_server.tools.health_check.AuthHandler") as mock_auth,
+        patch("osdu_mcp_server.tools.health_check.get_config") as mock_config,
+        patch("osdu_mcp_server.tools.health_check.get_auth_handler") as mock_auth,
         patch("osdu_mcp_server.tools.health_check.OsduClient") as mock_client,
     ):
 
@@ -75,8 +75,8 @@ async def test_health_check_auth_failure():
 async def test_health_check_service_unhealthy():
     """Test health check with one unhealthy service."""
     with (
-        patch("osdu_mcp_server.tools.health_check.ConfigManager") as mock_config,
-        patch("osdu_mcp_server.tools.health_check.AuthHandler") as mock_auth,
+        patch("osdu_mcp_server.tools.health_check.get_config") as mock_config,
+        patch("osdu_mcp_server.tools.health_check.get_auth_handler") as mock_auth,
         patch("osdu_mcp_server.tools.health_check.OsduClient") as mock_client,
     ):
 
@@ -109,8 +109,8 @@ async def test_health_check_service_unhealthy():
 async def test_health_check_without_services():
     """Test health check without checking services."""
     with (
-        patch("osdu_mcp_server.tools.health_check.ConfigManager") as mock_config,
-        patch("osdu_mcp_server.tools.health_check.AuthHandler") as mock_auth,
+        patch("osdu_mcp_server.tools.health_check.get_config") as mock_config,
+        patch("osdu_mcp_server.tools.health_check.get_auth_handler") as mock_auth,
         patch("osdu_mcp_server.tools.health_check.OsduClient") as mock_client,
     ):
 
@@ -134,8 +134,8 @@ async def test_health_check_without_services():
 async def test_health_check_with_version_info():
     """Test health check with version information."""
     with (
-        patch("osdu_mcp_server.tools.health_check.ConfigManager") as mock_config,
-        patch("osdu_mcp_server.tools.health_check.AuthHandler") as mock_auth,
+        patch("osdu_mcp_server.tools.health_check.get_config") as mock_config,
+        patch("osdu_mcp_server.tools.health_check.get_auth_handler") as mock_auth,
         patch("osdu_mcp_server.tools.health_check.OsduClient") as mock_client,
     ):
 
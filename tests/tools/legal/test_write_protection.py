@@ -57,8 +57,8 @@ async def test_legaltag_delete_disabled():
         # Remove the env var if it exists
         os.environ.pop("OSDU_MCP_ENABLE_DELETE_MODE", None)
 
-        with patch("osdu_mcp_server.tools.legal.delete.ConfigManager"):
-            with patch("osdu_mcp_server.tools.legal.delete.AuthHandler"):
+        with patch("osdu_mcp_server.tools.legal.delete.get_config"):
+            with patch("osdu_mcp_server.tools.legal.delete.get_auth_handler"):
                 with pytest.raises(McpError) as exc_info:
                     await legaltag_delete(name="Test-Tag", confirm=True)
 
@@ -73,8 +73,8 @@ async def test_legaltag_delete_disabled():
 async def test_legaltag_delete_no_confirmation():
     """Test that legaltag_delete fails without confirmation."""
     with patch.dict(os.environ, {"OSDU_MCP_ENABLE_DELETE_MODE": "true"}, clear=False):
-        with patch("osdu_mcp_server.tools.legal.delete.ConfigManager"):
-            with patch("osdu_mcp_server.tools.legal.delete.AuthHandler"):
+        with patch("osdu_mcp_server.tools.legal.delete.get_config"):
+            with patch("osdu_mcp_server.tools.legal.delete.get_auth_handler"):
                 with pytest.raises(McpError) as exc_info:
                     await legaltag_delete(name="Test-Tag", confirm=False)
 
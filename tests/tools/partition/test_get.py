@@ -21,14 +21,16 @@ async def test_partition_get_success():
             },
         )
 
-        with patch("osdu_mcp_server.tools.partition.get.ConfigManager") as mock_config:
+        with patch("osdu_mcp_server.tools.partition.get.get_config") as mock_config:
             mock_config.return_value.get.return_value = "https://test.osdu.com"
             mock_config.return_value.get_required.side_effect = lambda section, key: {
                 ("server", "url"): "https://test.osdu.com",
                 ("server", "data_partition"): "osdu",
             }[(section, key)]
 
-            with patch("osdu_mcp_server.tools.partition.get.AuthHandler") as mock_auth:
+            with patch(
+                "osdu_mcp_server.tools.partition.get.get_auth_handler"
+            ) as mock_auth:
                 mock_auth.return_value.get_access_token = AsyncMock(
                     return_value="test-token"
                 )
@@ -60,14 +62,16 @@ async def test_partition_get_with_redacted_sensitive():
             },
         )
 
-        with patch("osdu_mcp_server.tools.partition.get.ConfigManager") as mock_config:
+        with patch("osdu_mcp_server.tools.partition.get.get_config") as mock_config:
             mock_config.return_value.get.return_value = "https://test.osdu.com"
             mock_config.return_value.get_required.side_effect = lambda section, key: {
                 ("server", "url"): "https://test.osdu.com",
                 ("server", "data_partition"): "osdu",
             }[(section, key)]
 
-            with patch("osdu_mcp_server.tools.partition.get.AuthHandler") as mock_auth:
+            with patch(
+                "osdu_mcp_server.tools.partition.get.get_auth_handler"
+            ) as mock_auth:
                 mock_auth.return_value.get_access_token = AsyncMock(
                     return_value="test-token"
                 )
@@ -100,14 +104,16 @@ async def test_partition_get_not_found():
             body="nonexistent partition not found",
         )
 
-        with patch("osdu_mcp_server.tools.partition.get.ConfigManager") as mock_config:
+        with patch("osdu_mcp_server.tools.partition.get.get_config") as mock_config:
             mock_config.return_value.get.return_value = "https://test.osdu.com"
             mock_config.return_value.get_required.side_effect = lambda section, key: {
                 ("server", "url"): "https://test.osdu.com",
                 ("server", "data_partition"): "osdu",
             }[(section, key)]
 
-            with patch("osdu_mcp_server.tools.partition.get.AuthHandler") as mock_auth:
+            with patch(
+                "osdu_mcp_server.tools.partition.get.get_auth_handler"
+            ) as mock_auth:
                 mock_auth.return_value.get_access_token = AsyncMock(
                     return_value="test-token"
                 )
@@ -132,14 +138,16 @@ async def test_partition_get_with_sensitive_values():
             payload={"storage-account-key": {"sensitive": True, "value": "secret-key"}},
         )
 
-        with patch("osdu_mcp_server.tools.partition.get.ConfigManager") as mock_config:
+        with patch("osdu_mcp_server.tools.partition.get.get_config") as mock_config:
             mock_config.return_value.get.return_value = "https://test.osdu.com"
             mock_config.return_value.get_required.side_effect = lambda section, key: {
                 ("server", "url"): "https://test.osdu.com",
                 ("server", "data_partition"): "osdu",
             }[(section, key)]
 
-            with patch("osdu_mcp_server.tools.partition.get.AuthHandler") as mock_auth:
+            with patch(
+                "osdu_mcp_server.tools.partition.get.get_auth_handler"
+            ) as mock_auth:
                 mock_auth.return_value.get_access_token = AsyncMock(
                     return_value="test-token"
                 )
@@ -171,14 +179,16 @@ async def test_partition_get_exclude_sensitive():
             },
         )
 
-        with patch("osdu_mcp_server.tools.partition.get.ConfigManager") as mock_config:
+        with patch("osdu_mcp_server.tools.partition.get.get_config") as mock_config:
             mock_config.return_value.get.return_value = "https://test.osdu.com"
             mock_config.return_value.get_required.side_effect = lambda section, key: {
                 ("server", "url"): "https://test.osdu.com",
                 ("server", "data_partition"): "osdu",
             }[(section, key)]
 
-            with patch("osdu_mcp_server.tools.partition.get.AuthHandler") as mock_auth:
+            with patch(
+                "osdu_mcp_server.tools.partition.get.get_auth_handler"
+            ) as mock_auth:
                 mock_auth.return_value.get_access_token = AsyncMock(
                     return_value="test-token"
                 )
@@ -18,14 +18,16 @@ async def test_partition_list_success():
             payload=["osdu", "tenant-a", "tenant-b"],
         )
 
-        with patch("osdu_mcp_server.tools.partition.list.ConfigManager") as mock_config:
+        with patch("osdu_mcp_server.tools.partition.list.get_config") as mock_config:
             mock_config.return_value.get.return_value = "https://test.osdu.com"
             mock_config.return_value.get_required.side_effect = lambda section, key: {
                 ("server", "url"): "https://test.osdu.com",
                 ("server", "data_partition"): "osdu",
             }[(section, key)]
 
-            with patch("osdu_mcp_server.tools.partition.list.AuthHandler") as mock_auth:
+            with patch(
+                "osdu_mcp_server.tools.partition.list.get_auth_handler"
+            ) as mock_auth:
                 mock_auth.return_value.get_access_token = AsyncMock(
                     return_value="test-token"
                 )
@@ -47,14 +49,16 @@ async def test_partition_list_empty():
             payload=[],
         )
 
-        with patch("osdu_mcp_server.tools.partition.list.ConfigManager") as mock_config:
+        with patch("osdu_mcp_server.tools.partition.list.get_config") as mock_config:
             mock_config.return_value.get.return_value = "https://test.osdu.com"
             mock_config.return_value.get_required.side_effect = lambda section, key: {
                 ("server", "url"): "https://test.osdu.com",
                 ("server", "data_partition"): "osdu",
             }[(section, key)]
 
-            with patch("osdu_mcp_server.tools.partition.list.AuthHandler") as mock_auth:
+            with patch(
+                "osdu_mcp_server.tools.partition.list.get_auth_handler"
+            ) as mock_auth:
                 mock_auth.return_value.get_access_token = AsyncMock(
                     return_value="test-token"
                 )
@@ -77,14 +81,16 @@ async def test_partition_list_forbidden():
             body="Access denied",
         )
 
-        with patch("osdu_mcp_server.tools.partition.list.ConfigManager") as mock_config:
+        with patch("osdu_mcp_server.tools.partition.list.get_config") as mock_config:
             mock_config.return_value.get.return_value = "https://test.osdu.com"
             mock_config.return_value.get_required.side_effect = lambda section, key: {
                 ("server", "url"): "https://test.osdu.com",
                 ("server", "data_partition"): "osdu",
             }[(section, key)]
 
-            with patch("osdu_mcp_server.tools.partition.list.AuthHandler") as mock_auth:
+            with patch(
+                "osdu_mcp_server.tools.partition.list.get_auth_handler"
+            ) as mock_auth:
                 mock_auth.return_value.get_access_token = AsyncMock(
                     return_value="test-token"
                 )
@@ -106,14 +112,16 @@ async def test_partition_list_with_detailed_metadata():
             payload=["osdu", "tenant-a"],
         )
 
-        with patch("osdu_mcp_server.tools.partition.list.ConfigManager") as mock_config:
+        with patch("osdu_mcp_server.tools.partition.list.get_config") as mock_config:
             mock_config.return_value.get.return_value = "https://test.osdu.com"
             mock_config.return_value.get_required.side_effect = lambda section, key: {
                 ("server", "url"): "https://test.osdu.com",
                 ("server", "data_partition"): "osdu",
             }[(section, key)]
 
-            with patch("osdu_mcp_server.tools.partition.list.AuthHandler") as mock_auth:
+            with patch(
+                "osdu_mcp_server.tools.partition.list.get_auth_handler"
+            ) as mock_auth:
                 mock_auth.return_value.get_access_token = AsyncMock(
                     return_value="test-token"
                 )
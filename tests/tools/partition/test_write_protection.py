@@ -17,8 +17,8 @@ async def test_partition_create_blocked_by_default():
         # Remove the env var if it exists
         os.environ.pop("OSDU_MCP_ENABLE_WRITE_MODE", None)
 
-        with patch("osdu_mcp_server.tools.partition.create.ConfigManager"):
-            with patch("osdu_mcp_server.tools.partition.create.AuthHandler"):
+        with patch("osdu_mcp_server.tools.partition.create.get_config"):
+            with patch("osdu_mcp_server.tools.partition.create.get_auth_handler"):
                 result = await partition_create("test-partition", {"key": "value"})
 
                 assert result["success"] is False
@@ -32,8 +32,8 @@ async def test_partition_update_blocked_by_default():
     with patch.dict(os.environ, {}, clear=False):
         os.environ.pop("OSDU_MCP_ENABLE_WRITE_MODE", None)
 
-        with patch("osdu_mcp_server.tools.partition.update.ConfigManager"):
-            with patch("osdu_mcp_server.tools.partition.update.AuthHandler"):
+        with patch("osdu_mcp_server.tools.partition.update.get_config"):
+            with patch("osdu_mcp_server.tools.partition.update.get_auth_handler"):
                 result = await partition_update("test-partition", {"key": "value"})
 
                 assert result["success"] is False
@@ -47,8 +47,8 @@ async def test_partition_delete_blocked_by_default():
     with patch.dict(os.environ, {}, clear=False):
         os.environ.pop("OSDU_MCP_ENABLE_WRITE_MODE", None)
 
-        with patch("osdu_mcp_server.tools.partition.delete.ConfigManager"):
-            with patch("osdu_mcp_server.tools.partition.delete.AuthHandler"):
+        with patch("osdu_mcp_server.tools.partition.delete.get_config"):
+            with patch("osdu_mcp_server.tools.partition.delete.get_auth_handler"):
                 result = await partition_delete("test-partition", confirm=True)
 
                 assert result["success"] is False
@@ -60,8 +60,8 @@ async def test_partition_delete_blocked_by_default():
 async def test_partition_delete_requires_confirmation():
     """Test partition delete requires explicit confirmation."""
     with patch.dict(os.environ, {"OSDU_MCP_ENABLE_WRITE_MODE": "true"}):
-        with patch("osdu_mcp_server.tools.partition.delete.ConfigManager"):
-            with patch("osdu_mcp_server.tools.partition.delete.AuthHandler"):
+        with patch("osdu_mcp_server.tools.partition.delete.get_config"):
+            with patch("osdu_mcp_server.tools.partition.delete.get_auth_handler"):
                 # Without confirmation
                 result = await partition_delete("test-partition", confirm=False)
 
@@ -75,8 +75,8 @@ async def test_partition_delete_requires_confirmation():
 async def test_dry_run_operations():
     """Test dry run mode for write operations."""
     with patch.dict(os.environ, {"OSDU_MCP_ENABLE_WRITE_MODE": "true"}):
-        with patch("osdu_mcp_server.tools.partition.create.ConfigManager"):
-            with patch("osdu_mcp_server.tools.partition.create.AuthHandler"):
+        with patch("osdu_mcp_server.tools.partition.create.get_config"):
+            with patch("osdu_mcp_server.tools.partition.create.get_auth_handler"):
                 # Test create dry run
                 result = await partition_create(
                     "test-partition", {"key": "value"}, dry_run=True
@@ -87,8 +87,8 @@ async def test_dry_run_operations():
                 assert result["dry_run"] is True
                 assert "would be created" in result["message"]
 
-        with patch("osdu_mcp_server.tools.partition.delete.ConfigManager"):
-            with patch("osdu_mcp_server.tools.partition.delete.AuthHandler"):
+        with patch("osdu_mcp_server.tools.partition.delete.get_config"):
+            with patch("osdu_mcp_server.tools.partition.delete.get_auth_handler"):
                 # Test delete dry run
                 result = await partition_delete(
                     "test-partition", confirm=True, dry_run=True
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from azure.core.credentials import AccessToken
 
 from osdu_mcp_server.tools.schema.list import schema_list
@@ -184,3 +184,65 @@ async def test_schema_list_empty():
         assert result["count"] == 0
         assert len(result["schemas"]) == 0
         assert result["totalCount"] == 0
+
+
+@pytest.mark.asyncio
+async def test_schema_list_auto_paginates_large_limits():
+    """Test that limits above one page are fetched as offset pages and merged."""
+    total = 250
+    requested = []
+
+    def respond(url, **kwargs):
+        limit = int(url.query["limit"])
+        offset = int(url.query.get("offset", 0))
+        requested.append((offset, limit))
+        end = min(offset + limit, total)
+        return CallbackResult(
+            payload={
+                "schemaInfos": [
+                    {"schemaIdentity": {"id": f"osdu:wks:Entity{i}:1.0.0"}}
+                    for i in range(offset, end)
+                ],
+                "totalCount": total,
+            }
+        )
+
+    mock_token = AccessToken(
+        token="fake-token",
+        expires_on=int((datetime.now() + timedelta(hours=1)).timestamp()),
+    )
+
+    test_env = {
+        "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+        "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+        "AZURE_CLIENT_ID": "test-client-id",
+        "AZURE_TENANT_ID": "test-tenant-id",
+        "AZURE_CLIENT_SECRET": "test-secret",
+    }
+
+    with patch.dict(os.environ, test_env):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            mock_credential = MagicMock()
+            mock_credential.get_token.return_value = mock_token
+            mock_credential_class.return_value = mock_credential
+
+            with aioresponses() as mocked:
+                mocked.get(
+                    re.compile(
+                        r"https://test\.osdu\.com/api/schema-service/v1/schema\?.*"
+                    ),
+                    callback=respond,
+                    repeat=True,
+                )
+
+                result = await schema_list(limit=1000)
+
+    assert sorted(requested) == [(0, 100), (100, 100), (200, 50)]
+    assert result["success"] is True
+    assert result["count"] == total
+    assert result["totalCount"] == total
+    assert [s["schemaIdentity"]["id"] for s in result["schemas"]] == [
+        f"osdu:wks:Entity{i}:1.0.0" for i in range(total)
+    ]
@@ -1,5 +1,6 @@
 """Tests for schema_search tool."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -7,10 +8,20 @@ import pytest
 from osdu_mcp_server.tools.schema.search import schema_search
 
 
+def _pages(*responses):
+    """Mock SchemaClient.search_schema_pages yielding the given listing pages."""
+
+    async def pages(**kwargs):
+        for response in responses:
+            yield response
+
+    return MagicMock(side_effect=pages)
+
+
 @pytest.mark.asyncio
 async def test_schema_search_basic():
     """Test that schema_search handles API response correctly."""
-    # Mock SchemaClient.search_schemas
+    # Mock SchemaClient.search_schema_pages
     mock_response = {
         "schemaInfos": [
             {
@@ -33,14 +44,14 @@ async def test_schema_search_basic():
     }
 
     with (
-        patch("osdu_mcp_server.tools.schema.search.ConfigManager"),
-        patch("osdu_mcp_server.tools.schema.search.AuthHandler"),
+        patch("osdu_mcp_server.tools.schema.search.get_config"),
+        patch("osdu_mcp_server.tools.schema.search.get_auth_handler"),
         patch("osdu_mcp_server.tools.schema.search.SchemaClient") as mock_client_class,
     ):
 
         # Setup the mock client
         mock_client = AsyncMock()
-        mock_client.search_schemas.return_value = mock_response
+        mock_client.search_schema_pages = _pages(mock_response)
         mock_client_class.return_value = mock_client
 
         # Mock config
@@ -60,7 +71,7 @@ async def test_schema_search_basic():
         )
 
         # Verify the mock was called correctly
-        mock_client.search_schemas.assert_called_once()
+        mock_client.search_schema_pages.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -101,14 +112,14 @@ async def test_schema_search_with_text():
     }
 
     with (
-        patch("osdu_mcp_server.tools.schema.search.ConfigManager"),
-        patch("osdu_mcp_server.tools.schema.search.AuthHandler"),
+        patch("osdu_mcp_server.tools.schema.search.get_config"),
+        patch("osdu_mcp_server.tools.schema.search.get_auth_handler"),
         patch("osdu_mcp_server.tools.schema.search.SchemaClient") as mock_client_class,
     ):
 
         # Setup the mock client
         mock_client = AsyncMock()
-        mock_client.search_schemas.return_value = mock_list_response
+        mock_client.search_schema_pages = _pages(mock_list_response)
         mock_client.get_schema.return_value = {"schema": mock_schema_content}
         mock_client_class.return_value = mock_client
 
@@ -128,5 +139,62 @@ async def test_schema_search_with_text():
         assert result["query"] == "pressure"
 
         # Verify mocks were called correctly
-        mock_client.search_schemas.assert_called_once()
-        mock_client.get_schema.assert_called_once_with("osdu:wks:TestSchema:1.0.0")
+        mock_client.search_schema_pages.assert_called_once()
+        mock_client.get_schema.assert_called_once_with(
+            "osdu:wks:TestSchema:1.0.0", status="PUBLISHED"
+        )
+
+
+@pytest.mark.asyncio
+async def test_schema_search_fetches_each_body_once_with_bounded_concurrency():
+    """Test that text search with content fetches bodies concurrently, once each."""
+    schema_ids = [f"osdu:wks:Entity{i}:1.0.0" for i in range(12)]
+    mock_list_response = {
+        "schemaInfos": [
+            {
+                "schemaIdentity": {"id": schema_id, "entityType": f"Entity{i}"},
+                "status": "PUBLISHED",
+                "scope": "SHARED",
+            }
+            for i, schema_id in enumerate(schema_ids)
+        ],
+        "totalCount": len(schema_ids),
+    }
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_schema(schema_id, status=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        description = "pressure gauge" if schema_id.endswith("3:1.0.0") else "other"
+        return {"title": schema_id, "description": description}
+
+    with (
+        patch("osdu_mcp_server.tools.schema.search.get_config") as mock_get_config,
+        patch("osdu_mcp_server.tools.schema.search.get_auth_handler"),
+        patch("osdu_mcp_server.tools.schema.search.SchemaClient") as mock_client_class,
+    ):
+        mock_get_config.return_value.get.side_effect = (
+            lambda section, key, default=None: (
+                4 if key == "fetch_concurrency" else default
+            )
+        )
+        mock_client = AsyncMock()
+        mock_client.search_schema_pages = _pages(mock_list_response)
+        mock_client.get_schema.side_effect = get_schema
+        mock_client_class.return_value = mock_client
+
+        result = await schema_search(text="pressure", include_content=True)
+
+    assert result["success"] is True
+    assert [s["schemaIdentity"]["id"] for s in result["schemas"]] == [
+        "osdu:wks:Entity3:1.0.0"
+    ]
+    assert result["schemas"][0]["schemaContent"]["description"] == "pressure gauge"
+    # One fetch per schema, reused for both matching and schemaContent
+    assert mock_client.get_schema.await_count == len(schema_ids)
+    assert 1 < max_in_flight <= 4
@@ -2,14 +2,20 @@
 
 import os
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aioresponses import aioresponses
 from azure.core.credentials import AccessToken
 from mcp.shared.exceptions import McpError
 
-from osdu_mcp_server.tools.search import search_query, search_by_id, search_by_kind
+from osdu_mcp_server.shared.clients import SearchClient
+from osdu_mcp_server.tools.search import (
+    search_query,
+    search_query_with_cursor,
+    search_by_id,
+    search_by_kind,
+)
 
 
 @pytest.mark.asyncio
@@ -190,3 +196,155 @@ async def test_search_by_kind_validates_required_parameters():
     # Test behavior when invalid input is provided - exception decorator converts to McpError
     with pytest.raises(McpError, match="Kind parameter is required"):
         await search_by_kind("")
+
+
+@pytest.mark.asyncio
+async def test_search_query_with_cursor_returns_continuation_token():
+    """Test that cursor search pages hand back the token for the next page."""
+    mock_token = AccessToken(
+        token="fake-token",
+        expires_on=int((datetime.now() + timedelta(hours=1)).timestamp()),
+    )
+
+    test_env = {
+        "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+        "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+        "AZURE_CLIENT_ID": "test-client-id",
+        "AZURE_TENANT_ID": "test-tenant-id",
+        "AZURE_CLIENT_SECRET": "test-secret",
+    }
+
+    with patch.dict(os.environ, test_env):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            mock_credential = MagicMock()
+            mock_credential.get_token.return_value = mock_token
+            mock_credential_class.return_value = mock_credential
+
+            with aioresponses() as mocked:
+                mocked.post(
+                    "https://test.osdu.com/api/search/v2/query_with_cursor",
+                    payload={
+                        "cursor": "next-page",
+                        "results": [{"id": "test:well:1", "kind": "k"}],
+                        "totalCount": 2,
+                    },
+                )
+
+                result = await search_query_with_cursor("*", limit=1)
+
+                assert result["success"] is True
+                assert result["cursor"] == "next-page"
+                assert [r["id"] for r in result["results"]] == ["test:well:1"]
+                assert result["totalCount"] == 2
+
+                request = list(mocked.requests.values())[0][0]
+                assert request.kwargs["json"] == {
+                    "kind": "*:*:*:*",
+                    "query": "*",
+                    "limit": 1,
+                }
+
+
+@pytest.mark.asyncio
+async def test_search_client_iterates_full_result_set_with_cursor():
+    """Test that the cursor iterator follows pages until results run out."""
+    config = MagicMock()
+    config.get_required.side_effect = lambda section, key: {
+        ("server", "url"): "https://test.osdu.com",
+        ("server", "data_partition"): "opendes",
+    }[(section, key)]
+    config.get.side_effect = lambda section, key, default=None: default
+    auth = AsyncMock()
+    auth.get_access_token.return_value = "test-token"
+
+    client = SearchClient(config, auth)
+    url = "https://test.osdu.com/api/search/v2/query_with_cursor"
+    try:
+        with aioresponses() as mocked:
+            mocked.post(url, payload={"cursor": "c1", "results": [{"id": "a"}]})
+            mocked.post(url, payload={"cursor": "c2", "results": [{"id": "b"}]})
+            mocked.post(url, payload={"cursor": "c3", "results": []})
+
+            ids = [hit["id"] async for hit in client.iter_query_with_cursor("*")]
+
+            cursors = [
+                call.kwargs["json"].get("cursor")
+                for call in list(mocked.requests.values())[0]
+            ]
+    finally:
+        await client.close()
+
+    assert ids == ["a", "b"]
+    assert cursors == [None, "c1", "c2"]
+
+
+@pytest.mark.asyncio
+async def test_search_by_kind_pushes_down_returned_fields():
+    """Test that returned_fields is sent as returnedFields and trims data."""
+    mock_response = {
+        "results": [
+            {
+                "id": "test:wellbore:1",
+                "kind": "test:osdu:wellbore:1.0.0",
+                "data": {
+                    "FacilityName": "WB-1",
+                    "SpatialLocation": {"Wgs84Coordinates": {"type": "Point"}},
+                    "VerticalMeasurements": [{"VerticalMeasurement": 1}] * 50,
+                },
+                "createTime": "2023-01-01T00:00:00Z",
+            }
+        ],
+        "totalCount": 1,
+    }
+
+    mock_token = AccessToken(
+        token="fake-token",
+        expires_on=int((datetime.now() + timedelta(hours=1)).timestamp()),
+    )
+
+    test_env = {
+        "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+        "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+        "AZURE_CLIENT_ID": "test-client-id",
+        "AZURE_TENANT_ID": "test-tenant-id",
+        "AZURE_CLIENT_SECRET": "test-secret",
+    }
+
+    with patch.dict(os.environ, test_env):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            mock_credential = MagicMock()
+            mock_credential.get_token.return_value = mock_token
+            mock_credential_class.return_value = mock_credential
+
+            with aioresponses() as mocked:
+                mocked.post(
+                    "https://test.osdu.com/api/search/v2/query",
+                    payload=mock_response,
+                )
+
+                result = await search_by_kind(
+                    "*:osdu:wellbore:*",
+                    returned_fields=[
+                        "FacilityName",
+                        "data.SpatialLocation.Wgs84Coordinates",
+                    ],
+                )
+
+                request = list(mocked.requests.values())[0][0]
+                assert request.kwargs["json"]["returnedFields"] == [
+                    "id",
+                    "kind",
+                    "createTime",
+                    "version",
+                    "data.FacilityName",
+                    "data.SpatialLocation.Wgs84Coordinates",
+                ]
+                assert result["results"][0]["id"] == "test:wellbore:1"
+                assert result["results"][0]["data"] == {
+                    "FacilityName": "WB-1",
+                    "SpatialLocation": {"Wgs84Coordinates": {"type": "Point"}},
+                }
@@ -0,0 +1,200 @@
+"""Tests for storage create/update records operations."""
+
+import os
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+from azure.core.credentials import AccessToken
+
+from osdu_mcp_server.shared.clients.storage_client import StorageClient
+from osdu_mcp_server.tools.storage.create_update_records import (
+    storage_create_update_records,
+)
+
+RECORDS_URL = "https://test.osdu.com/api/storage/v2/records"
+
+TEST_ENV = {
+    "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+    "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+    "OSDU_MCP_ENABLE_WRITE_MODE": "true",
+    "OSDU_MCP_STORAGE_VALIDATE_SCHEMAS": "false",
+    "AZURE_CLIENT_ID": "test-client-id",
+    "AZURE_TENANT_ID": "test-tenant-id",
+    "AZURE_CLIENT_SECRET": "test-secret",
+}
+
+
+def _record(i, **extra):
+    return {
+        "id": f"opendes:wellbore:{i}",
+        "kind": "osdu:wks:master-data--Wellbore:1.0.0",
+        "acl": {"viewers": ["v"], "owners": ["o"]},
+        "legal": {"legaltags": ["t"], "otherRelevantDataCountries": ["US"]},
+        "data": {"Name": f"Well {i}", **extra},
+    }
+
+
+def _mock_credential_class(mock_credential_class):
+    mock_credential = MagicMock()
+    mock_credential.get_token.return_value = AccessToken(
+        token="fake-token",
+        expires_on=int((datetime.now() + timedelta(hours=1)).timestamp()),
+    )
+    mock_credential_class.return_value = mock_credential
+
+
+def test_split_batches_bounds_count_and_bytes():
+    """Test that batches respect both the record and byte limits."""
+    records = [_record(i) for i in range(5)]
+    records[3]["data"]["Blob"] = "x" * 1000
+
+    assert StorageClient.split_batches(records, 2, 10**6) == [[0, 1], [2, 3], [4]]
+    # The oversized record travels alone
+    assert StorageClient.split_batches(records, 10, 700) == [
+        [0, 1, 2],
+        [3],
+        [4],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_merges_batches_and_retries_transient_failures():
+    """Test concurrent batches, per-record mapping and batch retries."""
+    records = [_record(i) for i in range(7)]
+    attempts = {}
+
+    def respond(url, **kwargs):
+        batch = kwargs["json"]
+        ids = [r["id"] for r in batch]
+        key = ids[0]
+        attempts[key] = attempts.get(key, 0) + 1
+        if key == "opendes:wellbore:2" and attempts[key] == 1:
+            return CallbackResult(status=503, body="Service Unavailable")
+        if key == "opendes:wellbore:4":
+            return CallbackResult(status=400, body="Invalid legal tag")
+        skipped = [i for i in ids if i == "opendes:wellbore:1"]
+        written = [i for i in ids if i not in skipped]
+        return CallbackResult(
+            payload={
+                "recordCount": len(written),
+                "recordIds": written,
+                "recordIdVersions": [f"{i}:1" for i in written],
+                "skippedRecordIds": skipped,
+            }
+        )
+
+    env = {**TEST_ENV, "OSDU_MCP_STORAGE_INGEST_BATCH_SIZE": "2"}
+    with patch.dict(os.environ, env):
+        with (
+            patch(
+                "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+            ) as mock_credential_class,
+            patch(
+                "osdu_mcp_server.shared.clients.storage_client.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep,
+        ):
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.put(
+                    RECORDS_URL + "?skipdupes=true", callback=respond, repeat=True
+                )
+
+                result = await storage_create_update_records(
+                    records, skip_dupes=True, bulk=True
+                )
+
+    assert result["success"] is False
+    assert result["batchCount"] == 4
+    assert result["failedBatchCount"] == 1
+    assert attempts["opendes:wellbore:2"] == 2
+    # Client errors are not retried
+    assert attempts["opendes:wellbore:4"] == 1
+    # The 503 is retried by the client with a jittered backoff of at most 1s
+    mock_sleep.assert_awaited_once()
+    assert 0 <= mock_sleep.await_args.args[0] <= 1
+
+    assert [r["index"] for r in result["records"]] == [0, 2, 3, 6]
+    assert result["records"][1] == {
+        "index": 2,
+        "id": "opendes:wellbore:2",
+        "kind": "osdu:wks:master-data--Wellbore:1.0.0",
+        "version": "opendes:wellbore:2:1",
+    }
+    assert result["skippedRecords"] == [{"index": 1, "id": "opendes:wellbore:1"}]
+    assert [r["index"] for r in result["failedRecords"]] == [4, 5]
+    assert "Invalid legal tag" in result["failedRecords"][0]["error"]
+    assert result["recordCount"] == 4
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_does_not_repeat_batches_that_may_have_been_applied():
+    """Test that a 502 on an ingest PUT is reported instead of retried."""
+    records = [_record(i) for i in range(4)]
+    attempts = {}
+
+    def respond(url, **kwargs):
+        ids = [r["id"] for r in kwargs["json"]]
+        attempts[ids[0]] = attempts.get(ids[0], 0) + 1
+        if ids[0] == "opendes:wellbore:0":
+            return CallbackResult(status=502, body="Bad Gateway")
+        return CallbackResult(payload={"recordIds": ids})
+
+    env = {**TEST_ENV, "OSDU_MCP_STORAGE_INGEST_BATCH_SIZE": "2"}
+    with patch.dict(os.environ, env):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.put(RECORDS_URL, callback=respond, repeat=True)
+
+                result = await storage_create_update_records(records, bulk=True)
+
+    assert attempts == {"opendes:wellbore:0": 1, "opendes:wellbore:2": 1}
+    assert result["failedBatchCount"] == 1
+    assert [r["index"] for r in result["failedRecords"]] == [0, 1]
+    assert "Bad Gateway" in result["failedRecords"][0]["error"]
+    assert [r["index"] for r in result["records"]] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_reports_invalid_records_and_writes_the_rest():
+    """Test that structural and schema failures map back to input positions."""
+    records = [_record(i) for i in range(4)]
+    del records[1]["acl"]
+    written = []
+
+    def respond(url, **kwargs):
+        ids = [r["id"] for r in kwargs["json"]]
+        written.extend(ids)
+        return CallbackResult(payload={"recordIds": ids})
+
+    # Schema validation sees only the structurally valid records (0, 2, 3)
+    schema_failures = AsyncMock(return_value={1: ["data.Name: 'x' is not valid"]})
+    env = {**TEST_ENV, "OSDU_MCP_STORAGE_VALIDATE_SCHEMAS": "true"}
+    with patch.dict(os.environ, env):
+        with (
+            patch(
+                "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+            ) as mock_credential_class,
+            patch.object(StorageClient, "schema_failures", schema_failures),
+        ):
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.put(RECORDS_URL, callback=respond, repeat=True)
+
+                result = await storage_create_update_records(records, bulk=True)
+
+    assert written == ["opendes:wellbore:0", "opendes:wellbore:3"]
+    assert result["success"] is False
+    assert [r["index"] for r in result["records"]] == [0, 3]
+    assert [r["index"] for r in result["failedRecords"]] == [1, 2]
+    assert "Missing required field 'acl'" in result["failedRecords"][0]["error"]
+    assert "Schema validation failed" in result["failedRecords"][1]["error"]
+    assert result["failedBatchCount"] == 0
@@ -0,0 +1,194 @@
+"""Tests for the Parquet/Arrow export tool."""
+
+import os
+import re
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+from azure.core.credentials import AccessToken
+from mcp.shared.exceptions import McpError
+
+from osdu_mcp_server.tools.storage.export_parquet import storage_export_parquet
+
+SERVER = "https://test.osdu.com"
+KIND = "osdu:wks:master-data--Wellbore:1.0.0"
+
+TEST_ENV = {
+    "OSDU_MCP_SERVER_URL": SERVER,
+    "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+    "AZURE_CLIENT_ID": "test-client-id",
+    "AZURE_TENANT_ID": "test-tenant-id",
+    "AZURE_CLIENT_SECRET": "test-secret",
+}
+
+
+@pytest.mark.asyncio
+async def test_export_parquet_types_columns_from_kind_schema(tmp_path):
+    """Test that a kind is exported with column types from its schema."""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    schema = {
+        "schemaInfo": {"status": "PUBLISHED"},
+        "properties": {
+            "data": {
+                "type": "object",
+                "properties": {
+                    "FacilityName": {"type": "string"},
+                    "TotalDepth": {"type": "number"},
+                },
+            }
+        },
+    }
+
+    def fetch(url, **kwargs):
+        return CallbackResult(
+            payload={
+                "records": [
+                    {"id": i, "kind": KIND, "data": {"TotalDepth": 100}}
+                    for i in kwargs["json"]["records"]
+                ]
+            }
+        )
+
+    path = tmp_path / "wells.parquet"
+    with patch.dict(
+        os.environ, {**TEST_ENV, "OSDU_MCP_STORAGE_EXPORT_DIR": str(tmp_path)}
+    ):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            mock_credential = MagicMock()
+            mock_credential.get_token.return_value = AccessToken(
+                token="fake-token",
+                expires_on=int((datetime.now() + timedelta(hours=1)).timestamp()),
+            )
+            mock_credential_class.return_value = mock_credential
+
+            with aioresponses() as mocked:
+                mocked.get(
+                    f"{SERVER}/api/schema-service/v1/schema/{KIND}", payload=schema
+                )
+                mocked.get(
+                    re.compile(
+                        rf"{re.escape(SERVER)}/api/storage/v2/query/records\?.*"
+                    ),
+                    payload={"results": ["opendes:wellbore:1", "opendes:wellbore:2"]},
+                )
+                mocked.post(
+                    f"{SERVER}/api/storage/v2/query/records",
+                    callback=fetch,
+                    repeat=True,
+                )
+
+                result = await storage_export_parquet(KIND, str(path))
+
+    assert result["success"] is True
+    assert result["format"] == "parquet"
+    assert result["recordCount"] == 2
+    assert result["columnTypesFrom"] == "schema"
+    assert result["complete"] is True
+
+    table = pq.read_table(path)
+    assert table.schema.field("data.TotalDepth").type == "double"
+    assert table.column("data.TotalDepth").to_pylist() == [100.0, 100.0]
+    assert table.column("data.FacilityName").to_pylist() == [None, None]
+
+
+def _mock_credential_class(mock_credential_class):
+    mock_credential = MagicMock()
+    mock_credential.get_token.return_value = AccessToken(
+        token="fake-token",
+        expires_on=int((datetime.now() + timedelta(hours=1)).timestamp()),
+    )
+    mock_credential_class.return_value = mock_credential
+
+
+@pytest.mark.asyncio
+async def test_export_parquet_resolves_abstract_schemas(tmp_path):
+    """Test that referenced wks schemas give columns, unavailable ones inferred."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    common = "osdu:wks:AbstractCommonResources:1.0.0"
+    facility = "osdu:wks:AbstractFacility:1.1.0"
+    schema = {
+        "schemaInfo": {"status": "PUBLISHED"},
+        "properties": {
+            "data": {
+                "allOf": [
+                    {"$ref": common},
+                    {"$ref": facility},
+                    {"type": "object", "properties": {"WellID": {"type": "string"}}},
+                ]
+            }
+        },
+    }
+    common_schema = {
+        "type": "object",
+        "properties": {"ResourceCurationStatus": {"type": "string"}},
+    }
+
+    def fetch(url, **kwargs):
+        return CallbackResult(
+            payload={
+                "records": [
+                    {
+                        "id": i,
+                        "kind": KIND,
+                        "data": {
+                            "WellID": "W",
+                            "ResourceCurationStatus": "CREATED",
+                            "FacilityName": "A-1",
+                        },
+                    }
+                    for i in kwargs["json"]["records"]
+                ]
+            }
+        )
+
+    schema_url = f"{SERVER}/api/schema-service/v1/schema"
+    env = {**TEST_ENV, "OSDU_MCP_STORAGE_EXPORT_DIR": str(tmp_path)}
+    with patch.dict(os.environ, env):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.get(f"{schema_url}/{KIND}", payload=schema)
+                mocked.get(f"{schema_url}/{common}", payload=common_schema)
+                mocked.get(f"{schema_url}/{facility}", status=404, repeat=True)
+                mocked.get(
+                    re.compile(
+                        rf"{re.escape(SERVER)}/api/storage/v2/query/records\?.*"
+                    ),
+                    payload={"results": ["opendes:wellbore:1"]},
+                )
+                mocked.post(
+                    f"{SERVER}/api/storage/v2/query/records",
+                    callback=fetch,
+                    repeat=True,
+                )
+
+                result = await storage_export_parquet(KIND, "wells.parquet")
+
+    assert result["columnTypesFrom"] == "schema"
+    assert result["unresolvedSchemaRefs"] == [facility]
+    assert result["droppedColumns"] == []
+    table = pq.read_table(tmp_path / "wells.parquet")
+    assert table.column("data.ResourceCurationStatus").to_pylist() == ["CREATED"]
+    assert table.column("data.FacilityName").to_pylist() == ["A-1"]
+
+
+@pytest.mark.asyncio
+async def test_export_parquet_rejects_paths_outside_the_export_dir(tmp_path):
+    """Test that Parquet exports share the export directory restriction."""
+    export_dir = tmp_path / "exports"
+    env = {**TEST_ENV, "OSDU_MCP_STORAGE_EXPORT_DIR": str(export_dir)}
+
+    with patch.dict(os.environ, env):
+        with pytest.raises(McpError) as exc_info:
+            await storage_export_parquet(KIND, str(tmp_path / "new" / "x.parquet"))
+
+    assert "not a file inside the export directory" in str(exc_info.value)
+    assert not (tmp_path / "new").exists()
@@ -0,0 +1,180 @@
+"""Tests for storage fetch records operations."""
+
+import os
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+from azure.core.credentials import AccessToken
+
+from osdu_mcp_server.shared.auth_handler import get_auth_handler
+from osdu_mcp_server.shared.clients import StorageClient
+from osdu_mcp_server.shared.config_manager import get_config
+from osdu_mcp_server.tools.storage.fetch_records import storage_fetch_records
+
+FETCH_URL = "https://test.osdu.com/api/storage/v2/query/records"
+
+TEST_ENV = {
+    "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+    "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+    "AZURE_CLIENT_ID": "test-client-id",
+    "AZURE_TENANT_ID": "test-tenant-id",
+    "AZURE_CLIENT_SECRET": "test-secret",
+}
+
+
+def _mock_credential_class(mock_credential_class):
+    mock_credential = MagicMock()
+    mock_credential.get_token.return_value = AccessToken(
+        token="fake-token",
+        expires_on=int((datetime.now() + timedelta(hours=1)).timestamp()),
+    )
+    mock_credential_class.return_value = mock_credential
+
+
+@pytest.mark.asyncio
+async def test_storage_fetch_records_auto_chunks_large_lists():
+    """Test that more than 100 IDs are fetched in batches and merged in order."""
+    record_ids = [f"opendes:wellbore:{i}" for i in range(250)]
+    batch_sizes = []
+
+    def respond(url, **kwargs):
+        batch = kwargs["json"]["records"]
+        batch_sizes.append(len(batch))
+        # Return records out of order and flag one ID as missing
+        found = [{"id": i, "kind": "test:test:test:1.0.0"} for i in reversed(batch)]
+        found = [r for r in found if r["id"] != "opendes:wellbore:150"]
+        invalid = ["opendes:wellbore:150"] if "opendes:wellbore:150" in batch else []
+        return CallbackResult(payload={"records": found, "invalidRecords": invalid})
+
+    with patch.dict(os.environ, TEST_ENV):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.post(FETCH_URL, callback=respond, repeat=True)
+
+                result = await storage_fetch_records(record_ids)
+
+    assert sorted(batch_sizes) == [50, 100, 100]
+    assert result["success"] is True
+    assert result["count"] == 249
+    assert [r["id"] for r in result["records"]] == [
+        i for i in record_ids if i != "opendes:wellbore:150"
+    ]
+    assert result["invalidRecords"] == ["opendes:wellbore:150"]
+    assert "retryRecords" not in result
+
+
+@pytest.mark.asyncio
+async def test_storage_fetch_records_retries_retry_records():
+    """Test that IDs reported as retryRecords are fetched again."""
+    record_ids = ["opendes:well:1", "opendes:well:2", "opendes:well:3"]
+    requests = []
+
+    def respond(url, **kwargs):
+        batch = kwargs["json"]["records"]
+        requests.append(batch)
+        if len(requests) == 1:
+            return CallbackResult(
+                payload={
+                    "records": [{"id": "opendes:well:1"}, {"id": "opendes:well:3"}],
+                    "retryRecords": ["opendes:well:2"],
+                }
+            )
+        return CallbackResult(payload={"records": [{"id": i} for i in batch]})
+
+    with patch.dict(os.environ, TEST_ENV):
+        with (
+            patch(
+                "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+            ) as mock_credential_class,
+            patch(
+                "osdu_mcp_server.shared.clients.storage_client.asyncio.sleep",
+                new_callable=AsyncMock,
+            ),
+        ):
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.post(FETCH_URL, callback=respond, repeat=True)
+
+                result = await storage_fetch_records(record_ids)
+
+    assert requests == [record_ids, ["opendes:well:2"]]
+    assert [r["id"] for r in result["records"]] == record_ids
+    assert "retryRecords" not in result
+
+
+@pytest.mark.asyncio
+async def test_storage_fetch_records_keeps_batches_when_one_fails():
+    """Test that a failed batch is reported without losing the others."""
+    record_ids = [f"opendes:wellbore:{i}" for i in range(250)]
+    failing = set(record_ids[100:200])
+
+    def respond(url, **kwargs):
+        batch = kwargs["json"]["records"]
+        if failing & set(batch):
+            return CallbackResult(status=403, body="Forbidden")
+        return CallbackResult(payload={"records": [{"id": i} for i in batch]})
+
+    with patch.dict(os.environ, TEST_ENV):
+        with (
+            patch(
+                "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+            ) as mock_credential_class,
+            patch(
+                "osdu_mcp_server.shared.clients.storage_client.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep,
+        ):
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.post(FETCH_URL, callback=respond, repeat=True)
+
+                result = await storage_fetch_records(record_ids)
+
+    assert [r["id"] for r in result["records"]] == [
+        i for i in record_ids if i not in failing
+    ]
+    assert result["retryRecords"] == record_ids[100:200]
+    # The failed batch is fetched again with the retry policy's backoff
+    assert mock_sleep.await_count == 2
+    assert all(0 <= call.args[0] <= 2 for call in mock_sleep.await_args_list)
+
+
+@pytest.mark.asyncio
+async def test_storage_client_streams_records_in_batches():
+    """Test that iter_records yields every batch and collects invalid IDs."""
+    record_ids = [f"opendes:wellbore:{i}" for i in range(150)]
+
+    def respond(url, **kwargs):
+        batch = kwargs["json"]["records"]
+        found = [{"id": i} for i in batch if i != "opendes:wellbore:120"]
+        invalid = ["opendes:wellbore:120"] if "opendes:wellbore:120" in batch else []
+        return CallbackResult(payload={"records": found, "invalidRecords": invalid})
+
+    with patch.dict(os.environ, TEST_ENV):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            _mock_credential_class(mock_credential_class)
+            client = StorageClient(get_config(), get_auth_handler())
+
+            try:
+                with aioresponses() as mocked:
+                    mocked.post(FETCH_URL, callback=respond, repeat=True)
+                    stats = {}
+                    ids = [
+                        r["id"]
+                        async for r in client.iter_records(record_ids, stats=stats)
+                    ]
+            finally:
+                await client.close()
+
+    assert ids == [i for i in record_ids if i != "opendes:wellbore:120"]
+    assert stats == {"invalidRecords": ["opendes:wellbore:120"], "retryRecords": []}
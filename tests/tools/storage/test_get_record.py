@@ -3,7 +3,7 @@
 import os
 import re
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aioresponses import aioresponses
@@ -198,3 +198,117 @@ async def test_storage_list_record_versions_success():
                 assert result["count"] == 3
                 assert len(result["versions"]) == 3
                 assert 1234567890 in result["versions"]
+
+
+@pytest.mark.asyncio
+async def test_storage_get_record_history_as_patches():
+    """Test that all versions are fetched in one call and diffed."""
+    from osdu_mcp_server.tools.storage.get_record_history import (
+        storage_get_record_history,
+    )
+
+    def version(v, **data):
+        return {"id": "test:record:123", "version": v, "data": data}
+
+    test_env = {
+        "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+        "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+        "AZURE_CLIENT_ID": "test-client-id",
+        "AZURE_TENANT_ID": "test-tenant-id",
+        "AZURE_CLIENT_SECRET": "test-secret",
+    }
+    base = "https://test.osdu.com/api/storage/v2/records"
+
+    with patch.dict(os.environ, test_env):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            mock_credential = MagicMock()
+            mock_credential.get_token.return_value = AccessToken(
+                token="fake-token",
+                expires_on=int((datetime.now() + timedelta(hours=1)).timestamp()),
+            )
+            mock_credential_class.return_value = mock_credential
+
+            with aioresponses() as mocked:
+                mocked.get(
+                    f"{base}/versions/test:record:123",
+                    payload={"recordId": "test:record:123", "versions": [3, 1, 2, 4]},
+                )
+                mocked.get(f"{base}/test:record:123/1", payload=version(1, a=1))
+                mocked.get(f"{base}/test:record:123/2", payload=version(2, a=2))
+                mocked.get(f"{base}/test:record:123/3", payload=version(3, a=2, b=1))
+                mocked.get(f"{base}/test:record:123/4", status=404)
+
+                result = await storage_get_record_history(
+                    "test:record:123", as_patches=True
+                )
+
+    assert result["success"] is True
+    assert result["versions"] == [1, 2, 3, 4]
+    assert result["count"] == 4
+    assert result["baseRecord"] == version(1, a=1)
+    assert "records" not in result
+    assert result["patches"] == [
+        {
+            "fromVersion": 1,
+            "version": 2,
+            "patch": [
+                {"op": "replace", "path": "/version", "value": 2},
+                {"op": "replace", "path": "/data/a", "value": 2},
+            ],
+        },
+        {
+            "fromVersion": 2,
+            "version": 3,
+            "patch": [
+                {"op": "replace", "path": "/version", "value": 3},
+                {"op": "add", "path": "/data/b", "value": 1},
+            ],
+        },
+    ]
+    assert [f["version"] for f in result["failedVersions"]] == [4]
+
+
+@pytest.mark.asyncio
+async def test_storage_get_record_history_patches_span_failed_versions():
+    """Test that patches name the versions they join, around a failed one."""
+    from osdu_mcp_server.tools.storage.get_record_history import (
+        storage_get_record_history,
+    )
+
+    test_env = {
+        "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+        "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+    }
+    base = "https://test.osdu.com/api/storage/v2/records"
+
+    with (
+        patch.dict(os.environ, test_env),
+        patch(
+            "osdu_mcp_server.tools.storage.get_record_history.get_auth_handler"
+        ) as mock_auth,
+    ):
+        mock_auth.return_value.get_access_token = AsyncMock(return_value="token")
+        with aioresponses() as mocked:
+            mocked.get(
+                f"{base}/versions/test:record:123",
+                payload={"recordId": "test:record:123", "versions": [1, 2, 3]},
+            )
+            # Version numbers are taken from the listing, not the bodies
+            mocked.get(f"{base}/test:record:123/1", payload={"data": {"a": 1}})
+            mocked.get(f"{base}/test:record:123/2", status=404)
+            mocked.get(f"{base}/test:record:123/3", payload={"data": {"a": 3}})
+
+            result = await storage_get_record_history(
+                "test:record:123", as_patches=True
+            )
+
+    assert result["patches"] == [
+        {
+            "fromVersion": 1,
+            "version": 3,
+            "patch": [{"op": "replace", "path": "/data/a", "value": 3}],
+        }
+    ]
+    assert [f["version"] for f in result["failedVersions"]] == [2]
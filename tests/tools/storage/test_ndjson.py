@@ -0,0 +1,271 @@
+"""Tests for NDJSON ingest and export tools."""
+
+import gzip
+import json
+import os
+import re
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+from azure.core.credentials import AccessToken
+from mcp.shared.exceptions import McpError
+
+from osdu_mcp_server.tools.storage.export_ndjson import storage_export_ndjson
+from osdu_mcp_server.tools.storage.ingest_ndjson import storage_ingest_ndjson
+
+STORAGE_URL = "https://test.osdu.com/api/storage/v2"
+KIND = "osdu:wks:master-data--Wellbore:1.0.0"
+
+TEST_ENV = {
+    "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+    "OSDU_MCP_SERVER_DATA_PARTITION": "opendes",
+    "OSDU_MCP_STORAGE_VALIDATE_SCHEMAS": "false",
+    "AZURE_CLIENT_ID": "test-client-id",
+    "AZURE_TENANT_ID": "test-tenant-id",
+    "AZURE_CLIENT_SECRET": "test-secret",
+}
+
+
+def _record(i):
+    return {
+        "id": f"opendes:wellbore:{i}",
+        "kind": KIND,
+        "acl": {"viewers": ["v"], "owners": ["o"]},
+        "legal": {"legaltags": ["t"], "otherRelevantDataCountries": ["US"]},
+        "data": {"Name": f"Well {i}"},
+    }
+
+
+def _mock_credential_class(mock_credential_class):
+    mock_credential = MagicMock()
+    mock_credential.get_token.return_value = AccessToken(
+        token="fake-token",
+        expires_on=int((datetime.now() + timedelta(hours=1)).timestamp()),
+    )
+    mock_credential_class.return_value = mock_credential
+
+
+@pytest.mark.asyncio
+async def test_ingest_ndjson_streams_gzip_file_in_chunks(tmp_path):
+    """Test that a gzip NDJSON file is ingested chunk by chunk."""
+    path = tmp_path / "wells.ndjson.gz"
+    with gzip.open(path, "wt") as f:
+        for i in range(5):
+            f.write(json.dumps(_record(i)) + "\n")
+        f.write("\n{not json\n")
+        f.write(json.dumps(_record(5)) + "\n")
+
+    batches = []
+
+    def respond(url, **kwargs):
+        ids = [r["id"] for r in kwargs["json"]]
+        batches.append(ids)
+        return CallbackResult(payload={"recordCount": len(ids), "recordIds": ids})
+
+    env = {
+        **TEST_ENV,
+        "OSDU_MCP_ENABLE_WRITE_MODE": "true",
+        "OSDU_MCP_STORAGE_INGEST_CHUNK_SIZE": "2",
+    }
+    with patch.dict(os.environ, env):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.put(f"{STORAGE_URL}/records", callback=respond, repeat=True)
+
+                result = await storage_ingest_ndjson(str(path))
+
+    # Chunks hold at most two lines, so the bad line gets its own chunk
+    assert [len(b) for b in batches] == [2, 2, 1, 1]
+    assert result["success"] is False
+    assert result["createdCount"] == 6
+    assert result["lineCount"] == 8
+    assert result["failedCount"] == 1
+    assert result["failures"][0]["line"] == 7
+    assert "Invalid JSON" in result["failures"][0]["error"]
+    assert "records" not in result
+
+
+@pytest.mark.asyncio
+async def test_ingest_ndjson_reports_invalid_records_and_continues(tmp_path):
+    """Test that a record failing validation does not stop the file."""
+    path = tmp_path / "wells.ndjson"
+    records = [_record(i) for i in range(5)]
+    del records[1]["legal"]
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+    written = []
+
+    def respond(url, **kwargs):
+        ids = [r["id"] for r in kwargs["json"]]
+        written.extend(ids)
+        return CallbackResult(payload={"recordCount": len(ids), "recordIds": ids})
+
+    env = {
+        **TEST_ENV,
+        "OSDU_MCP_ENABLE_WRITE_MODE": "true",
+        "OSDU_MCP_STORAGE_INGEST_CHUNK_SIZE": "2",
+    }
+    with patch.dict(os.environ, env):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.put(f"{STORAGE_URL}/records", callback=respond, repeat=True)
+
+                result = await storage_ingest_ndjson(str(path))
+
+    assert written == [r["id"] for i, r in enumerate(records) if i != 1]
+    assert result["createdCount"] == 4
+    assert result["failedCount"] == 1
+    assert result["failures"][0]["line"] == 2
+    assert result["failures"][0]["id"] == "opendes:wellbore:1"
+    assert "Missing required field 'legal'" in result["failures"][0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_ingest_ndjson_requires_write_mode(tmp_path):
+    """Test that nothing is read when writes are disabled."""
+    with patch.dict(os.environ, TEST_ENV):
+        os.environ.pop("OSDU_MCP_ENABLE_WRITE_MODE", None)
+        with pytest.raises(McpError) as exc_info:
+            await storage_ingest_ndjson(str(tmp_path / "missing.ndjson"))
+
+    assert "Write operations are disabled" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_writes_kind_page_by_page(tmp_path):
+    """Test that a kind is enumerated and its full records written to disk."""
+    pages = {
+        None: {"results": [f"opendes:wellbore:{i}" for i in range(3)], "cursor": "c2"},
+        "c2": {"results": ["opendes:wellbore:3"], "cursor": None},
+    }
+
+    def query(url, **kwargs):
+        return CallbackResult(payload=pages[url.query.get("cursor")])
+
+    def fetch(url, **kwargs):
+        ids = kwargs["json"]["records"]
+        return CallbackResult(payload={"records": [_record(int(i[-1])) for i in ids]})
+
+    path = tmp_path / "export" / "wells.ndjson"
+    with patch.dict(
+        os.environ, {**TEST_ENV, "OSDU_MCP_STORAGE_EXPORT_DIR": str(tmp_path)}
+    ):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.get(
+                    re.compile(rf"{re.escape(STORAGE_URL)}/query/records\?.*"),
+                    callback=query,
+                    repeat=True,
+                )
+                mocked.post(f"{STORAGE_URL}/query/records", callback=fetch, repeat=True)
+
+                result = await storage_export_ndjson(KIND, str(path), max_count=10)
+
+                # Existing files are not replaced unless asked
+                with pytest.raises(McpError):
+                    await storage_export_ndjson(KIND, str(path))
+
+    assert result["success"] is True
+    assert result["recordCount"] == 4
+    assert result["complete"] is True
+    assert result["source"] == "storage"
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [
+        f"opendes:wellbore:{i}" for i in range(4)
+    ]
+    assert not (tmp_path / "export" / "wells.ndjson.partial").exists()
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_keeps_pages_written_before_the_deadline(tmp_path):
+    """Test that an export stops cleanly when the tool's deadline passes."""
+    pages = {
+        None: {"results": [f"opendes:wellbore:{i}" for i in range(3)], "cursor": "c2"},
+        "c2": {"results": ["opendes:wellbore:3"], "cursor": None},
+    }
+
+    def query(url, **kwargs):
+        return CallbackResult(payload=pages[url.query.get("cursor")])
+
+    def slow_fetch(url, **kwargs):
+        time.sleep(0.2)
+        ids = kwargs["json"]["records"]
+        return CallbackResult(payload={"records": [_record(int(i[-1])) for i in ids]})
+
+    path = tmp_path / "wells.ndjson"
+    env = {
+        **TEST_ENV,
+        "OSDU_MCP_STORAGE_EXPORT_DIR": str(tmp_path),
+        "OSDU_MCP_TIMEOUTS_STORAGE_EXPORT_NDJSON": "0.1",
+    }
+    with patch.dict(os.environ, env):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential_class:
+            _mock_credential_class(mock_credential_class)
+
+            with aioresponses() as mocked:
+                mocked.get(
+                    re.compile(rf"{re.escape(STORAGE_URL)}/query/records\?.*"),
+                    callback=query,
+                    repeat=True,
+                )
+                mocked.post(
+                    f"{STORAGE_URL}/query/records", callback=slow_fetch, repeat=True
+                )
+
+                result = await storage_export_ndjson(KIND, str(path))
+
+    assert result["success"] is True
+    assert result["complete"] is False
+    assert result["recordCount"] == 3
+    assert len(path.read_text().splitlines()) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "file_path", ["../outside.ndjson", "/etc/osdu.ndjson", "link/wells.ndjson", "."]
+)
+async def test_export_ndjson_rejects_paths_outside_the_export_dir(tmp_path, file_path):
+    """Test that exports cannot write outside the export directory."""
+    export_dir = tmp_path / "exports"
+    export_dir.mkdir()
+    (export_dir / "link").symlink_to(tmp_path)
+    env = {**TEST_ENV, "OSDU_MCP_STORAGE_EXPORT_DIR": str(export_dir)}
+
+    with patch.dict(os.environ, env):
+        with pytest.raises(McpError) as exc_info:
+            await storage_export_ndjson(KIND, file_path)
+
+    assert "not a file inside the export directory" in str(exc_info.value)
+    assert list(tmp_path.iterdir()) == [export_dir]
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_overwrite_requires_write_mode(tmp_path):
+    """Test that replacing an existing export needs write mode."""
+    (tmp_path / "wells.ndjson").write_text("keep\n")
+    env = {**TEST_ENV, "OSDU_MCP_STORAGE_EXPORT_DIR": str(tmp_path)}
+
+    with patch.dict(os.environ, env):
+        os.environ.pop("OSDU_MCP_ENABLE_WRITE_MODE", None)
+        with pytest.raises(McpError) as exc_info:
+            await storage_export_ndjson(KIND, "wells.ndjson", overwrite=True)
+
+    assert "OSDU_MCP_ENABLE_WRITE_MODE" in str(exc_info.value)
+    assert (tmp_path / "wells.ndjson").read_text() == "keep\n"
@@ -1,6 +1,8 @@
 """Tests for storage query records by kind operation."""
 
+import asyncio
 import os
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +10,7 @@ import pytest
 from aioresponses import aioresponses
 from azure.core.credentials import AccessToken
 
+from osdu_mcp_server.shared.clients.storage_client import StorageClient
 from osdu_mcp_server.tools.storage.query_records_by_kind import (
     storage_query_records_by_kind,
 )
@@ -94,3 +97,156 @@ async def test_storage_query_records_by_kind_with_cursor():
                 assert result["success"] is True
                 assert result["cursor"] == "another-cursor"
                 assert result["count"] == 1
+
+
+KIND_URL = (
+    "https://test.osdu.com/api/storage/v2/query/records"
+    "?kind=test%3Atest%3Atest%3A1.0.0&limit=1000"
+)
+
+
+def _mock_credential(mock_credential):
+    mock_token = AccessToken(
+        "fake_token",
+        int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp()),
+    )
+    mock_instance = MagicMock()
+    mock_instance.get_token.return_value = mock_token
+    mock_credential.return_value = mock_instance
+
+
+@pytest.mark.asyncio
+async def test_storage_query_records_by_kind_enumerate_all():
+    """Test that enumerate_all follows cursors until they are exhausted."""
+    with patch.dict(
+        os.environ,
+        {
+            "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+            "OSDU_MCP_SERVER_DATA_PARTITION": "test-partition",
+            "AZURE_CLIENT_ID": "test-client-id",
+        },
+    ):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential:
+            _mock_credential(mock_credential)
+
+            with aioresponses() as mocked:
+                mocked.get(KIND_URL, payload={"cursor": "c1", "results": ["r1", "r2"]})
+                mocked.get(
+                    f"{KIND_URL}&cursor=c1", payload={"cursor": "c2", "results": ["r3"]}
+                )
+                mocked.get(f"{KIND_URL}&cursor=c2", payload={"results": ["r4"]})
+
+                result = await storage_query_records_by_kind(
+                    kind="test:test:test:1.0.0", enumerate_all=True
+                )
+
+                assert result["results"] == ["r1", "r2", "r3", "r4"]
+                assert result["count"] == 4
+                assert result["pages"] == 3
+                assert result["complete"] is True
+                assert result["cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_storage_query_records_by_kind_enumerate_max_count():
+    """Test that max_count stops enumeration with a cursor that loses no IDs."""
+    with patch.dict(
+        os.environ,
+        {
+            "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+            "OSDU_MCP_SERVER_DATA_PARTITION": "test-partition",
+            "AZURE_CLIENT_ID": "test-client-id",
+        },
+    ):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential:
+            _mock_credential(mock_credential)
+
+            with aioresponses() as mocked:
+                mocked.get(KIND_URL, payload={"cursor": "c1", "results": ["r1", "r2"]})
+                mocked.get(
+                    f"{KIND_URL}&cursor=c1",
+                    payload={"cursor": "c2", "results": ["r3", "r4"]},
+                )
+                mocked.get(f"{KIND_URL}&cursor=c2", payload={"results": ["r5"]})
+
+                result = await storage_query_records_by_kind(
+                    kind="test:test:test:1.0.0", enumerate_all=True, max_count=3
+                )
+
+                assert result["results"] == ["r1", "r2", "r3"]
+                assert result["complete"] is False
+                assert result["truncated"] is True
+                # Resuming re-reads the partially returned page
+                assert result["cursor"] == "c1"
+
+
+@pytest.mark.asyncio
+async def test_storage_query_records_by_kind_enumerate_bounds_each_page_by_budget():
+    """Test that a page slower than the time budget ends enumeration early."""
+
+    async def query(self, kind, limit, cursor=None):
+        if cursor is None:
+            return {"cursor": "c1", "results": ["r1", "r2"]}
+        await asyncio.sleep(10)
+        return {"results": ["r3"]}
+
+    with patch.dict(
+        os.environ,
+        {
+            "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+            "OSDU_MCP_SERVER_DATA_PARTITION": "test-partition",
+            "AZURE_CLIENT_ID": "test-client-id",
+        },
+    ):
+        with (
+            patch("osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"),
+            patch.object(StorageClient, "query_records_by_kind", query),
+        ):
+            started = time.monotonic()
+            result = await storage_query_records_by_kind(
+                kind="test:test:test:1.0.0",
+                enumerate_all=True,
+                time_budget_seconds=0.2,
+            )
+
+    assert time.monotonic() - started < 5
+    assert result["results"] == ["r1", "r2"]
+    assert result["complete"] is False
+    assert result["truncated"] is False
+    # Resuming starts at the page that did not arrive
+    assert result["cursor"] == "c1"
+
+
+@pytest.mark.asyncio
+async def test_storage_query_records_by_kind_enumerate_has_default_cap():
+    """Test that enumeration without max_count stops at the configured cap."""
+    with patch.dict(
+        os.environ,
+        {
+            "OSDU_MCP_SERVER_URL": "https://test.osdu.com",
+            "OSDU_MCP_SERVER_DATA_PARTITION": "test-partition",
+            "AZURE_CLIENT_ID": "test-client-id",
+            "OSDU_MCP_STORAGE_ENUMERATE_MAX_COUNT": "2",
+        },
+    ):
+        with patch(
+            "osdu_mcp_server.shared.auth_handler.DefaultAzureCredential"
+        ) as mock_credential:
+            _mock_credential(mock_credential)
+
+            with aioresponses() as mocked:
+                mocked.get(KIND_URL, payload={"cursor": "c1", "results": ["r1", "r2"]})
+                mocked.get(f"{KIND_URL}&cursor=c1", payload={"results": ["r3"]})
+
+                result = await storage_query_records_by_kind(
+                    kind="test:test:test:1.0.0", enumerate_all=True
+                )
+
+    assert result["results"] == ["r1", "r2"]
+    assert result["complete"] is False
+    assert result["truncated"] is True
+    assert result["cursor"] == "c1"
@@ -19,9 +19,9 @@ async def test_storage_create_blocked_by_default():
         # Remove the env var if it exists
         os.environ.pop("OSDU_MCP_ENABLE_WRITE_MODE", None)
 
-        with patch("osdu_mcp_server.tools.storage.create_update_records.ConfigManager"):
+        with patch("osdu_mcp_server.tools.storage.create_update_records.get_config"):
             with patch(
-                "osdu_mcp_server.tools.storage.create_update_records.AuthHandler"
+                "osdu_mcp_server.tools.storage.create_update_records.get_auth_handler"
             ):
                 test_record = {
                     "kind": "test:test:test:1.0.0",
@@ -48,8 +48,8 @@ async def test_storage_delete_blocked_by_default():
         # Remove the env var if it exists
         os.environ.pop("OSDU_MCP_ENABLE_DELETE_MODE", None)
 
-        with patch("osdu_mcp_server.tools.storage.delete_record.ConfigManager"):
-            with patch("osdu_mcp_server.tools.storage.delete_record.AuthHandler"):
+        with patch("osdu_mcp_server.tools.storage.delete_record.get_config"):
+            with patch("osdu_mcp_server.tools.storage.delete_record.get_auth_handler"):
                 try:
                     await storage_delete_record("test:record:123")
                     assert False, "Expected exception was not raised"
@@ -65,8 +65,8 @@ async def test_storage_purge_blocked_by_default():
         # Remove the env var if it exists
         os.environ.pop("OSDU_MCP_ENABLE_DELETE_MODE", None)
 
-        with patch("osdu_mcp_server.tools.storage.purge_record.ConfigManager"):
-            with patch("osdu_mcp_server.tools.storage.purge_record.AuthHandler"):
+        with patch("osdu_mcp_server.tools.storage.purge_record.get_config"):
+            with patch("osdu_mcp_server.tools.storage.purge_record.get_auth_handler"):
                 try:
                     await storage_purge_record("test:record:123", confirm=True)
                     assert False, "Expected exception was not raised"
@@ -79,8 +79,8 @@ async def test_storage_purge_blocked_by_default():
 async def test_storage_purge_requires_confirmation():
     """Test storage purge requires explicit confirmation."""
     with patch.dict(os.environ, {"OSDU_MCP_ENABLE_DELETE_MODE": "true"}):
-        with patch("osdu_mcp_server.tools.storage.purge_record.ConfigManager"):
-            with patch("osdu_mcp_server.tools.storage.purge_record.AuthHandler"):
+        with patch("osdu_mcp_server.tools.storage.purge_record.get_config"):
+            with patch("osdu_mcp_server.tools.storage.purge_record.get_auth_handler"):
                 try:
                     # Without confirmation
                     await storage_purge_record("test:record:123", confirm=False)
@@ -104,9 +104,9 @@ async def test_dual_protection_independence():
     with patch.dict(os.environ, {"OSDU_MCP_ENABLE_WRITE_MODE": "true"}, clear=False):
         os.environ.pop("OSDU_MCP_ENABLE_DELETE_MODE", None)
 
-        with patch("osdu_mcp_server.tools.storage.create_update_records.ConfigManager"):
+        with patch("osdu_mcp_server.tools.storage.create_update_records.get_config"):
             with patch(
-                "osdu_mcp_server.tools.storage.create_update_records.AuthHandler"
+                "osdu_mcp_server.tools.storage.create_update_records.get_auth_handler"
             ):
                 with patch(
                     "osdu_mcp_server.tools.storage.create_update_records.StorageClient"
@@ -128,8 +128,8 @@ async def test_dual_protection_independence():
                     assert result["write_enabled"] is True
 
         # But delete should still fail
-        with patch("osdu_mcp_server.tools.storage.delete_record.ConfigManager"):
-            with patch("osdu_mcp_server.tools.storage.delete_record.AuthHandler"):
+        with patch("osdu_mcp_server.tools.storage.delete_record.get_config"):
+            with patch("osdu_mcp_server.tools.storage.delete_record.get_auth_handler"):
                 try:
                     await storage_delete_record("test:record:123")
                     assert False, "Expected exception was not raised"
@@ -141,9 +141,9 @@ async def test_dual_protection_independence():
 async def test_record_validation():
     """Test record validation for required fields."""
     with patch.dict(os.environ, {"OSDU_MCP_ENABLE_WRITE_MODE": "true"}):
-        with patch("osdu_mcp_server.tools.storage.create_update_records.ConfigManager"):
+        with patch("osdu_mcp_server.tools.storage.create_update_records.get_config"):
             with patch(
-                "osdu_mcp_server.tools.storage.create_update_records.AuthHandler"
+                "osdu_mcp_server.tools.storage.create_update_records.get_auth_handler"
             ):
 
                 # Test missing required field